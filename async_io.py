@@ -0,0 +1,288 @@
+"""asyncio runtime for concurrent 74HC165, 74HC595 and MCP23017 I/O.
+
+Description
+-----------
+
+A CircuitPython module that provides async variants of the core I/O
+operations used by the programs in this repository, and tasks built on them
+that sample a 74HC165 input chain, animate a 74HC595 output chain and service
+an MCP23017 port expander concurrently in a single asyncio event loop.
+
+Every bus operation holds an asyncio lock shared by all tasks using the same
+bus, so tasks sharing an SPI or I2C bus serialize their transfers cleanly
+while tasks on different buses, and all waiting, overlap.
+
+Each task records IORuntime statistics: the number of runs and I/O
+operations, and the worst interval between runs, which is the worst-case
+latency for the task to notice an input change.
+
+Libraries/Modules
+-----------------
+
+- asyncio CircuitPython Library
+    - https://docs.circuitpython.org/projects/asyncio/
+    - Provides cooperative multitasking.
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic and monotonic_ns functions.
+
+Notes
+-----
+
+- The underlying bus transfers are still blocking; the event loop switches
+  tasks between transfers, never during them.
+- When combining devices on one board, each device needs its own latch or
+  interrupt pin; the individual programs all use D5.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import asyncio
+import time
+
+
+# Global Variables
+_bus_locks = {}
+"""The asyncio locks of the buses, by bus object id."""
+
+
+# Functions
+def bus_lock(bus):
+    """Returns the asyncio lock shared by all tasks using a bus.
+
+    :param: bus The SPI or I2C bus object, e.g. board.SPI().
+
+    :return: The asyncio.Lock instance of the bus.
+    """
+
+    lock = _bus_locks.get(id(bus))
+    if lock is None:
+        lock = _bus_locks[id(bus)] = asyncio.Lock()
+    return lock
+
+
+async def read_inputs(isr, lock):
+    """Reads all inputs of a 74HC165 chain.
+
+    :param: isr  The 74HC165 shift register instance.
+    :param: lock The lock of the SPI bus the chain is connected to.
+
+    :return: The inputs buffer (the driver's gpio value).
+    """
+
+    async with lock:
+        return isr.gpio
+
+
+async def write_outputs(osr, lock, outputs):
+    """Writes all outputs of a 74HC595 chain.
+
+    :param: osr     The 74HC595 shift register instance.
+    :param: lock    The lock of the SPI bus the chain is connected to.
+    :param: outputs The new output values, as wide as the chain.
+    """
+
+    async with lock:
+        osr.gpio = outputs
+
+
+async def read_port(mcp, lock, port):
+    """Reads the GPIO register of an MCP23017 port.
+
+    :param: mcp  The MCP23017 instance.
+    :param: lock The lock of the I2C bus the MCP23017 is connected to.
+    :param: port The port (0 = A, 1 = B).
+
+    :return: The 8-bit port value.
+    """
+
+    async with lock:
+        return mcp.gpiob if port else mcp.gpioa
+
+
+async def write_port(mcp, lock, port, value):
+    """Writes the GPIO (OLAT) register of an MCP23017 port.
+
+    :param: mcp   The MCP23017 instance.
+    :param: lock  The lock of the I2C bus the MCP23017 is connected to.
+    :param: port  The port (0 = A, 1 = B).
+    :param: value The 8-bit port value.
+    """
+
+    async with lock:
+        if port:
+            mcp.gpiob = value
+        else:
+            mcp.gpioa = value
+
+
+async def wait_for_interrupt(int_pin, poll_interval=0.001):
+    """Waits for an active low MCP23017 interrupt pin to be asserted, letting
+    other tasks run between polls.
+
+    :param: int_pin       The DigitalInOut connected to INTA or INTB.
+    :param: poll_interval The time between polls, in seconds.
+    """
+
+    while int_pin.value:
+        await asyncio.sleep(poll_interval)
+
+
+# Classes
+class TaskStatistics:
+    """Run statistics of an I/O task.
+
+    :param: name The name used in reports.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.runs = 0           # number of runs
+        self.operations = 0     # number of bus operations
+        self.max_interval = 0   # worst time between runs, in ns
+        self._last_run = None
+
+    def record(self, operations):
+        """Records a run of the task.
+
+        :param: operations The number of bus operations of the run.
+        """
+
+        now = time.monotonic_ns()
+        if self._last_run is not None and now - self._last_run > self.max_interval:
+            self.max_interval = now - self._last_run
+        self._last_run = now
+        self.runs += 1
+        self.operations += operations
+
+
+class IORuntime:
+    """Runs input, output and port expander tasks concurrently.
+
+    Example::
+
+        runtime = IORuntime()
+        runtime.add_input_sampler(isr, board.SPI(), 0.005, print_inputs)
+        runtime.add_output_sequencer(sequencer, board.SPI())
+        runtime.add_port_copier(mcp23017, board.I2C(), mcp23017_intb)
+        runtime.run()
+    """
+
+    def __init__(self):
+        self.statistics = []
+        self._coroutines = []
+
+    def add_input_sampler(self, isr, bus, period, callback=None):
+        """Adds a task that reads a 74HC165 chain periodically.
+
+        :param: isr      The 74HC165 shift register instance.
+        :param: bus      The SPI bus the chain is connected to.
+        :param: period   The time between samples, in seconds.
+        :param: callback A function called with the inputs after each sample,
+                         or None.
+        """
+
+        statistics = TaskStatistics("input sampler")
+        self.statistics.append(statistics)
+        self._coroutines.append(self._sample_inputs(isr, bus_lock(bus), period, callback, statistics))
+
+    def add_output_sequencer(self, sequencer, bus):
+        """Adds a task that plays an output_sequencer.FrameSequencer.
+
+        :param: sequencer The frame sequencer of a 74HC595 chain.
+        :param: bus       The SPI bus the chain is connected to.
+        """
+
+        statistics = TaskStatistics("output sequencer")
+        self.statistics.append(statistics)
+        self._coroutines.append(self._play_frames(sequencer, bus_lock(bus), statistics))
+
+    def add_port_copier(self, mcp, bus, int_pin, poll_interval=0.001):
+        """Adds a task that copies MCP23017 port B (switches) to port A (LEDs)
+        whenever INTB is asserted, as done in port_expander.py.
+
+        :param: mcp           The MCP23017 instance, with interrupts configured.
+        :param: bus           The I2C bus the MCP23017 is connected to.
+        :param: int_pin       The DigitalInOut connected to INTB.
+        :param: poll_interval The time between interrupt pin polls, in seconds.
+        """
+
+        statistics = TaskStatistics("port copier")
+        self.statistics.append(statistics)
+        self._coroutines.append(self._copy_port(mcp, bus_lock(bus), int_pin, poll_interval, statistics))
+
+    def add_task(self, coroutine):
+        """Adds an application coroutine to run alongside the I/O tasks.
+
+        :param: coroutine The coroutine object, e.g. blink_status_led().
+        """
+
+        self._coroutines.append(coroutine)
+
+    async def _sample_inputs(self, isr, lock, period, callback, statistics):
+        next_time = time.monotonic()
+        while True:
+            inputs = await read_inputs(isr, lock)
+            statistics.record(1)
+            if callback is not None:
+                callback(inputs)
+            next_time += period
+            await asyncio.sleep(max(0, next_time - time.monotonic()))
+
+    async def _play_frames(self, sequencer, lock, statistics):
+        if not sequencer.running:
+            async with lock:
+                sequencer.start()
+        while sequencer.running:
+            async with lock:
+                written = sequencer.tick()
+            if written:
+                statistics.record(1)
+            await asyncio.sleep(max(0, sequencer.next_time - time.monotonic()))
+
+    async def _copy_port(self, mcp, lock, int_pin, poll_interval, statistics):
+        while True:
+            await wait_for_interrupt(int_pin, poll_interval)
+            value = await read_port(mcp, lock, 1)  # reading GPIOB also clears the port B interrupt
+            await write_port(mcp, lock, 0, value)
+            statistics.record(2)
+
+    async def _main(self, duration):
+        tasks = [asyncio.create_task(coroutine) for coroutine in self._coroutines]
+        self._coroutines = []
+        if duration is None:
+            await asyncio.gather(*tasks)
+        else:
+            await asyncio.sleep(duration)
+            for task in tasks:
+                task.cancel()
+
+    def run(self, duration=None):
+        """Runs all added tasks in a new event loop.
+
+        :param: duration The number of seconds to run for, or None to run
+                         forever.
+        """
+
+        asyncio.run(self._main(duration))
+
+    def print_report(self, seconds):
+        """Prints the statistics of all tasks.
+
+        :param: seconds The time the tasks ran for, used for rates.
+        """
+
+        for statistics in self.statistics:
+            print(f"{statistics.name}: {statistics.runs} runs, {statistics.operations / seconds:.0f} operations/s, "
+                  f"{statistics.max_interval / 1e6:.1f} ms maximum interval")
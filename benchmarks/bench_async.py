@@ -0,0 +1,196 @@
+"""Benchmarks the asyncio runtime against running the examples one after another.
+
+Description
+-----------
+
+Samples a simulated 74HC165 chain, plays the cycle_leds() pattern on a
+simulated 74HC595 chain and copies the switches of a simulated MCP23017 to its
+LEDs on INTB, once by running each example's loop for a third of the time one
+after another and once by running all three concurrently with the async_io
+module's IORuntime.  A switch on the MCP23017 toggles periodically throughout.
+
+Reports the input samples, frames and port copies completed, the total bus
+transactions per second, and the worst time between 74HC165 samples, which is
+the worst-case latency for noticing an input change.
+
+Usage: python benchmarks/bench_async.py [--seconds S] [--rate HZ]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Runs in real time.
+- The 74HC165 latch, 74HC595 latch and MCP23017 INTB are wired to D5, D6 and
+  D9 so that all three devices can share the board.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import asyncio
+import time
+from bench_common import board, sim_hardware, print_table
+import digitalio
+from adafruit_mcp230xx.mcp23017 import MCP23017
+import async_io
+import output_sequencer
+import shift_registers
+
+
+# Global Constants
+REGISTERS = 4
+"""The number of shift registers in each simulated chain."""
+
+FRAME_TIME = 0.01
+"""The duration of each output frame, in seconds."""
+
+TOGGLE_INTERVAL = 0.005
+"""The time between MCP23017 switch toggles, in seconds."""
+
+
+# Classes
+class Rig:
+    """The simulated devices and the driver instances connected to them."""
+
+    def __init__(self):
+        sim_hardware.reset()
+        sim_hardware.Chain74HC165(board.SPI(), board.D5, REGISTERS)
+        sim_hardware.Chain74HC595(board.SPI(), board.D6, REGISTERS)
+        self.expander = sim_hardware.MCP23017Model(board.I2C(), 0x20, intb=board.D9)
+        self.isr = shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), REGISTERS)
+        self.osr = shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D6), REGISTERS)
+        self.mcp = MCP23017(board.I2C(), address=0x20)
+        self.mcp.iodir = 0xFF00
+        self.mcp.gppu = 0xFF00
+        self.mcp.ipol = 0xFF00
+        self.mcp.interrupt_enable = 0xFF00
+        self.mcp.interrupt_configuration = 0x0000
+        self.mcp.clear_ints()
+        self.intb = digitalio.DigitalInOut(board.D9)
+        self.intb.switch_to_input(pull=digitalio.Pull.UP)
+        self.sequencer = output_sequencer.FrameSequencer(self.osr, output_sequencer.cycle_frames(REGISTERS),
+                                                         FRAME_TIME, output_sequencer.PING_PONG)
+        self.sample_times = []
+        self.copies = 0
+        self._next_toggle = 0.0
+        self._bus_stats = [bus.stats.snapshot() for bus in (board.SPI(), board.I2C())]
+
+    def sample(self):
+        """Reads the 74HC165 chain and records the time of the sample."""
+
+        self.isr.gpio
+        self.sample_times.append(time.monotonic_ns())
+
+    def toggle_switch_if_due(self, now):
+        """Toggles switch GPB0 when the toggle interval has elapsed."""
+
+        if now >= self._next_toggle:
+            self.expander.set_input(8, not self.expander.levels & (1 << 8))
+            self._next_toggle = now + TOGGLE_INTERVAL
+
+    def result(self, name, seconds):
+        """Returns a table row of the results."""
+
+        after = [bus.stats.snapshot() for bus in (board.SPI(), board.I2C())]
+        transactions = sum(a[0] - b[0] for a, b in zip(after, self._bus_stats))
+        gaps = [b - a for a, b in zip(self.sample_times, self.sample_times[1:])]
+        return [
+            name,
+            len(self.sample_times),
+            self.sequencer.frames_written,
+            self.copies,
+            f"{transactions / seconds:.0f}",
+            f"{max(gaps) / 1e6:.1f}",
+        ]
+
+
+# Functions
+def run_sequential(seconds, rate):
+    """Runs the three example loops one after another, a third of the time each."""
+
+    rig = Rig()
+    phase = seconds / 3
+
+    # input_shift_register.py: sample at a fixed rate
+    end = time.monotonic() + phase
+    previous_time = 0.0
+    while time.monotonic() < end:
+        now = time.monotonic()
+        rig.toggle_switch_if_due(now)
+        if now - previous_time >= 1.0 / rate:
+            rig.sample()
+            previous_time = now
+
+    # output_shift_register.py: play the cycle pattern
+    end = time.monotonic() + phase
+    rig.sequencer.start()
+    while time.monotonic() < end:
+        now = time.monotonic()
+        rig.toggle_switch_if_due(now)
+        rig.sequencer.tick(now)
+    rig.sequencer.stop()
+
+    # port_expander.py: copy port B to port A on INTB
+    end = time.monotonic() + phase
+    while time.monotonic() < end:
+        now = time.monotonic()
+        rig.toggle_switch_if_due(now)
+        if not rig.intb.value:
+            rig.mcp.gpioa = rig.mcp.gpiob
+            rig.mcp.clear_ints()
+            rig.copies += 1
+
+    # Include the time back to the first example in the worst sampling gap
+    rig.sample()
+    return rig.result("one after another", seconds)
+
+
+def run_concurrent(seconds, rate):
+    """Runs the three examples as concurrent tasks of an IORuntime."""
+
+    rig = Rig()
+    runtime = async_io.IORuntime()
+    runtime.add_input_sampler(rig.isr, board.SPI(), 1.0 / rate, lambda inputs: rig.sample_times.append(
+        time.monotonic_ns()))
+    runtime.add_output_sequencer(rig.sequencer, board.SPI())
+    runtime.add_port_copier(rig.mcp, board.I2C(), rig.intb, 0.0005)
+
+    async def toggle_switch():
+        while True:
+            rig.toggle_switch_if_due(time.monotonic())
+            await asyncio.sleep(TOGGLE_INTERVAL)
+
+    runtime.add_task(toggle_switch())
+    runtime.run(seconds)
+    rig.copies = runtime.statistics[2].runs
+    return rig.result("IORuntime", seconds)
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0, help="run time per approach")
+    parser.add_argument("--rate", type=float, default=200, help="74HC165 sample rate in Hz")
+    args = parser.parse_args()
+
+    rows = [run_sequential(args.seconds, args.rate), run_concurrent(args.seconds, args.rate)]
+    print_table(f"74HC165 sampling at {args.rate:.0f} Hz, 74HC595 cycle pattern and MCP23017 port copy "
+                f"for {args.seconds:.1f} s",
+                ("approach", "input samples", "frames", "port copies", "transactions/s", "worst input gap (ms)"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmarks the BCM brightness engine on simulated hardware.
+
+Description
+-----------
+
+Runs the output_brightness module's BrightnessEngine on simulated 74HC595
+chains of increasing length and reports the time needed to write one bit
+plane and the resulting refresh rates.  The bus limited refresh rate uses the
+estimated SPI transfer time at the driver's 1 MHz clock and shows how many
+chained '595s can be dimmed flicker free; the measured refresh rate is what
+the engine achieved on the host with the base time set to the longer of the
+measured plane write time and the bus time.
+
+Usage: python benchmarks/bench_brightness.py [--bits N] [--seconds S]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Python overhead on a board is much higher than on a host computer, so the
+  measured refresh rates are upper bounds for real hardware.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import time
+from bench_common import board, sim_hardware, print_table
+import digitalio
+import output_brightness
+import shift_registers
+
+
+# Global Constants
+FLICKER_FREE_RATE = 100
+"""The refresh rate in Hz considered to be flicker free."""
+
+
+# Functions
+def bench_brightness(registers, bits, seconds):
+    """Measures the engine on a chain of the given length and returns a table row."""
+
+    sim_hardware.reset()
+    sim_hardware.Chain74HC595(board.SPI(), board.D5, registers)
+    osr = shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), registers)
+    engine = output_brightness.BrightnessEngine(osr, bits, base_time=0)
+    engine.set_levels(pin % (1 << bits) for pin in range(8 * registers))
+
+    # Measure the bit plane write time with no hold time
+    stats = board.SPI().stats
+    stats.reset()
+    writes = 200
+    start = time.perf_counter()
+    for _ in range(writes):
+        engine.tick()
+    write_time = (time.perf_counter() - start) / writes
+    bus_time = stats.bus_time / writes
+
+    # Run with the shortest usable base time
+    engine.base_time = max(write_time, bus_time)
+    engine.reset_statistics()
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        engine.tick()
+
+    slots = (1 << bits) - 1
+    bus_rate = 1 / (slots * bus_time)
+    return [
+        registers,
+        f"{bus_time * 1e6:.0f}",
+        f"{bus_rate:.0f}",
+        "yes" if bus_rate >= FLICKER_FREE_RATE else "no",
+        f"{write_time * 1e6:.0f}",
+        f"{engine.refresh_rate:.0f}",
+    ]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bits", type=int, default=4, help="bits per brightness level")
+    parser.add_argument("--seconds", type=float, default=0.2, help="run time per chain length")
+    args = parser.parse_args()
+
+    rows = [bench_brightness(registers, args.bits, args.seconds) for registers in (1, 2, 4, 8, 16, 32, 64)]
+    print_table(f"BrightnessEngine, {args.bits}-bit levels",
+                ("registers", "bus time/plane (us)", "bus limited rate (Hz)", "flicker free",
+                 "host time/plane (us)", "measured rate (Hz)"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
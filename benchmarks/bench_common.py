@@ -0,0 +1,178 @@
+"""Common helpers for the host-side benchmarks.
+
+Description
+-----------
+
+Puts the repository's programs and the host-side simulator (see the
+simulator directory) on the import path and provides helpers for loading the
+programs against freshly wired simulated hardware, measuring the bus traffic
+and wall time of their functions, and printing result tables.
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Importing this module must happen before importing board, digitalio, busio
+  or any of the programs so that the simulator modules take precedence over
+  any installed Blinka modules of the same names.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+
+
+# Global Constants
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""The top level directory of the repository."""
+
+SIMULATOR_DIR = os.path.join(REPOSITORY_DIR, "simulator")
+"""The directory containing the host-side simulator modules."""
+
+for path in (REPOSITORY_DIR, SIMULATOR_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+# Imports (simulator)
+import board  # noqa: E402
+import digitalio  # noqa: E402
+import sim_hardware  # noqa: E402
+
+
+# Functions
+def load_program(name):
+    """Imports (or re-imports) one of the repository's programs so that its
+    module level instances are created on the currently wired hardware.
+
+    :param: name The module name of the program (e.g. "input_shift_register").
+
+    :return: The freshly imported module.
+    """
+
+    sys.modules.pop(name, None)
+    return importlib.import_module(name)
+
+
+@contextlib.contextmanager
+def wrapped_hardware(wrap_spi, wrap_i2c, wrap_pin):
+    """Returns a context manager within which board.SPI(), board.I2C() and
+    digitalio.DigitalInOut() return wrapped buses and pins, e.g. by a
+    bus_hooks.BusHooks instance, so that the programs loaded within it create
+    their instances on the wrapped objects without any changes to the
+    programs.  Wire the device models before entering it.
+
+    :param: wrap_spi A function returning the wrapped bus for an SPI bus.
+    :param: wrap_i2c A function returning the wrapped bus for an I2C bus.
+    :param: wrap_pin A function returning the wrapped pin for a DigitalInOut
+                     and the name of its board pin.
+    """
+
+    spi_function, i2c_function, pin_class = board.SPI, board.I2C, digitalio.DigitalInOut
+    spi = wrap_spi(spi_function())
+    i2c = wrap_i2c(i2c_function())
+    board.SPI = lambda: spi
+    board.I2C = lambda: i2c
+    digitalio.DigitalInOut = lambda pin: wrap_pin(pin_class(pin), pin.name)
+    try:
+        yield
+    finally:
+        board.SPI, board.I2C, digitalio.DigitalInOut = spi_function, i2c_function, pin_class
+
+
+def quiet():
+    """Returns a context manager that discards console output."""
+
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def measure(function, calls, latch=None, stimulus=None):
+    """Calls a function repeatedly and measures its average cost per call.
+
+    :param: function The function to measure.
+    :param: calls    The number of calls to make.
+    :param: latch    The simulated latch pin whose toggles are counted, or None.
+    :param: stimulus A function called with the call index before each call to
+                     change simulated inputs, or None.  Not included in the
+                     measured wall time.
+
+    :return: A dictionary with the per call averages.
+    """
+
+    buses = (board.SPI(), board.I2C())
+    before = [bus.stats.snapshot() for bus in buses]
+    edges = latch.edges if latch is not None else 0
+    elapsed = 0.0
+    with quiet():
+        for call in range(calls):
+            if stimulus is not None:
+                stimulus(call)
+            start = time.perf_counter()
+            function()
+            elapsed += time.perf_counter() - start
+    after = [bus.stats.snapshot() for bus in buses]
+    delta = [sum(a[i] - b[i] for a, b in zip(after, before)) for i in range(4)]
+    return {
+        "transactions": delta[0] / calls,
+        "bytes": (delta[1] + delta[2]) / calls,
+        "latch_toggles": (latch.edges - edges) / calls if latch is not None else 0.0,
+        "bus_time": delta[3] / calls,
+        "wall_time": elapsed / calls,
+    }
+
+
+def print_table(title, header, rows):
+    """Prints a simple fixed width table.
+
+    :param: title  The title printed above the table.
+    :param: header A sequence of column names.
+    :param: rows   A sequence of row sequences, formatted with str().
+    """
+
+    cells = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(str(name)), *(len(row[i]) for row in cells)) for i, name in enumerate(header)]
+    print(title)
+    print("  ".join(str(name).ljust(width) for name, width in zip(header, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in cells:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+    print()
+
+
+def measurement_row(name, result):
+    """Formats a measure() result as a table row.
+
+    :param: name   The name shown in the first column.
+    :param: result The dictionary returned by measure().
+
+    :return: A list of formatted cells.
+    """
+
+    return [
+        name,
+        f"{result['transactions']:.1f}",
+        f"{result['bytes']:.1f}",
+        f"{result['latch_toggles']:.1f}",
+        f"{result['bus_time'] * 1e6:.0f}",
+        f"{result['wall_time'] * 1e6:.0f}",
+    ]
+
+
+MEASUREMENT_HEADER = ("function", "transactions", "bytes", "latch toggles", "bus time (us)", "wall time (us)")
+"""The table header matching measurement_row()."""
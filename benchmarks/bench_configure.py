@@ -0,0 +1,144 @@
+"""Benchmarks MCP23017 configuration with register images.
+
+Description
+-----------
+
+Configures 1 up to 8 simulated MCP23017s for the pins, ports and interrupts
+used by port_expander.py, once per pin as configure_pins() does, once per
+port property as configure_ports() and configure_interrupts() do, and once by
+applying a register image with the port_expanders module's
+CachedMCP23017.configure(), and reports the transactions, bytes and bus time
+at a 100 kHz I2C clock rate of each approach.
+
+- Bring-up: configures freshly reset expanders.
+- Read back: applies the image after reading the registers back first.
+- Unchanged: configures the already configured expanders again.
+- Runtime change: switches the interrupts of port B from comparing against
+  the previous values to comparing against DEFVAL.
+
+Usage: python benchmarks/bench_configure.py
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Clearing the interrupts, which takes the same single read with every
+  approach, is not included.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+from bench_common import board, sim_hardware, measure, print_table
+from digitalio import Pull
+import port_expanders
+
+
+# Global Constants
+IMAGE = port_expanders.register_image(iodir=0xFF00, gppu=0xFF00, ipol=0xFF00, interrupt_enable=0xFF00,
+                                      interrupt_configuration=0x0000, olat=0x0000)
+"""The register image of the port_expander.py pins, ports and interrupts."""
+
+CHANGED_IMAGE = port_expanders.register_image(iodir=0xFF00, gppu=0xFF00, ipol=0xFF00, interrupt_enable=0xFF00,
+                                              default_value=0xFF00, interrupt_configuration=0xFF00, olat=0x0000)
+"""IMAGE with the port B interrupts comparing against DEFVAL."""
+
+
+# Functions
+def configure_per_pin(mcp):
+    """Configures the pins one by one like configure_pins(), followed by the
+    interrupts like configure_interrupts()."""
+
+    for pin in range(0, 8):
+        mcp.get_pin(pin).switch_to_output(value=False)
+    for pin in range(8, 16):
+        mcp.get_pin(pin).switch_to_input(pull=Pull.UP, invert_polarity=True)
+    mcp.interrupt_enable = 0xFF00
+    mcp.interrupt_configuration = 0x0000
+
+
+def configure_per_port(mcp):
+    """Configures the ports like configure_ports() and the interrupts like
+    configure_interrupts()."""
+
+    mcp.iodir = 0xFF00
+    mcp.gppu = 0xFF00
+    mcp.ipol = 0xFF00
+    mcp.interrupt_enable = 0xFF00
+    mcp.interrupt_configuration = 0x0000
+
+
+def change_per_port(mcp):
+    """Switches the port B interrupts to comparing against DEFVAL with the
+    port properties."""
+
+    mcp.default_value = 0xFF00
+    mcp.interrupt_configuration = 0xFF00
+
+
+def make_expanders(expanders):
+    """Resets the simulator and returns freshly reset expanders."""
+
+    sim_hardware.reset()
+    board.I2C().frequency = 100000
+    addresses = port_expanders.ADDRESSES[:expanders]
+    for address in addresses:
+        sim_hardware.MCP23017Model(board.I2C(), address)
+    return [port_expanders.CachedMCP23017(board.I2C(), address) for address in addresses]
+
+
+def run(name, expanders, configure, prepare=None):
+    """Configures freshly reset expanders, optionally prepared first, and
+    returns the table row."""
+
+    mcps = make_expanders(expanders)
+    if prepare is not None:
+        for mcp in mcps:
+            prepare(mcp)
+    result = measure(lambda: [configure(mcp) for mcp in mcps], 1)
+    return [
+        name,
+        expanders,
+        f"{result['transactions']:.0f}",
+        f"{result['bytes']:.0f}",
+        f"{result['bus_time'] * 1e3:.2f}",
+    ]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    rows = []
+    for expanders in (1, 8):
+        rows.append(run("bring-up, per pin", expanders, configure_per_pin))
+        rows.append(run("bring-up, per port", expanders, configure_per_port))
+        rows.append(run("bring-up, configure()", expanders, lambda mcp: mcp.configure(IMAGE)))
+        rows.append(run("bring-up, configure(read_back=True)", expanders,
+                        lambda mcp: mcp.configure(IMAGE, read_back=True)))
+        rows.append(run("unchanged, per port", expanders, configure_per_port, configure_per_port))
+        rows.append(run("unchanged, configure()", expanders, lambda mcp: mcp.configure(IMAGE),
+                        lambda mcp: mcp.configure(IMAGE)))
+        rows.append(run("runtime change, per port", expanders, change_per_port, configure_per_port))
+        rows.append(run("runtime change, configure()", expanders, lambda mcp: mcp.configure(CHANGED_IMAGE),
+                        lambda mcp: mcp.configure(IMAGE)))
+    print_table("MCP23017 configuration of the port_expander.py pins, ports and interrupts at 100 kHz",
+                ("approach", "expanders", "transactions", "bytes", "bus time (ms)"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmarks the console renderer against per-line print() calls.
+
+Description
+-----------
+
+Prints samples of 1, 8 and 32 chained registers, each differing from the
+previous sample in one random input, once with the print() and f-string
+approaches of input_shift_register.py and once with the console_renderer
+module's ConsoleRenderer, and reports the console writes and characters per
+sample, the samples per second the host can format and write, and the samples
+per second a 115200 baud serial console can carry.
+
+- Binary frames: read_inputs_with_binary_values() prints each byte with a
+  print() call, the renderer writes the frame from its lookup table.
+- Pin lines: read_inputs_with_defined_names() prints a line per input with a
+  print() call, the renderer writes all lines, or only the changed ones, from
+  its precomputed lines.
+
+Usage: python benchmarks/bench_console.py [--samples N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- The output is counted and discarded instead of being shown.
+- Every character takes 10 bits (8N1) on the serial console.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import contextlib
+import random
+import time
+from bench_common import print_table
+import console_renderer
+
+
+# Global Constants
+BAUD_RATE = 115200
+"""The serial console baud rate."""
+
+
+# Classes
+class CountingStream:
+    """A console stream that counts and discards the writes."""
+
+    def __init__(self):
+        self.writes = 0
+        self.characters = 0
+
+    def write(self, text):
+        self.writes += 1
+        self.characters += len(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+# Functions
+def make_samples(registers, count):
+    """Returns samples that each differ from the previous one in one input."""
+
+    random.seed(registers)
+    sample = bytearray(random.getrandbits(8) for _ in range(registers))
+    samples = []
+    for _ in range(count):
+        pin = random.randrange(8 * registers)
+        sample[pin // 8] ^= 1 << (pin % 8)
+        samples.append(bytes(sample))
+    return samples
+
+
+def print_binary(sample):
+    """Prints a sample like read_inputs_with_binary_values()."""
+
+    print("Inputs: ", end="")
+    for byte in sample:
+        print(f"{byte:08b}", end=" ")
+    print()
+
+
+def print_lines(sample):
+    """Prints a sample like read_inputs_with_defined_names()."""
+
+    for pin in range(8 * len(sample)):
+        print(f"Input {pin} = {bool(sample[pin // 8] & (1 << (pin % 8)))}")
+    print()
+
+
+def run(name, registers, render, samples):
+    """Renders the samples to a counting stream and returns the table row."""
+
+    stream = CountingStream()
+    with contextlib.redirect_stdout(stream):
+        start = time.perf_counter_ns()
+        for sample in samples:
+            render(sample)
+        elapsed = time.perf_counter_ns() - start
+    characters = stream.characters / len(samples)
+    return [
+        name,
+        registers,
+        f"{stream.writes / len(samples):.1f}",
+        f"{characters:.0f}",
+        f"{len(samples) / (elapsed / 1e9):.0f}",
+        f"{BAUD_RATE / 10 / characters:.0f}",
+    ]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=1000, help="number of samples per measurement")
+    args = parser.parse_args()
+
+    rows = []
+    for registers in (1, 8, 32):
+        samples = make_samples(registers, args.samples)
+        renderer = console_renderer.ConsoleRenderer(registers, [f"Input {pin}" for pin in range(8 * registers)])
+        rows.append(run("binary, print() per byte", registers, print_binary, samples))
+        rows.append(run("binary, render_binary()", registers, renderer.render_binary, samples))
+        rows.append(run("lines, print() per line", registers, print_lines, samples))
+        rows.append(run("lines, render_lines()", registers, renderer.render_lines, samples))
+        rows.append(run("changed lines, render_lines(changed=True)", registers,
+                        lambda sample: renderer.render_lines(sample, changed=True), samples))
+    print_table("Console printing of samples with one changed input",
+                ("approach", "registers", "writes/sample", "chars/sample", "host samples/s",
+                 f"{BAUD_RATE} baud samples/s"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmarks the bit-parallel debouncer against per-pin debouncing.
+
+Description
+-----------
+
+Feeds random samples with occasional input changes to the input_debounce
+module's Debouncer and to a conventional debouncer with one counter per input,
+for chains of 1 up to 64 74HC165s, and reports the cost per sample and per
+shift register of each.
+
+Usage: python benchmarks/bench_debounce.py [--samples N] [--updates N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Both debouncers are checked to produce the same stable values.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import random
+import time
+from bench_common import print_table
+import input_debounce
+
+
+# Classes
+class PerPinDebouncer:
+    """A conventional debouncer with one counter per input, for comparison."""
+
+    def __init__(self, number_of_shift_registers, samples):
+        self.samples = samples
+        self.stable = [False] * (8 * number_of_shift_registers)
+        self.counts = [0] * (8 * number_of_shift_registers)
+
+    def update(self, sample):
+        """Adds a sample of the raw inputs, returns True on any stable change."""
+
+        any_changed = False
+        for pin in range(len(self.stable)):
+            value = bool(sample[pin // 8] & (1 << (pin % 8)))
+            if value == self.stable[pin]:
+                self.counts[pin] = 0
+            else:
+                self.counts[pin] += 1
+                if self.counts[pin] >= self.samples:
+                    self.stable[pin] = value
+                    self.counts[pin] = 0
+                    any_changed = True
+        return any_changed
+
+
+# Functions
+def make_samples(registers, updates):
+    """Returns a list of sample buffers with occasional bouncing input changes."""
+
+    rng = random.Random(registers)
+    sample = bytearray(registers)
+    samples = []
+    for _ in range(updates):
+        if rng.random() < 0.2:
+            sample[rng.randrange(registers)] ^= 1 << rng.randrange(8)
+        samples.append(bytes(sample))
+    return samples
+
+
+def time_updates(debouncer, samples):
+    """Returns the average time per update() call in seconds."""
+
+    start = time.perf_counter()
+    for sample in samples:
+        debouncer.update(sample)
+    return (time.perf_counter() - start) / len(samples)
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=4, help="debounce sample count")
+    parser.add_argument("--updates", type=int, default=2000, help="number of samples per chain length")
+    args = parser.parse_args()
+
+    rows = []
+    for registers in (1, 4, 8, 16, 32, 64):
+        samples = make_samples(registers, args.updates)
+        vertical = input_debounce.Debouncer(registers, args.samples)
+        per_pin = PerPinDebouncer(registers, args.samples)
+        vertical_time = time_updates(vertical, samples)
+        per_pin_time = time_updates(per_pin, samples)
+        for pin in range(8 * registers):
+            assert vertical.value(pin) == per_pin.stable[pin], "debouncer mismatch"
+        rows.append([
+            registers,
+            f"{vertical_time * 1e6:.1f}",
+            f"{vertical_time * 1e9 / registers:.0f}",
+            f"{per_pin_time * 1e6:.1f}",
+            f"{per_pin_time * 1e9 / registers:.0f}",
+            f"{per_pin_time / vertical_time:.1f}x",
+        ])
+    print_table(f"Debouncing, {args.samples} samples",
+                ("registers", "vertical us/sample", "vertical ns/register", "per-pin us/sample",
+                 "per-pin ns/register", "speedup"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
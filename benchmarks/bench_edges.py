@@ -0,0 +1,114 @@
+"""Benchmarks the edge detector against copy-based change detection.
+
+Description
+-----------
+
+Feeds samples in which a single input changes (or nothing changes) to the
+input_edges module's EdgeDetector and to the change detection approach of
+read_and_print_inputs_on_change() (compare, copy, then scan every bit to find
+the changed inputs), for chains of 1 up to 128 74HC165s, and reports the cost
+per sample of each.
+
+Usage: python benchmarks/bench_edges.py [--updates N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import time
+from bench_common import print_table
+import input_edges
+
+
+# Functions
+def copy_based_changes(previous, sample):
+    """Finds changed inputs by comparing, copying and scanning every bit.
+
+    :return: A tuple of the new previous buffer and the changed pin list.
+    """
+
+    changes = []
+    if sample != previous:
+        for pin in range(8 * len(sample)):
+            mask = 1 << (pin % 8)
+            if (sample[pin // 8] ^ previous[pin // 8]) & mask:
+                changes.append((pin, bool(sample[pin // 8] & mask)))
+        previous = sample[:]
+    return previous, changes
+
+
+def make_samples(registers, updates, changing):
+    """Returns sample buffers where one input toggles per sample (if changing)."""
+
+    sample = bytearray(registers)
+    samples = []
+    for update in range(updates):
+        if changing:
+            pin = (update * 37) % (8 * registers)
+            sample[pin // 8] ^= 1 << (pin % 8)
+        samples.append(bytearray(sample))
+    return samples
+
+
+def time_detector(registers, samples):
+    """Returns the average EdgeDetector.update() time per sample in seconds."""
+
+    detector = input_edges.EdgeDetector(registers)
+    start = time.perf_counter()
+    for sample in samples:
+        detector.update(sample, 0)
+    return (time.perf_counter() - start) / len(samples)
+
+
+def time_copy_based(registers, samples):
+    """Returns the average copy-based detection time per sample in seconds."""
+
+    previous = bytearray(registers)
+    start = time.perf_counter()
+    for sample in samples:
+        previous, _ = copy_based_changes(previous, sample)
+    return (time.perf_counter() - start) / len(samples)
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=2000, help="number of samples per chain length")
+    args = parser.parse_args()
+
+    rows = []
+    for registers in (1, 8, 32, 128):
+        changing = make_samples(registers, args.updates, True)
+        unchanged = make_samples(registers, args.updates, False)
+        rows.append([
+            registers,
+            f"{time_detector(registers, changing) * 1e6:.1f}",
+            f"{time_copy_based(registers, changing) * 1e6:.1f}",
+            f"{time_detector(registers, unchanged) * 1e6:.2f}",
+            f"{time_copy_based(registers, unchanged) * 1e6:.2f}",
+        ])
+    print_table("Change detection, us per sample",
+                ("registers", "detector 1 change", "copy-based 1 change", "detector no change",
+                 "copy-based no change"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
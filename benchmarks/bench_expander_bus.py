@@ -0,0 +1,89 @@
+"""Benchmarks full input scans of multiple simulated MCP23017s.
+
+Description
+-----------
+
+Scans the inputs of 1 up to 8 simulated MCP23017s on one I2C bus, once by
+reading every pin with the driver's per-pin value property and once with the
+port_expanders module's ExpanderBus, and reports the transactions, bytes and
+bus time per full scan, and the resulting scan rate ceiling at 100 kHz and
+400 kHz I2C clock rates.
+
+Usage: python benchmarks/bench_expander_bus.py [--scans N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- The scan rate ceilings only include the time spent on the bus.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+from bench_common import board, sim_hardware, measure, print_table
+from adafruit_mcp230xx.mcp23017 import MCP23017
+import port_expanders
+
+
+# Functions
+def scan_row(name, expanders, result):
+    """Returns a table row of scan results at a 100 kHz bus clock."""
+
+    return [
+        name,
+        expanders,
+        f"{result['transactions']:.0f}",
+        f"{result['bytes']:.0f}",
+        f"{result['bus_time'] * 1e3:.2f}",
+        f"{1 / result['bus_time']:.0f}",
+        f"{4 / result['bus_time']:.0f}",
+    ]
+
+
+def bench_expanders(expanders, scans):
+    """Scans the given number of expanders with both approaches."""
+
+    sim_hardware.reset()
+    board.I2C().frequency = 100000
+    addresses = port_expanders.ADDRESSES[:expanders]
+    for address in addresses:
+        sim_hardware.MCP23017Model(board.I2C(), address)
+
+    pins = [MCP23017(board.I2C(), address=address).get_pin(pin) for address in addresses for pin in range(16)]
+    per_pin = measure(lambda: [pin.value for pin in pins], scans)
+
+    expander_bus = port_expanders.ExpanderBus(board.I2C(), reset=False)
+    bulk = measure(expander_bus.scan, scans)
+    return [scan_row("per-pin value", expanders, per_pin), scan_row("ExpanderBus.scan()", expanders, bulk)]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scans", type=int, default=100, help="number of full scans per configuration")
+    args = parser.parse_args()
+
+    rows = []
+    for expanders in (1, 2, 4, 8):
+        rows.extend(bench_expanders(expanders, args.scans))
+    print_table("Full input scan of all MCP23017 pins",
+                ("approach", "expanders", "transactions", "bytes", "bus time (ms)", "scans/s at 100 kHz",
+                 "scans/s at 400 kHz"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Benchmarks full-duplex refreshes of simulated 74HC165 and 74HC595 chains.
+
+Description
+-----------
+
+Refreshes a simulated 74HC165 chain and a simulated 74HC595 chain of the same
+length on the same SPI bus, once with separate transfers (the inputs read
+with InputShiftRegister.readinto() and the outputs written with
+OutputShiftRegister.write()) and once with a single full-duplex
+FullDuplexShiftRegisters.refresh(), both from the shift_registers module, and
+reports the transactions, bytes, bus time and wall time per I/O cycle.  Each
+cycle copies the inputs to the outputs of the previous cycle and checks that
+both approaches produce the same outputs.
+
+Usage: python benchmarks/bench_full_duplex.py [--cycles N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Bus time is the simulated time of the clocked bytes at the drivers' 1 MHz
+  clock rate.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import random
+from bench_common import board, sim_hardware, measure, print_table
+import digitalio
+import shift_registers
+
+
+# Functions
+def cycle_row(name, registers, result):
+    """Formats a measure() result as a table row."""
+
+    return [
+        name,
+        registers,
+        f"{result['transactions']:.1f}",
+        f"{result['bytes']:.1f}",
+        f"{result['bus_time'] * 1e6:.0f}",
+        f"{result['wall_time'] * 1e6:.0f}",
+    ]
+
+
+def wire(registers):
+    """Resets the simulator and connects both chains, returning their models."""
+
+    sim_hardware.reset()
+    inputs = sim_hardware.Chain74HC165(board.SPI(), board.D5, registers)
+    outputs = sim_hardware.Chain74HC595(board.SPI(), board.D6, registers)
+    return inputs, outputs
+
+
+def stimulus(chain):
+    """Returns a stimulus that changes a random input before each cycle."""
+
+    def change(call):
+        pin = random.randrange(8 * chain.number)
+        chain.set_input(pin, not chain.inputs[pin // 8] & (1 << (pin % 8)))
+
+    return change
+
+
+def bench_chains(registers, cycles):
+    """Returns the table rows of both approaches for a chain length."""
+
+    random.seed(registers)
+    inputs, outputs = wire(registers)
+    isr = shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), registers)
+    osr = shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D6), registers)
+    buffer = bytearray(registers)
+
+    def separate():
+        isr.readinto(buffer)
+        osr.write(buffer)
+
+    separate_result = measure(separate, cycles, stimulus=stimulus(inputs))
+    separate_outputs = outputs.driver_outputs()
+    assert separate_outputs == bytearray(buffer)
+
+    random.seed(registers)
+    inputs, outputs = wire(registers)
+    duplex = shift_registers.FullDuplexShiftRegisters(board.SPI(), digitalio.DigitalInOut(board.D5),
+                                                      digitalio.DigitalInOut(board.D6), registers, registers)
+
+    def full_duplex():
+        duplex.outputs[:] = duplex.refresh()  # the inputs are written out by the next refresh
+
+    duplex_result = measure(full_duplex, cycles, stimulus=stimulus(inputs))
+    duplex.refresh()
+    assert outputs.driver_outputs() == separate_outputs  # one refresh behind, caught up here
+    return [cycle_row("separate transfers", registers, separate_result),
+            cycle_row("full-duplex refresh", registers, duplex_result)]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=100, help="number of I/O cycles per measurement")
+    args = parser.parse_args()
+
+    rows = []
+    for registers in (1, 4, 16):
+        rows.extend(bench_chains(registers, args.cycles))
+    print_table("I/O cycle: read all inputs and write all outputs on one SPI bus",
+                ("approach", "registers", "transactions", "bytes", "bus time (us)", "wall time (us)"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
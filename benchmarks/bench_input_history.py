@@ -0,0 +1,126 @@
+"""Benchmarks input history recording on simulated 74HC165 chains.
+
+Description
+-----------
+
+Compares the cost per sample of reading a simulated 74HC165 chain alone with
+reading it directly into an input_history module InputHistory, reports the
+fixed ring memory and the peak memory allocated per recorded sample, and
+compares the exported size of the RAW and DELTA encodings for inputs that
+change at different rates.
+
+Usage: python benchmarks/bench_input_history.py [--samples N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- The SPI bus time is the simulated time of the read at the driver's 1 MHz
+  clock rate, which bounds the sampling rate on a board.  The recording
+  overhead is the extra wall time of recording on the host.
+- Memory is measured with tracemalloc.  The peak includes the few hundred
+  bytes the simulated bus allocates per transfer and temporary integers; the
+  ring itself never grows.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import io
+import random
+import tracemalloc
+from bench_common import board, sim_hardware, measure, print_table
+import digitalio
+import input_history
+import shift_registers
+
+
+# Functions
+def peak_allocation(function, calls):
+    """Returns the peak memory allocated by repeated calls in bytes."""
+
+    function()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for _ in range(calls):
+        function()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return peak
+
+
+def bench_recording(registers, samples):
+    """Returns a table row of the recording cost for a chain length."""
+
+    sim_hardware.reset()
+    sim_hardware.Chain74HC165(board.SPI(), board.D5, registers)
+    isr = shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), registers)
+    inputs = bytearray(registers)
+    history = input_history.InputHistory(registers, samples)
+
+    read = measure(lambda: isr.readinto(inputs), samples)
+    record = measure(lambda: history.record_from(isr), samples)
+    return [
+        registers,
+        f"{read['bus_time'] * 1e6:.1f}",
+        f"{1 / read['bus_time']:.0f}",
+        f"{read['wall_time'] * 1e6:.1f}",
+        f"{record['wall_time'] * 1e6:.1f}",
+        len(history.ring),
+        peak_allocation(lambda: history.record_from(isr), samples),
+    ]
+
+
+def bench_export(registers, samples, probability):
+    """Returns a table row of the exported sizes for an input change rate."""
+
+    history = input_history.InputHistory(registers, samples)
+    random.seed(registers)
+    inputs = bytearray(registers)
+    timestamp = 0
+    for _ in range(samples):
+        if random.random() < probability:
+            inputs[random.randrange(registers)] ^= 1 << random.randrange(8)
+        timestamp += 1000000 + random.randrange(-5000, 5000)  # 1 ms sampling with jitter
+        history.record(inputs, timestamp)
+
+    sizes = []
+    for encoding in (input_history.RAW, input_history.DELTA):
+        stream = io.BytesIO()
+        history.export(stream, encoding, clear=False)
+        stream.seek(0)
+        assert len(list(input_history.read_history(stream))) == samples
+        sizes.append(len(stream.getvalue()))
+    return [f"{probability:.2f}", sizes[0], sizes[1], f"{sizes[0] / sizes[1]:.1f}x"]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=1000, help="number of samples per measurement")
+    args = parser.parse_args()
+
+    print_table("Recording cost per sample",
+                ("registers", "SPI bus time (us)", "max samples/s", "read only (us)", "read and record (us)",
+                 "ring bytes", "peak bytes"),
+                [bench_recording(registers, args.samples) for registers in (1, 8, 32, 128)])
+    print_table(f"Exported size of {args.samples} samples of 8 registers at 1 ms",
+                ("changes/sample", "RAW bytes", "DELTA bytes", "ratio"),
+                [bench_export(8, args.samples, probability) for probability in (0.01, 0.1, 1.0)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmarks the instrumentation module on the simulated example programs.
+
+Description
+-----------
+
+Loads input_shift_register.py, output_shift_register.py and port_expander.py
+on simulated hardware with their buses and pins hooked by an
+instrumentation.Profiler and some of their example functions profiled, the
+same as profiling_example.py does on a board, calls those functions, and
+prints each program's profiling report, showing where the time of each
+function goes: bus transactions, latch pulses, or everything else (mostly
+print formatting).  Then compares the wall time per call of the same
+functions loaded without and with the profiler to show the overhead of the
+instrumentation.
+
+Usage: python benchmarks/bench_instrumentation.py [--calls N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- On the host, the bus times are the times spent in the simulator, and the
+  overhead is large relative to the simulated buses, which are much faster
+  than real ones.  Without the profiler, the programs run their original
+  functions on the original bus and pin objects.
+- The programs themselves are not changed: the hooked buses and pins are
+  handed to them while they are loaded, and their example functions are
+  replaced by profiled versions afterwards.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+from bench_common import board, sim_hardware, load_program, measure, print_table, quiet, wrapped_hardware
+import bus_hooks
+import instrumentation
+import lazy
+
+
+# Global Constants
+PROGRAMS = {
+    "input_shift_register": ("read_single_inputs",
+                             "read_single_inputs_with_snapshot",
+                             "read_inputs_with_binary_values",
+                             "read_inputs_with_lookup_tables"),
+    "output_shift_register": ("change_single_outputs",
+                              "change_single_outputs_with_batch",
+                              "change_outputs_with_binary_values",
+                              "change_outputs_in_place"),
+    "port_expander": ("read_and_write_pin",
+                      "read_and_write_pin_with_batch",
+                      "port_copy"),
+}
+"""The example functions profiled by program."""
+
+
+# Functions
+def load_profiled_program(name, profiler):
+    """Imports (or re-imports) one of the repository's programs on buses and
+    pins wrapped by a profiler, and profiles its example functions.
+
+    :param: name     The module name of the program.
+    :param: profiler The enabled instrumentation.Profiler instance.
+
+    :return: The freshly imported module.
+    """
+
+    hooks = bus_hooks.BusHooks(profiler)
+    with wrapped_hardware(hooks.wrap_spi, hooks.wrap_i2c, hooks.wrap_pin):
+        program = load_program(name)
+        lazy.resolve_all(program.__dict__)  # create the lazy instances on the hooked buses and pins
+    for function in PROGRAMS[name]:
+        setattr(program, function, profiler.profile(getattr(program, function)))
+    return program
+
+
+def wire(name):
+    """Resets the simulator and connects the hardware used by a program."""
+
+    sim_hardware.reset()
+    if name == "input_shift_register":
+        sim_hardware.Chain74HC165(board.SPI(), board.D5, 1)
+    elif name == "output_shift_register":
+        sim_hardware.Chain74HC595(board.SPI(), board.D5, 1)
+    else:
+        sim_hardware.MCP23017Model(board.I2C(), 0x20, intb=board.D5)
+
+
+def load(name, profiler=None):
+    """Wires the hardware of a program and loads it, profiled by profiler if
+    given."""
+
+    wire(name)
+    program = load_profiled_program(name, profiler) if profiler is not None else load_program(name)
+    if name == "output_shift_register":
+        program.sleep = lambda seconds: None  # measure I/O work only
+    elif name == "port_expander":
+        with quiet():
+            program.configure_pins()
+            program.configure_ports()
+            program.configure_interrupts()
+    return program
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100, help="number of calls per function")
+    args = parser.parse_args()
+
+    for name, functions in PROGRAMS.items():
+        profiler = instrumentation.Profiler(enabled=True)
+        program = load(name, profiler)
+        profiler.reset()
+        with quiet():
+            for function in functions:
+                for _ in range(args.calls):
+                    getattr(program, function)()
+        print(f"\n{name}.py profiling report ({args.calls} calls per function)")
+        profiler.print_report()
+
+    rows = []
+    for name, functions in PROGRAMS.items():
+        times = []
+        for profiler in (None, instrumentation.Profiler(enabled=True)):
+            program = load(name, profiler)
+            times.append([measure(getattr(program, function), args.calls)["wall_time"] for function in functions])
+        for function, off, on in zip(functions, times[0], times[1]):
+            rows.append([function, f"{off * 1e6:.0f}", f"{on * 1e6:.0f}", f"{(on - off) / off * 100:+.0f}%"])
+    print_table("Instrumentation overhead, wall time per call", ("function", "disabled (us)", "enabled (us)",
+                                                                  "overhead"), rows)
+
+
+if __name__ == "__main__":
+    main()
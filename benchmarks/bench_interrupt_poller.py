@@ -0,0 +1,225 @@
+"""Benchmarks adaptive interrupt pin polling against busy polling.
+
+Description
+-----------
+
+Watches the INTB pins of two simulated MCP23017s, whose switches change at
+random times from a background thread, once by polling both pins back to back
+as read_and_write_port_on_input_change() of port_expander.py does, and once
+with the port_expanders module's InterruptPoller for several maximum
+latencies, servicing every detected interrupt with a burst read that clears
+it.  Reports the detections, the detection latency from the first switch
+change of each interrupt to its service, the InterruptPoller's own latency
+bound, and the CPU duty, both as reported by the InterruptPoller and as the
+process CPU time over the run time.
+
+Usage: python benchmarks/bench_interrupt_poller.py [--seconds S] [--rate HZ] [--hold S]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Runs in real time.
+- The switch changes follow a random (Poisson) arrival process, with about a
+  third of them followed by a second change 20 ms later, like a switch
+  toggled on and back off.
+- The host's sleep resolution adds to the measured latencies.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import random
+import threading
+import time
+from bench_common import board, sim_hardware, print_table
+import digitalio
+import port_expanders
+
+
+# Global Constants
+ADDRESSES = (0x20, 0x21)
+"""The I2C addresses of the simulated MCP23017s."""
+
+MAX_LATENCIES = (0.001, 0.01, 0.05)
+"""The InterruptPoller maximum latencies compared, in seconds."""
+
+
+# Classes
+class Rig:
+    """Two simulated MCP23017s with interrupts enabled on port B, their
+    drivers and INTB pins, and a background thread changing their switches.
+
+    :param: rate The average number of switch changes per second.
+    :param: seed The random number generator seed of the switch changes.
+    """
+
+    def __init__(self, rate, seed=1):
+        sim_hardware.reset()
+        int_pins = (board.D5, board.D6)
+        self.models = [sim_hardware.MCP23017Model(board.I2C(), address, intb=pin)
+                       for address, pin in zip(ADDRESSES, int_pins)]
+        self.lock = threading.Lock()  # serializes the model between the switch thread and the bus
+        for model in self.models:
+            model.i2c_write = self._locked(model.i2c_write)
+            model.i2c_read_byte = self._locked(model.i2c_read_byte)
+        self.expanders = [port_expanders.CachedMCP23017(board.I2C(), address) for address in ADDRESSES]
+        for expander in self.expanders:
+            expander.interrupt_enable = 0xFF00  # port B (switches)
+            expander.interrupt_configuration = 0x0000
+            expander.clear_ints()
+        self.int_pins = []
+        for pin in int_pins:
+            int_pin = digitalio.DigitalInOut(pin)
+            int_pin.switch_to_input(pull=digitalio.Pull.UP)
+            self.int_pins.append(int_pin)
+        self._rate = rate
+        self._generator = random.Random(seed)
+        self._buffer = bytearray(4)
+        self._pending = [None] * len(ADDRESSES)  # time of the first unserviced change of each expander, in ns
+        self._stop = threading.Event()
+        self._thread = None
+        self.changes = 0
+        self.latencies = []
+
+    def _locked(self, method):
+        def locked(*args):
+            with self.lock:
+                return method(*args)
+
+        return locked
+
+    def _change_switches(self):
+        generator = self._generator
+        next_change = time.monotonic_ns() + int(generator.expovariate(self._rate) * 1e9)
+        follow_ups = []  # (due time, expander index, pin) of the switches to toggle back
+        while True:
+            if follow_ups and follow_ups[0][0] <= next_change:
+                due, index, pin = follow_ups.pop(0)
+            else:
+                due = next_change
+                index = generator.randrange(len(self.models))
+                pin = 8 + generator.randrange(8)
+                if generator.random() < 1 / 3:
+                    follow_ups.append((due + 20000000, index, pin))
+                next_change += int(generator.expovariate(self._rate) * 1e9)
+            if self._stop.wait(max((due - time.monotonic_ns()) / 1e9, 0)):
+                break
+            model = self.models[index]
+            with self.lock:
+                model.set_input(pin, not model.levels & (1 << pin))
+                if self._pending[index] is None:
+                    self._pending[index] = time.monotonic_ns()
+                self.changes += 1
+
+    def start(self):
+        """Starts changing the switches."""
+
+        self._thread = threading.Thread(target=self._change_switches, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops changing the switches."""
+
+        self._stop.set()
+        self._thread.join()
+
+    def service(self, asserted):
+        """Services the interrupts of the asserted INTB pins and records their
+        detection latencies.
+
+        :param: asserted A bit mask of the asserted pins (bit n for int_pins[n]).
+        """
+
+        now = time.monotonic_ns()
+        for index, expander in enumerate(self.expanders):
+            if asserted & (1 << index):
+                expander.read_interrupts(self._buffer)  # also clears the interrupt
+                with self.lock:
+                    pending = self._pending[index]
+                    self._pending[index] = None
+                if pending is not None:
+                    self.latencies.append(now - pending)
+
+
+# Functions
+def busy_polling(rig, seconds):
+    """Polls the INTB pins back to back for a number of seconds."""
+
+    end = time.monotonic_ns() + int(seconds * 1e9)
+    int_pins = rig.int_pins
+    while time.monotonic_ns() < end:
+        asserted = 0
+        for index, int_pin in enumerate(int_pins):
+            if not int_pin.value:  # active low
+                asserted |= 1 << index
+        if asserted:
+            rig.service(asserted)
+
+
+def run(name, seconds, rate, hold, max_latency=None):
+    """Runs an approach and returns its table row."""
+
+    rig = Rig(rate)
+    poller = None
+    if max_latency is not None:
+        poller = port_expanders.InterruptPoller(rig.int_pins, max_latency=max_latency, hold=hold)
+    rig.start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    if poller is None:
+        busy_polling(rig, seconds)
+    else:
+        poller.reset_statistics()
+        poller.run(rig.service, seconds)
+    cpu_duty = (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+    rig.stop()
+    latencies = sorted(rig.latencies)
+    detections = len(latencies)
+    return [
+        name,
+        rig.changes,
+        detections,
+        f"{sum(latencies) / detections / 1000:.0f}" if detections else "-",
+        f"{latencies[min(detections - 1, detections * 99 // 100)] / 1000:.0f}" if detections else "-",
+        f"{latencies[-1] / 1000:.0f}" if detections else "-",
+        f"{poller.max_latency / 1000:.0f}" if poller else "-",
+        f"{poller.cpu_duty * 100:.1f}" if poller else "100.0",
+        f"{min(cpu_duty, 1.0) * 100:.1f}",
+    ]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0, help="run time per approach")
+    parser.add_argument("--rate", type=float, default=5.0, help="average switch changes per second")
+    parser.add_argument("--hold", type=float, default=0.1,
+                        help="time to keep polling back to back after an interrupt, in seconds")
+    args = parser.parse_args()
+
+    rows = [run("busy polling", args.seconds, args.rate, args.hold)]
+    for max_latency in MAX_LATENCIES:
+        rows.append(run(f"InterruptPoller, max latency {max_latency * 1000:.0f} ms", args.seconds, args.rate,
+                        args.hold, max_latency))
+    print_table(f"Interrupt detection, 2 x MCP23017 INTB, {args.rate:.0f} switch changes/s, {args.hold * 1000:.0f} ms "
+                f"hold, {args.seconds:.1f} s",
+                ("approach", "changes", "detections", "avg latency (us)", "p99 latency (us)", "max latency (us)",
+                 "bound max (us)", "reported CPU duty (%)", "process CPU duty (%)"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmarks burst interrupt servicing on a simulated MCP23017.
+
+Description
+-----------
+
+Runs read_and_write_pin_on_input_change() and
+read_and_write_pin_from_event_queue() of port_expander.py while simulated
+switches change at random points between calls and between I2C transactions,
+as real switches change asynchronously to the bus traffic, and reports the
+I2C transactions per serviced interrupt, the switch changes made and
+delivered to the LEDs, and the number of LEDs left out of date once the
+switches stop changing.
+
+Also prints the latency histogram of the event queue.
+
+Usage: python benchmarks/bench_interrupt_queue.py [--calls N] [--probability P]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- A switch changing while its port's interrupt is already flagged is not
+  captured by the MCP23017 itself, so some changes are missed by both
+  approaches; the burst read only narrows the window in which it happens.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import random
+from bench_common import board, sim_hardware, load_program, print_table, quiet
+
+
+# Functions
+def bench_function(name, calls, probability):
+    """Runs one of the interrupt servicing functions and returns a table row
+    and the program module."""
+
+    sim_hardware.reset()
+    expander = sim_hardware.MCP23017Model(board.I2C(), 0x20, intb=board.D5)
+    program = load_program("port_expander")
+    program.configure_pins()
+    program.configure_interrupts()
+    function = getattr(program, name)
+
+    generator = random.Random(1)
+    changes = 0
+    handle_write = expander.i2c_write
+
+    def maybe_change_switch():
+        nonlocal changes
+        if generator.random() < probability:
+            pin = 8 + generator.randrange(8)
+            expander.set_input(pin, not expander.levels & (1 << pin))
+            changes += 1
+
+    def i2c_write_with_changes(data):
+        maybe_change_switch()  # a switch may change just before any transaction
+        handle_write(data)
+
+    expander.i2c_write = i2c_write_with_changes
+    before = board.I2C().stats.transactions
+    outputs = expander.outputs
+    delivered = 0
+    services = 0
+    with quiet():
+        for _ in range(calls):
+            maybe_change_switch()  # or between calls
+            interrupted = not program.mcp23017_intb.value
+            function()
+            services += interrupted
+            delivered += bin((expander.outputs ^ outputs) & 0xFF).count("1")
+            outputs = expander.outputs
+    transactions = board.I2C().stats.transactions - before
+    expander.i2c_write = handle_write
+    function()  # service anything still pending once the switches stopped
+    stale = bin((expander.outputs & 0xFF) ^ program.mcp23017.gpiob).count("1")
+    return [
+        name,
+        f"{transactions / max(services, 1):.1f}",
+        changes,
+        delivered,
+        stale,
+    ], program
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000, help="number of calls per function")
+    parser.add_argument("--probability", type=float, default=0.2,
+                        help="probability of a switch change before each call and I2C transaction")
+    args = parser.parse_args()
+
+    rows = []
+    for name in ("read_and_write_pin_on_input_change", "read_and_write_pin_from_event_queue"):
+        row, program = bench_function(name, args.calls, args.probability)
+        rows.append(row)
+    print_table(f"Interrupt servicing, switch change probability {args.probability} per call and transaction",
+                ("function", "transactions/service", "changes made", "LED changes", "stale LEDs"),
+                rows)
+    program.interrupt_queue.print_report()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmarks full refreshes of long simulated shift register chains.
+
+Description
+-----------
+
+Refreshes simulated 74HC165 and 74HC595 chains of 1 up to 128 registers, once
+with the approach of the example programs and once with the preallocated
+buffer and lookup table methods of the shift_registers module, and reports the
+time and the peak memory allocated per full-chain refresh.
+
+- Input refresh: read the chain, then read every input.  The example approach
+  reads gpio and calls bit_read() of input_shift_register.py for each input,
+  the buffer approach calls readinto() with a preallocated buffer and value()
+  for each input.
+- Output refresh: set every output, then write the chain.  The example
+  approach modifies gpio with computed byte positions and masks and assigns it
+  back, the buffer approach calls set_value() for each output and write().
+
+Usage: python benchmarks/bench_long_chains.py [--refreshes N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- The times include the simulated shift registers, which dominate for the
+  longest chains; compare the approaches rather than the absolute values.
+- Memory is measured with tracemalloc, so the times are measured separately.
+  The simulated bus itself allocates a few hundred bytes per transfer, which
+  are included in every column.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import time
+import tracemalloc
+from bench_common import board, sim_hardware, print_table
+import digitalio
+import shift_registers
+
+
+# Functions
+def bit_read(data, position):
+    """The bit_read() function of input_shift_register.py."""
+
+    byte_pos = int(position // 8)  # byte position in number
+    bit_pos = int(position % 8)    # bit position in byte
+    return bool((data[byte_pos] & (1 << bit_pos)) >> bit_pos)
+
+
+def make_refreshes(registers):
+    """Returns the example and buffer based input and output refresh functions
+    for simulated chains of the given length."""
+
+    sim_hardware.reset()
+    sim_hardware.Chain74HC165(board.SPI(), board.D5, registers)
+    sim_hardware.Chain74HC595(board.SPI(), board.D6, registers)
+    isr = shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), registers)
+    osr = shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D6), registers)
+    pins = range(8 * registers)
+    inputs = bytearray(registers)
+
+    def example_input_refresh():
+        data = isr.gpio
+        for pin in pins:
+            bit_read(data, pin)
+
+    def buffer_input_refresh():
+        isr.readinto(inputs)
+        for pin in pins:
+            isr.value(pin, inputs)
+
+    def example_output_refresh():
+        outputs = osr.gpio
+        for pin in pins:
+            outputs[int(pin // 8)] |= 1 << int(pin % 8)
+        osr.gpio = outputs
+
+    def buffer_output_refresh():
+        for pin in pins:
+            osr.set_value(pin, True)
+        osr.write()
+
+    return example_input_refresh, buffer_input_refresh, example_output_refresh, buffer_output_refresh
+
+
+def time_refresh(function, refreshes):
+    """Returns the average time of a refresh in seconds."""
+
+    function()
+    start = time.perf_counter()
+    for _ in range(refreshes):
+        function()
+    return (time.perf_counter() - start) / refreshes
+
+
+def peak_allocation(function):
+    """Returns the peak memory allocated by a refresh in bytes."""
+
+    function()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    function()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--refreshes", type=int, default=20, help="number of refreshes per measurement")
+    args = parser.parse_args()
+
+    rows = []
+    for registers in (1, 8, 32, 64, 128):
+        functions = make_refreshes(registers)
+        times = [time_refresh(function, args.refreshes) for function in functions]
+        peaks = [peak_allocation(function) for function in functions]
+        rows.append([registers] + [f"{t * 1e6:.0f} / {p}" for t, p in zip(times, peaks)])
+    print_table("Full-chain refresh, us / peak bytes allocated",
+                ("registers", "example input", "buffer input", "example output", "buffer output"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmarks setting named groups of outputs with a compiled pin map.
+
+Description
+-----------
+
+Sets all even numbered outputs of 74HC595 output buffers of 1 up to 128
+registers, once per output with a name lookup and computed position (as the
+named outputs of output_shift_register.py would scale to long chains), once
+per output with OutputShiftRegister.set_value(), and once with a pin_map
+module PinGroup compiled from the same names, and reports the time per group
+update.
+
+Usage: python benchmarks/bench_pin_map.py [--updates N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Only the output buffer updates are timed, not the writes to the chain.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import time
+from bench_common import board, sim_hardware, print_table
+import digitalio
+import pin_map
+import shift_registers
+
+
+# Functions
+def time_updates(function, updates):
+    """Returns the average time of a group update in seconds."""
+
+    start = time.perf_counter()
+    for _ in range(updates):
+        function()
+    return (time.perf_counter() - start) / updates
+
+
+def bench_registers(registers, updates):
+    """Times the three approaches for a chain of the given length."""
+
+    sim_hardware.reset()
+    sim_hardware.Chain74HC595(board.SPI(), board.D5, registers)
+    osr = shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), registers)
+    names = {f"led_{n}": n for n in range(8 * registers)}
+    even_names = [name for name, pin in names.items() if pin % 2 == 0]
+    even_leds = pin_map.PinMap(names).group(*even_names)
+    outputs = osr.gpio
+
+    def per_name():
+        for name in even_names:
+            pin = names[name]
+            outputs[int(pin // 8)] |= 1 << int(pin % 8)
+
+    def per_pin_tables():
+        for name in even_names:
+            osr.set_value(names[name], True)
+
+    def group():
+        even_leds.set(outputs, True)
+
+    return [registers] + [f"{time_updates(function, updates) * 1e6:.1f}"
+                          for function in (per_name, per_pin_tables, group)]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=1000, help="number of group updates per measurement")
+    args = parser.parse_args()
+
+    rows = [bench_registers(registers, args.updates) for registers in (1, 8, 32, 128)]
+    print_table("Setting all even numbered outputs, us per update",
+                ("registers", "per name", "per pin set_value()", "PinGroup.set()"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmarks change-suppressed port copies on a simulated MCP23017.
+
+Description
+-----------
+
+Runs the main loop of port_expander.py for a fixed time with each of
+port_copy(), port_copy_on_change() and port_copy_on_interrupt() while a
+simulated switch toggles at a fixed rate, and reports the loop rate, the I2C
+transactions per second, the transactions per second saved compared to
+port_copy(), and whether the LEDs matched the switches at the end.
+
+Usage: python benchmarks/bench_port_mirror.py [--seconds S] [--toggle-rate HZ]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Runs in real time.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import time
+from bench_common import board, sim_hardware, load_program, print_table
+
+
+# Functions
+def bench_loop(name, seconds, toggle_rate):
+    """Runs one of the port copy functions in a loop and returns a table row."""
+
+    sim_hardware.reset()
+    expander = sim_hardware.MCP23017Model(board.I2C(), 0x20, intb=board.D5)
+    program = load_program("port_expander")
+    program.configure_ports()
+    program.configure_interrupts()
+    function = getattr(program, name)
+
+    before = board.I2C().stats.transactions
+    loops = 0
+    next_toggle = start = time.monotonic()
+    while time.monotonic() - start < seconds:
+        if toggle_rate and time.monotonic() >= next_toggle:
+            expander.set_input(8, not expander.levels & (1 << 8))
+            next_toggle += 1.0 / toggle_rate
+        function()
+        loops += 1
+    transactions = board.I2C().stats.transactions - before
+    function()  # let the last toggle reach the LEDs
+    matched = expander.outputs & 0xFF == program.mcp23017.gpiob
+    return [
+        name,
+        f"{loops / seconds:.0f}",
+        f"{transactions / seconds:.0f}",
+        f"{(2 * loops - transactions) / seconds:.0f}",
+        "yes" if matched else "no",
+    ]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="run time per function")
+    parser.add_argument("--toggle-rate", type=float, default=10, help="switch toggle rate in Hz (0 = idle)")
+    args = parser.parse_args()
+
+    rows = [bench_loop(name, args.seconds, args.toggle_rate)
+            for name in ("port_copy", "port_copy_on_change", "port_copy_on_interrupt")]
+    print_table(f"port_expander.py main loop, switch toggled at {args.toggle_rate:.0f} Hz",
+                ("function", "loops/s", "transactions/s", "saved/s", "LEDs match"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
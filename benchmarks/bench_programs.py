@@ -0,0 +1,132 @@
+"""Benchmarks the example functions of the three programs on simulated hardware.
+
+Description
+-----------
+
+Runs each example function of input_shift_register.py,
+output_shift_register.py and port_expander.py against the host-side simulator
+and reports the average bus transactions, bus bytes, latch toggles, estimated
+bus time and host wall time per call.  This allows the different access
+patterns shown in the programs to be compared with numbers.
+
+Usage: python benchmarks/bench_programs.py [--calls N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- The simulated shift register chains are sized from each program's
+  SHIFT_REGISTERS_NUM constant.
+- The sleep() calls of output_shift_register.py are skipped so that only the
+  I/O work is measured.
+- Bus times are estimates for the configured bus clock rates; wall times are
+  for the host computer and only useful for relative comparisons.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+from bench_common import board, sim_hardware, load_program, measure, measurement_row, print_table, MEASUREMENT_HEADER
+
+
+# Functions
+def bench_input_shift_register(calls):
+    """Benchmarks the input_shift_register.py example functions."""
+
+    sim_hardware.reset()
+    program = load_program("input_shift_register")
+    registers = program.SHIFT_REGISTERS_NUM
+    chain = sim_hardware.Chain74HC165(board.SPI(), board.D5, registers)
+
+    def toggle_input(call):
+        pin = call % (8 * registers)
+        chain.set_input(pin, not chain.inputs[pin // 8] & (1 << (pin % 8)))
+
+    rows = []
+    for function in (program.read_single_inputs,
+                     program.read_single_inputs_with_snapshot,
+                     program.read_inputs_with_binary_values,
+                     program.read_inputs_with_defined_names,
+                     program.read_inputs_with_lookup_tables,
+                     program.read_inputs_with_pin_map,
+                     program.read_and_print_inputs_on_change,
+                     program.read_and_print_debounced_inputs_on_change,
+                     program.print_input_changes,
+                     program.read_inputs_with_console_renderer,
+                     program.print_input_changes_with_console_renderer):
+        rows.append(measurement_row(function.__name__, measure(function, calls, board.D5, toggle_input)))
+    print_table(f"input_shift_register.py ({registers} x 74HC165)", MEASUREMENT_HEADER, rows)
+
+
+def bench_output_shift_register(calls):
+    """Benchmarks the output_shift_register.py example functions."""
+
+    sim_hardware.reset()
+    program = load_program("output_shift_register")
+    registers = program.SHIFT_REGISTERS_NUM
+    sim_hardware.Chain74HC595(board.SPI(), board.D5, registers)
+    program.sleep = lambda seconds: None  # measure I/O work only
+
+    rows = []
+    for function in (program.change_single_outputs,
+                     program.change_single_outputs_with_batch,
+                     program.change_outputs_with_binary_values,
+                     program.change_outputs_with_defined_names,
+                     program.change_outputs_in_place,
+                     program.change_outputs_with_pin_map,
+                     program.cycle_leds):
+        rows.append(measurement_row(function.__name__, measure(function, calls, board.D5)))
+    print_table(f"output_shift_register.py ({registers} x 74HC595)", MEASUREMENT_HEADER, rows)
+
+
+def bench_port_expander(calls):
+    """Benchmarks the port_expander.py example functions."""
+
+    sim_hardware.reset()
+    expander = sim_hardware.MCP23017Model(board.I2C(), 0x20, intb=board.D5)
+    program = load_program("port_expander")
+
+    def toggle_switch(call):
+        pin = 8 + call % 8
+        expander.set_input(pin, not expander.levels & (1 << pin))
+
+    rows = [
+        measurement_row("configure_pins", measure(program.configure_pins, 1)),
+        measurement_row("configure_ports", measure(program.configure_ports, 1)),
+        measurement_row("configure_interrupts", measure(program.configure_interrupts, 1)),
+    ]
+    for function in (program.read_and_write_pin,
+                     program.read_and_write_pin_with_batch,
+                     program.port_copy,
+                     program.port_copy_with_reflex_engine,
+                     program.read_and_write_port_on_input_change,
+                     program.read_and_write_pin_on_input_change):
+        rows.append(measurement_row(function.__name__, measure(function, calls, stimulus=toggle_switch)))
+    print_table("port_expander.py (1 x MCP23017, one switch toggled before every call)", MEASUREMENT_HEADER, rows)
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100, help="number of calls per function")
+    args = parser.parse_args()
+
+    bench_input_shift_register(args.calls)
+    bench_output_shift_register(args.calls)
+    bench_port_expander(args.calls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Benchmarks the reflex engine on simulated mixed hardware.
+
+Description
+-----------
+
+Drives outputs from inputs on a simulated rig of a 74HC165 chain, a 74HC595
+chain, and an MCP23017, using the same three rules with three approaches, and
+reports the bus traffic and host reaction latency percentiles of the updates
+that follow an input change, and the update rate while the inputs are idle.
+
+- Rules: 74HC165 pins 0 - 7 drive 74HC595 pins 8 - 15 inverted, 74HC165 pins
+  8 - 15 drive 74HC595 pins 0 - 7, and MCP23017 port B drives port A.
+- Per-pin: each output's driver value property is set from its input's.
+- VirtualIO: the input pins are read with VirtualIO.read() and the output pins
+  written with VirtualIO.write().
+- ReflexEngine: the compiled rules run by the reflex module.
+
+Usage: python benchmarks/bench_reflex.py [--updates N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- One random input changes before every fourth update.
+- The simulated bus time per reaction is what dominates the latency on a
+  board, e.g. about 1 ms at the 100 kHz I2C clock rate used here.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import random
+import time
+from bench_common import board, sim_hardware, print_table
+import digitalio
+import port_expanders
+import reflex
+import shift_registers
+import virtual_io
+
+
+# Global Constants
+RULES = ((0, 24, 8, True), (8, 16, 8, False), (40, 32, 8, False))
+"""The (input_pin, output_pin, count, invert) rules on the global pins of the
+rig: 74HC165 0 - 15, 74HC595 16 - 31, MCP23017 port A 32 - 39 and port B
+40 - 47."""
+
+
+# Functions
+def wire():
+    """Resets the simulator, connects the rig and returns the models, the
+    virtual I/O space and the driver pins by global pin number."""
+
+    sim_hardware.reset()
+    chain = sim_hardware.Chain74HC165(board.SPI(), board.D5, 2)
+    sim_hardware.Chain74HC595(board.SPI(), board.D6, 2)
+    expander = sim_hardware.MCP23017Model(board.I2C(), 0x20)
+    isr = shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), 2)
+    osr = shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D6), 2)
+    mcp = port_expanders.CachedMCP23017(board.I2C())
+    mcp.iodir = 0xFF00  # port A outputs, port B inputs
+    vio = virtual_io.VirtualIO()
+    vio.add_inputs(isr)
+    vio.add_outputs(osr)
+    vio.add_expander(mcp)
+    pins = [isr.get_pin(pin) for pin in range(16)] + [osr.get_pin(pin) for pin in range(16)] + \
+           [mcp.get_pin(pin) for pin in range(16)]
+    return chain, expander, vio, pins
+
+
+def run(name, make_update, updates):
+    """Runs an approach and returns its table row."""
+
+    chain, expander, vio, pins = wire()
+    update = make_update(vio, pins)
+    update()
+    random.seed(1)
+    latencies = []
+    bus_time = 0.0
+    transactions = 0
+    idle_time = 0.0
+    idle_updates = 0
+    for index in range(updates):
+        changed = index % 4 == 0
+        if changed:
+            pin = random.randrange(24)
+            if pin < 16:
+                chain.set_input(pin, not chain.inputs[pin // 8] & (1 << (pin % 8)))
+            else:
+                expander.set_input(pin - 8, not expander.levels & (1 << (pin - 8)))
+        before = [bus.stats.snapshot() for bus in (board.SPI(), board.I2C())]
+        start = time.perf_counter_ns()
+        update()
+        elapsed = time.perf_counter_ns() - start
+        after = [bus.stats.snapshot() for bus in (board.SPI(), board.I2C())]
+        if changed:
+            latencies.append(elapsed)
+            transactions += sum(a[0] - b[0] for a, b in zip(after, before))
+            bus_time += sum(a[3] - b[3] for a, b in zip(after, before))
+        else:
+            idle_time += elapsed
+            idle_updates += 1
+    latencies.sort()
+    reactions = len(latencies)
+    return [
+        name,
+        f"{transactions / reactions:.1f}",
+        f"{bus_time / reactions * 1e6:.0f}",
+        f"{latencies[reactions // 2] / 1000:.0f}",
+        f"{latencies[min(reactions - 1, reactions * 99 // 100)] / 1000:.0f}",
+        f"{idle_updates / (idle_time / 1e9):.0f}",
+    ]
+
+
+def per_pin(vio, pins):
+    """Returns an update that copies each pin with the driver value properties."""
+
+    pairs = [(pins[input_pin + offset], pins[output_pin + offset], invert)
+             for input_pin, output_pin, count, invert in RULES for offset in range(count)]
+
+    def update():
+        for source, target, invert in pairs:
+            target.value = source.value != invert
+
+    return update
+
+
+def virtual(vio, pins):
+    """Returns an update that copies the pins with VirtualIO read() and write()."""
+
+    sources = [input_pin + offset for input_pin, _, count, _ in RULES for offset in range(count)]
+    targets = [output_pin + offset for _, output_pin, count, _ in RULES for offset in range(count)]
+    inverts = [invert for _, _, count, invert in RULES for _ in range(count)]
+    values = [False] * len(sources)
+
+    def update():
+        vio.read(sources, values)
+        for index, invert in enumerate(inverts):
+            values[index] = values[index] != invert
+        vio.write(targets, values)
+
+    return update
+
+
+def engine(vio, pins):
+    """Returns the update of a reflex engine running the rules."""
+
+    return reflex.ReflexEngine(vio, RULES).update
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=2000, help="number of updates per approach")
+    args = parser.parse_args()
+
+    rows = [run("per-pin", per_pin, args.updates),
+            run("VirtualIO read()/write()", virtual, args.updates),
+            run("ReflexEngine", engine, args.updates)]
+    print_table("Input change to output latch (74HC165 + 74HC595 + MCP23017, 3 rules, 24 pins)",
+                ("approach", "transactions/reaction", "bus time/reaction (us)", "host p50 (us)", "host p99 (us)",
+                 "idle updates/s"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""Benchmarks the change detection examples by replaying recorded bus traces.
+
+Description
+-----------
+
+Records a bus trace of input_shift_register.py and one of port_expander.py
+with their buses and pins hooked by a bus_trace.TraceRecorder, the same as
+tracing_example.py records on a board, while simulated switches chatter, as a
+board in the field would with real switches, and then replays each trace with
+the simulator's sim_replay module against the change detection and polling
+examples of the same program, as fast as possible and at 10 times the
+recorded speed, and the recorded example also at the recorded speed.  Reports
+the replayed events per second, the event latency percentiles and the bus
+transactions per event.
+
+- input_shift_register.py is recorded running read_and_print_inputs_on_change().
+- port_expander.py is recorded running read_and_write_port_on_input_change()
+  with interrupts configured.
+
+Usage: python benchmarks/bench_replay.py [--seconds S] [--rate HZ] [--trace-dir DIR]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Records in real time.
+- Each switch change is a burst of 2 to 6 transitions 0.2 to 1 ms apart, like
+  a bouncing mechanical switch, at random (Poisson) times.
+- Traces from a board can be replayed the same way, as long as they were
+  recorded with the same chain length and MCP23017 address.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import contextlib
+import os
+import random
+import tempfile
+import time
+from bench_common import board, sim_hardware, load_program, print_table, quiet, wrapped_hardware
+import bus_hooks
+import bus_trace
+import lazy
+import sim_replay
+
+
+# Global Constants
+INPUT_FUNCTIONS = ("read_and_print_inputs_on_change", "print_input_changes",
+                   "print_input_changes_with_console_renderer", "read_and_print_debounced_inputs_on_change")
+"""The input_shift_register.py examples replayed, the first one recorded."""
+
+PORT_FUNCTIONS = ("read_and_write_port_on_input_change", "read_and_write_pin_on_input_change",
+                  "read_and_write_pin_from_event_queue", "port_copy_on_interrupt")
+"""The port_expander.py examples replayed, the first one recorded."""
+
+SPEEDS = (None, 10)
+"""The replay speeds of all examples, None being as fast as possible."""
+
+
+# Functions
+def chatter_schedule(seconds, rate, pins, seed=1):
+    """Returns the (time in ns from the start, pin, level) transitions of
+    bouncing switch changes, sorted by time."""
+
+    generator = random.Random(seed)
+    levels = [False] * len(pins)
+    transitions = []
+    moment = 0.0
+    while True:
+        moment += generator.expovariate(rate)
+        if moment >= seconds:
+            break
+        index = generator.randrange(len(pins))
+        levels[index] = not levels[index]
+        bounces = generator.randrange(1, 6)
+        at = moment
+        for bounce in range(bounces + 1):
+            final = bounce == bounces
+            transitions.append((int(at * 1e9), pins[index], levels[index] if final else bounce % 2 == 0))
+            at += generator.uniform(0.0002, 0.001)
+    transitions.sort()
+    return transitions
+
+
+def traced(tracer):
+    """Returns a context manager within which the loaded programs use buses
+    and pins traced by a TraceRecorder, or that does nothing if tracer is
+    None."""
+
+    if tracer is None:
+        return contextlib.nullcontext()
+    hooks = bus_hooks.BusHooks(tracer)
+    return wrapped_hardware(hooks.wrap_spi, hooks.wrap_i2c, hooks.wrap_pin)
+
+
+def load_traced(name, tracer):
+    """Loads a program with its instances created on traced buses and pins."""
+
+    with traced(tracer):
+        program = load_program(name)
+        lazy.resolve_all(program.__dict__)  # create the lazy instances on the traced buses and pins
+    return program
+
+
+def record(tracer, function, set_input, seconds, rate, pins):
+    """Runs a program's example in real time while applying the chatter
+    schedule, recording its bus trace."""
+
+    schedule = chatter_schedule(seconds, rate, pins)
+    start = time.monotonic_ns()
+    end = start + int(seconds * 1e9)
+    position = 0
+    with quiet():
+        while time.monotonic_ns() < end:
+            now = time.monotonic_ns() - start
+            while position < len(schedule) and schedule[position][0] <= now:
+                set_input(schedule[position][1], schedule[position][2])
+                position += 1
+            function()
+    tracer.flush()
+    tracer.stream.close()
+
+
+def wire_input_shift_register(tracer=None):
+    """Resets the simulator, connects the 74HC165 chain and loads the program,
+    tracing its bus and pins with tracer if given."""
+
+    sim_hardware.reset()
+    chain = sim_hardware.Chain74HC165(board.SPI(), board.D5, 1)
+    return load_traced("input_shift_register", tracer), chain
+
+
+def wire_port_expander(tracer=None):
+    """Resets the simulator, connects the MCP23017, loads the program and
+    configures its pins and interrupts, tracing its bus and pins with tracer
+    if given."""
+
+    sim_hardware.reset()
+    expander = sim_hardware.MCP23017Model(board.I2C(), 0x20, intb=board.D5)
+    program = load_traced("port_expander", tracer)
+    program.configure_pins()
+    program.configure_interrupts()
+    return program, expander
+
+
+def replay_row(name, speed, path, wire, model_argument):
+    """Replays a trace against an example and returns its table row."""
+
+    program, model = wire()
+    with open(path, "rb") as file:
+        replay = sim_replay.TraceReplay(file, **{model_argument: model})
+    with quiet():
+        replay.run(getattr(program, name), speed)
+    events = len(replay.latencies)
+    return [
+        name,
+        "max" if speed is None else f"{speed}x",
+        events,
+        f"{replay.events_per_second:.0f}",
+        f"{replay.percentile(50) / 1000:.0f}",
+        f"{replay.percentile(99) / 1000:.0f}",
+        f"{replay.percentile(100) / 1000:.0f}",
+        f"{replay.transactions / max(events, 1):.1f}",
+    ]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="recording time per program")
+    parser.add_argument("--rate", type=float, default=10.0, help="average switch changes per second")
+    parser.add_argument("--trace-dir", default=None, help="directory to keep the traces in, a temporary one if omitted")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = args.trace_dir or temporary
+        os.makedirs(directory, exist_ok=True)
+        input_trace = os.path.join(directory, "input_trace.bin")
+        port_trace = os.path.join(directory, "port_expander_trace.bin")
+
+        tracer = bus_trace.TraceRecorder(open(input_trace, "wb"))
+        program, chain = wire_input_shift_register(tracer)
+        record(tracer, getattr(program, INPUT_FUNCTIONS[0]), chain.set_input, args.seconds, args.rate, range(8))
+        tracer = bus_trace.TraceRecorder(open(port_trace, "wb"))
+        program, expander = wire_port_expander(tracer)
+        record(tracer, getattr(program, PORT_FUNCTIONS[0]), expander.set_input, args.seconds, args.rate,
+               range(8, 16))
+
+        rows = []
+        for names, path, wire, model_argument in ((INPUT_FUNCTIONS, input_trace, wire_input_shift_register, "chain"),
+                                                  (PORT_FUNCTIONS, port_trace, wire_port_expander, "expander")):
+            for name in names:
+                for speed in SPEEDS + ((1,) if name == names[0] else ()):
+                    rows.append(replay_row(name, speed, path, wire, model_argument))
+        sizes = f"{os.path.getsize(input_trace)} and {os.path.getsize(port_trace)} bytes"
+        print_table(f"Trace replay ({args.seconds:.1f} s recordings, {args.rate:.0f} switch changes/s, {sizes})",
+                    ("function", "speed", "events", "events/s", "p50 latency (us)", "p99 latency (us)",
+                     "max latency (us)", "transactions/event"),
+                    rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmarks the drift-free scheduler against the original busy-wait loop.
+
+Description
+-----------
+
+Samples a simulated 74HC165 chain at a fixed rate for a fixed time, once with
+the busy-wait loop originally used by main() in input_shift_register.py
+(which restarts the period from the time each sample actually ran) and once
+with the scheduler module's Scheduler, and reports the achieved sample
+count versus the expected count, the overruns skipped by the scheduler, the
+accumulated drift, the period jitter, and the CPU duty of each.
+
+Usage: python benchmarks/bench_scheduler.py [--rate HZ] [--seconds S]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Runs in real time.
+- The busy-wait loop spins between samples, so its CPU duty is always 100 %.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import time
+from bench_common import board, sim_hardware, print_table
+import digitalio
+import scheduler
+import shift_registers
+
+
+# Functions
+def make_sampler():
+    """Returns a sampling function that reads a simulated chain and records
+    the time of each sample."""
+
+    sim_hardware.reset()
+    sim_hardware.Chain74HC165(board.SPI(), board.D5, 4)
+    isr = shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), 4)
+    times = []
+
+    def sample():
+        times.append(time.monotonic_ns())
+        isr.gpio
+
+    return sample, times
+
+
+def summarize(name, times, rate, seconds, duty, skipped=0):
+    """Returns a table row of timing results for a list of sample times.
+
+    Drift is the offset of the last sample from its nominal time, counting the
+    periods deliberately skipped by the scheduler after overruns.
+    """
+
+    period = 1e9 / rate
+    jitters = [abs(b - a - period) for a, b in zip(times, times[1:])]
+    drift = (times[-1] - times[0]) - (len(times) - 1 + skipped) * period
+    return [
+        name,
+        f"{len(times)} / {int(rate * seconds)}",
+        skipped,
+        f"{abs(drift) / 1e6:.2f}",
+        f"{sum(jitters) / len(jitters) / 1000:.0f}",
+        f"{max(jitters) / 1000:.0f}",
+        f"{duty * 100:.1f}",
+    ]
+
+
+def run_busy_wait(rate, seconds):
+    """Samples with the original busy-wait loop of input_shift_register.py."""
+
+    sample, times = make_sampler()
+    end = time.monotonic() + seconds
+    previous_time = time.monotonic()
+    while True:
+        current_time = time.monotonic()
+        if current_time >= end:
+            break
+        if current_time - previous_time >= 1.0 / rate:
+            sample()
+            previous_time = current_time
+    return summarize("busy-wait loop", times, rate, seconds, 1.0)
+
+
+def run_scheduler(rate, seconds):
+    """Samples with the scheduler."""
+
+    sample, times = make_sampler()
+    sampler = scheduler.Scheduler()
+    sampler.add(sample, 1.0 / rate)
+    sampler.run(seconds)
+    return summarize("Scheduler", times, rate, seconds, sampler.cpu_duty, sampler.tasks[0].overruns)
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=500, help="sample rate in Hz")
+    parser.add_argument("--seconds", type=float, default=2.0, help="run time per approach")
+    args = parser.parse_args()
+
+    rows = [run_busy_wait(args.rate, args.seconds), run_scheduler(args.rate, args.seconds)]
+    print_table(f"Sampling at {args.rate:.0f} Hz for {args.seconds:.1f} s",
+                ("approach", "samples / expected", "overruns", "drift (ms)", "avg jitter (us)", "max jitter (us)",
+                 "CPU duty (%)"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmarks the non-blocking frame sequencer on simulated hardware.
+
+Description
+-----------
+
+Plays the cycle_leds() pattern with the output_sequencer module's
+FrameSequencer while polling a simulated 74HC165 input chain in the same
+loop, and reports the frame timing accuracy, the number of frames written and
+skipped, and the number of input polls the loop managed between frames.
+
+Usage: python benchmarks/bench_sequencer.py [--seconds S] [--frame-time T]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Runs in real time, so each configuration takes the given number of seconds.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import time
+from bench_common import board, sim_hardware, print_table
+import digitalio
+import output_sequencer
+import shift_registers
+
+
+# Functions
+def bench_sequencer(registers, seconds, frame_time):
+    """Plays the cycle pattern for the given time and returns a table row."""
+
+    sim_hardware.reset()
+    chain = sim_hardware.Chain74HC595(board.SPI(), board.D5, registers)
+    sim_hardware.Chain74HC165(board.SPI(), board.D6, registers)
+    osr = shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), registers)
+    isr = shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D6), registers)
+
+    frames = output_sequencer.cycle_frames(registers)
+    sequencer = output_sequencer.FrameSequencer(osr, frames, frame_time, output_sequencer.PING_PONG)
+    polls = 0
+    start = time.monotonic()
+    sequencer.start(start)
+    while time.monotonic() - start < seconds:
+        sequencer.tick(time.monotonic())
+        isr.gpio  # other work: poll the inputs
+        polls += 1
+    return [
+        registers,
+        sequencer.frames_written,
+        sequencer.frames_skipped,
+        chain.latches,
+        f"{sequencer.average_lateness * 1e6:.0f}",
+        f"{sequencer.max_lateness * 1e6:.0f}",
+        f"{polls / seconds:.0f}",
+    ]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0, help="run time per configuration")
+    parser.add_argument("--frame-time", type=float, default=0.01, help="duration of each frame in seconds")
+    args = parser.parse_args()
+
+    rows = [bench_sequencer(registers, args.seconds, args.frame_time) for registers in (1, 4, 16)]
+    print_table(f"FrameSequencer, PING_PONG cycle pattern, {args.frame_time * 1000:.0f} ms frames",
+                ("registers", "frames written", "frames skipped", "latches", "avg lateness (us)",
+                 "max lateness (us)", "input polls/s"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Benchmarks the startup of the three programs with lazy and eager instances.
+
+Description
+-----------
+
+Imports each of input_shift_register.py, output_shift_register.py and
+port_expander.py on simulated hardware and runs a first I/O operation, once
+with the programs' lazy instances left to be created on first use, and once
+with all of them created right after the import with lazy.resolve_all(), as
+the programs did before the lazy module.  Reports the import time, the time
+to the end of the first I/O operation, the bus transactions made by the
+import, and the number of lazy instances still not created after the first
+I/O operation.
+
+Usage: python benchmarks/bench_startup.py [--runs N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- The driver libraries are removed from the import cache before every run so
+  that each run imports them again, as a board does after a reset.
+- Times are medians for the host computer and only useful for relative
+  comparisons; on a board the imports of the driver libraries dominate.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import sys
+import time
+from bench_common import board, sim_hardware, load_program, quiet, print_table
+import lazy
+
+
+# Global Constants
+DRIVER_MODULES = ("adafruit_74hc595", "wws_74hc165", "adafruit_mcp230xx", "adafruit_bus_device", "shift_registers",
+                  "port_expanders")
+"""The prefixes of the module names imported again by every run."""
+
+PROGRAMS = (
+    ("input_shift_register", lambda: sim_hardware.Chain74HC165(board.SPI(), board.D5, 1),
+     lambda program: program.isr.value(0)),
+    ("output_shift_register", lambda: sim_hardware.Chain74HC595(board.SPI(), board.D5, 1),
+     lambda program: program.osr.set_value(0, True)),
+    ("port_expander", lambda: sim_hardware.MCP23017Model(board.I2C(), 0x20),
+     lambda program: program.mcp23017.get_pin(8).value),
+)
+"""The programs as (module name, wiring function, first I/O operation) tuples."""
+
+
+# Functions
+def forget_drivers():
+    """Removes the driver libraries from the import cache."""
+
+    for name in list(sys.modules):
+        if name.split(".")[0] in DRIVER_MODULES:
+            del sys.modules[name]
+
+
+def transactions():
+    """Returns the total number of transactions on both simulated buses."""
+
+    return board.SPI().stats.snapshot()[0] + board.I2C().stats.snapshot()[0]
+
+
+def run(name, wire, first_io, eager):
+    """Starts a program once and returns its (import time, time to first I/O,
+    import transactions, lazy instances left) measurements."""
+
+    sim_hardware.reset()
+    wire()
+    forget_drivers()
+    before = transactions()
+    start = time.perf_counter_ns()
+    with quiet():
+        program = load_program(name)
+        if eager:
+            lazy.resolve_all(program.__dict__)
+    imported = time.perf_counter_ns()
+    import_transactions = transactions() - before
+    first_io(program)
+    done = time.perf_counter_ns()
+    left = sum(isinstance(obj, lazy.LazyInstance) for obj in program.__dict__.values())
+    return imported - start, done - start, import_transactions, left
+
+
+def median(values):
+    """Returns the median of a list of numbers."""
+
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="number of startups per program and mode")
+    args = parser.parse_args()
+
+    rows = []
+    for name, wire, first_io in PROGRAMS:
+        for eager in (True, False):
+            results = [run(name, wire, first_io, eager) for _ in range(args.runs)]
+            rows.append([
+                name,
+                "eager" if eager else "lazy",
+                f"{median([result[0] for result in results]) / 1000:.0f}",
+                f"{median([result[1] for result in results]) / 1000:.0f}",
+                results[-1][2],
+                results[-1][3],
+            ])
+    print_table("Program startup: import and first I/O operation",
+                ("program", "instances", "import (us)", "first I/O (us)", "import transactions", "instances left"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
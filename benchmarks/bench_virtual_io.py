@@ -0,0 +1,134 @@
+"""Benchmarks the virtual I/O space on simulated mixed hardware.
+
+Description
+-----------
+
+Reads and writes sets of pins, in random order, spread across two 74HC165
+chains, two 74HC595 chains, and two MCP23017s, once with each driver's
+per-pin value property and once with the virtual_io module's VirtualIO read()
+and write(), and reports the bus transactions, bytes and bus time per
+operation.
+
+- Read: pins of the 74HC165 inputs and the MCP23017 port B inputs.
+- Write: pins of the 74HC595 outputs and the MCP23017 port A outputs.
+
+Usage: python benchmarks/bench_virtual_io.py [--operations N]
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Each 74HC165 and 74HC595 chain has 2 registers.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import argparse
+import random
+from bench_common import board, sim_hardware, measure, print_table
+import digitalio
+import port_expanders
+import shift_registers
+import virtual_io
+
+
+# Functions
+def operation_row(name, result):
+    """Formats a measure() result as a table row."""
+
+    return [
+        name,
+        f"{result['transactions']:.1f}",
+        f"{result['bytes']:.1f}",
+        f"{result['bus_time'] * 1e6:.0f}",
+        f"{result['wall_time'] * 1e6:.0f}",
+    ]
+
+
+def wire():
+    """Resets the simulator, connects the hardware and returns the virtual I/O
+    space with lists of its input and output pins as (global pin number, driver
+    pin) tuples."""
+
+    sim_hardware.reset()
+    sim_hardware.Chain74HC165(board.SPI(), board.D5, 2)
+    sim_hardware.Chain74HC165(board.SPI(), board.D6, 2)
+    sim_hardware.Chain74HC595(board.SPI(), board.D9, 2)
+    sim_hardware.Chain74HC595(board.SPI(), board.D10, 2)
+    sim_hardware.MCP23017Model(board.I2C(), 0x20)
+    sim_hardware.MCP23017Model(board.I2C(), 0x21)
+
+    vio = virtual_io.VirtualIO()
+    inputs = []
+    outputs = []
+    for latch in (board.D5, board.D6):
+        isr = shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(latch), 2)
+        first = vio.add_inputs(isr)
+        inputs += [(first + pin, isr.get_pin(pin)) for pin in range(16)]
+    for latch in (board.D9, board.D10):
+        osr = shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(latch), 2)
+        first = vio.add_outputs(osr)
+        outputs += [(first + pin, osr.get_pin(pin)) for pin in range(16)]
+    for address in (0x20, 0x21):
+        mcp = port_expanders.CachedMCP23017(board.I2C(), address=address)
+        mcp.iodir = 0xFF00  # port A outputs, port B inputs
+        first = vio.add_expander(mcp)
+        inputs += [(first + pin, mcp.get_pin(pin)) for pin in range(8, 16)]
+        outputs += [(first + pin, mcp.get_pin(pin)) for pin in range(8)]
+    return vio, inputs, outputs
+
+
+def main():
+    """Main program entry."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=100, help="number of operations per measurement")
+    args = parser.parse_args()
+
+    vio, inputs, outputs = wire()
+    random.seed(1)
+    rows = []
+    for pins_num in (4, 16, 48):
+        read_pins = random.sample(inputs, pins_num)
+        write_pins = random.sample(outputs, pins_num)
+        values = [random.random() < 0.5 for _ in range(pins_num)]
+        read_globals = [pin for pin, _ in read_pins]
+        write_globals = [pin for pin, _ in write_pins]
+        read_values = [False] * pins_num
+
+        def per_pin_read():
+            for position, (_, pin) in enumerate(read_pins):
+                read_values[position] = pin.value
+
+        def per_pin_write():
+            for position, (_, pin) in enumerate(write_pins):
+                pin.value = values[position]
+            values.reverse()  # change the outputs every operation
+
+        def virtual_write():
+            vio.write(write_globals, values)
+            values.reverse()  # change the outputs every operation
+
+        rows.append(operation_row(f"read {pins_num} pins, per-pin value", measure(per_pin_read, args.operations)))
+        rows.append(operation_row(f"read {pins_num} pins, VirtualIO.read()",
+                                  measure(lambda: vio.read(read_globals, read_values), args.operations)))
+        rows.append(operation_row(f"write {pins_num} pins, per-pin value", measure(per_pin_write, args.operations)))
+        rows.append(operation_row(f"write {pins_num} pins, VirtualIO.write()",
+                                  measure(virtual_write, args.operations)))
+    print_table("Mixed hardware: 2 x 74HC165 chain, 2 x 74HC595 chain, 2 x MCP23017 (random pin order)",
+                ("operation", "transactions", "bytes", "bus time (us)", "wall time (us)"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Pluggable per-transaction hooks on wrapped SPI and I2C buses and pins.
+
+Description
+-----------
+
+A CircuitPython module that wraps the SPI bus, I2C bus and DigitalInOut pins
+used by the shift register and port expander drivers and calls the registered
+hooks, e.g. an instrumentation.Profiler or a bus_trace.TraceRecorder, after
+every bus transaction, with the bytes written and read, and on every level
+transition of the wrapped pins.  Each bus or pin is wrapped once, whatever
+number of hooks observe it.
+
+A hook is any object with an enabled attribute and the following methods:
+
+- transaction(kind, address, written, read, start): called after a bus
+  transaction, where kind is one of the transaction kinds below, address is
+  the I2C address (None for SPI), written and read are memoryviews of the
+  bytes written and read (None if not applicable), and start is the
+  time.monotonic_ns() value at the start of the transaction.
+- pin_added(pin_id, name): called once for every wrapped pin, where pin_id is
+  the number of the pin, counting from 0 in wrapping order, and name is its
+  name, e.g. "mcp23017_intb".
+- pin_changed(pin_id, level, written): called on a level transition of a
+  wrapped pin, where written is True if the pin was written and False if a
+  read returned a different level than the previous read.
+
+When no enabled hooks are registered, the wrap methods return the original
+objects unchanged, so the hooks cost nothing unless one of them is enabled.
+
+Libraries/Modules
+-----------------
+
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic_ns function.
+
+Notes
+-----
+
+- Register the hooks before wrapping the buses and pins passed to the drivers.
+  A hook registered later observes the buses and pins wrapped earlier, but a
+  bus or pin wrapped while no hooks were enabled is never observed.
+- Input pin transitions are only seen when the pin is read, so input pulses
+  shorter than the polling interval are not seen.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import time
+
+
+# Global Constants
+SPI_WRITE = 0
+"""Transaction kind of an SPI write."""
+
+SPI_READ = 1
+"""Transaction kind of an SPI read."""
+
+SPI_TRANSFER = 2
+"""Transaction kind of a simultaneous SPI write and read."""
+
+I2C_WRITE = 3
+"""Transaction kind of an I2C write."""
+
+I2C_READ = 4
+"""Transaction kind of an I2C read."""
+
+I2C_WRITE_READ = 5
+"""Transaction kind of an I2C write followed by a read after a repeated
+start."""
+
+
+# Classes
+class BusHooks:
+    """Wraps buses and pins so that their transactions and transitions are
+    passed to the registered hooks.
+
+    Example::
+
+        profiler = instrumentation.Profiler(enabled=PROFILING)
+        tracer = bus_trace.TraceRecorder(open("/bus_trace.bin", "wb"))
+        hooks = BusHooks(profiler, tracer)
+        isr = ShiftRegister74HC165(hooks.wrap_spi(board.SPI()),
+                                   hooks.wrap_pin(DigitalInOut(board.D5), "isr_latch_pin"))
+
+    :param: hooks The hooks to register, disabled ones are ignored.
+    """
+
+    def __init__(self, *hooks):
+        self.hooks = []   # the enabled hooks, shared with the wrapped buses and pins
+        self._names = []  # the names of the wrapped pins by pin id
+        for hook in hooks:
+            self.add(hook)
+
+    def add(self, hook):
+        """Registers a hook, unless it is disabled.
+
+        :param: hook The hook, e.g. an instrumentation.Profiler instance.
+        """
+
+        if not hook.enabled or hook in self.hooks:
+            return
+        self.hooks.append(hook)
+        for pin_id, name in enumerate(self._names):
+            hook.pin_added(pin_id, name)
+
+    def wrap_spi(self, spi):
+        """Returns a hooked SPI bus, or the bus itself without enabled hooks.
+
+        :param: spi The busio.SPI instance.
+        """
+
+        return HookedSPI(spi, self.hooks) if self.hooks else spi
+
+    def wrap_i2c(self, i2c):
+        """Returns a hooked I2C bus, or the bus itself without enabled hooks.
+
+        :param: i2c The busio.I2C instance.
+        """
+
+        return HookedI2C(i2c, self.hooks) if self.hooks else i2c
+
+    def wrap_pin(self, pin, name=None):
+        """Returns a hooked DigitalInOut, or the DigitalInOut itself without
+        enabled hooks.
+
+        :param: pin  The digitalio.DigitalInOut instance.
+        :param: name The name of the pin, e.g. "mcp23017_intb", defaults to
+                     "pin <pin id>".
+
+        :return: The pin to use instead.
+        """
+
+        if not self.hooks:
+            return pin
+        if len(self._names) == 256:
+            raise ValueError("No more than 256 pins can be hooked.")
+        pin_id = len(self._names)
+        name = name if name is not None else f"pin {pin_id}"
+        self._names.append(name)
+        for hook in self.hooks:
+            hook.pin_added(pin_id, name)
+        return HookedPin(pin, self.hooks, pin_id)
+
+
+class HookedSPI:
+    """An SPI bus that passes its transactions to hooks.
+
+    :param: spi   The busio.SPI instance.
+    :param: hooks The list of hooks.
+    """
+
+    def __init__(self, spi, hooks):
+        self._spi = spi
+        self._hooks = hooks
+
+    def __getattr__(self, name):
+        return getattr(self._spi, name)  # try_lock(), unlock(), configure(), etc.
+
+    def write(self, buffer, *, start=0, end=None):
+        """Writes the bytes of buffer, see busio.SPI.write()."""
+
+        if end is None:  # the core busio module only accepts an int
+            end = len(buffer)
+        begin = time.monotonic_ns()
+        self._spi.write(buffer, start=start, end=end)
+        written = memoryview(buffer)[start:end]
+        for hook in self._hooks:
+            hook.transaction(SPI_WRITE, None, written, None, begin)
+
+    def readinto(self, buffer, *, start=0, end=None, write_value=0):
+        """Reads into buffer, see busio.SPI.readinto()."""
+
+        if end is None:  # the core busio module only accepts an int
+            end = len(buffer)
+        begin = time.monotonic_ns()
+        self._spi.readinto(buffer, start=start, end=end, write_value=write_value)
+        read = memoryview(buffer)[start:end]
+        for hook in self._hooks:
+            hook.transaction(SPI_READ, None, None, read, begin)
+
+    def write_readinto(self, out_buffer, in_buffer, *, out_start=0, out_end=None, in_start=0, in_end=None):
+        """Writes and reads at the same time, see busio.SPI.write_readinto()."""
+
+        if out_end is None:  # the core busio module only accepts ints
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        begin = time.monotonic_ns()
+        self._spi.write_readinto(out_buffer, in_buffer, out_start=out_start, out_end=out_end,
+                                 in_start=in_start, in_end=in_end)
+        written = memoryview(out_buffer)[out_start:out_end]
+        read = memoryview(in_buffer)[in_start:in_end]
+        for hook in self._hooks:
+            hook.transaction(SPI_TRANSFER, None, written, read, begin)
+
+
+class HookedI2C:
+    """An I2C bus that passes its transactions to hooks.
+
+    :param: i2c   The busio.I2C instance.
+    :param: hooks The list of hooks.
+    """
+
+    def __init__(self, i2c, hooks):
+        self._i2c = i2c
+        self._hooks = hooks
+
+    def __getattr__(self, name):
+        return getattr(self._i2c, name)  # try_lock(), unlock(), scan(), etc.
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        """Writes to a device, see busio.I2C.writeto()."""
+
+        if end is None:  # the core busio module only accepts an int
+            end = len(buffer)
+        begin = time.monotonic_ns()
+        self._i2c.writeto(address, buffer, start=start, end=end)
+        written = memoryview(buffer)[start:end]
+        for hook in self._hooks:
+            hook.transaction(I2C_WRITE, address, written, None, begin)
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        """Reads from a device, see busio.I2C.readfrom_into()."""
+
+        if end is None:  # the core busio module only accepts an int
+            end = len(buffer)
+        begin = time.monotonic_ns()
+        self._i2c.readfrom_into(address, buffer, start=start, end=end)
+        read = memoryview(buffer)[start:end]
+        for hook in self._hooks:
+            hook.transaction(I2C_READ, address, None, read, begin)
+
+    def writeto_then_readfrom(self, address, out_buffer, in_buffer, *, out_start=0, out_end=None, in_start=0,
+                              in_end=None):
+        """Writes to and then reads from a device, see
+        busio.I2C.writeto_then_readfrom()."""
+
+        if out_end is None:  # the core busio module only accepts ints
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        begin = time.monotonic_ns()
+        self._i2c.writeto_then_readfrom(address, out_buffer, in_buffer, out_start=out_start, out_end=out_end,
+                                        in_start=in_start, in_end=in_end)
+        written = memoryview(out_buffer)[out_start:out_end]
+        read = memoryview(in_buffer)[in_start:in_end]
+        for hook in self._hooks:
+            hook.transaction(I2C_WRITE_READ, address, written, read, begin)
+
+
+class HookedPin:
+    """A DigitalInOut that passes its level transitions to hooks.
+
+    :param: pin    The digitalio.DigitalInOut instance.
+    :param: hooks  The list of hooks.
+    :param: pin_id The id of the pin.
+    """
+
+    def __init__(self, pin, hooks, pin_id):
+        self._pin = pin
+        self._hooks = hooks
+        self._id = pin_id
+        self._level = None  # the last level written or read
+
+    def __getattr__(self, name):
+        return getattr(self._pin, name)  # switch_to_input(), deinit(), etc.
+
+    def _observe(self, level, written):
+        # Pass a transition of the known level to the hooks
+        level = bool(level)
+        if level != self._level:
+            self._level = level
+            for hook in self._hooks:
+                hook.pin_changed(self._id, level, written)
+
+    def switch_to_output(self, value=False, **kwargs):
+        """Switches the pin to an output, see DigitalInOut.switch_to_output()."""
+
+        self._pin.switch_to_output(value=value, **kwargs)
+        self._observe(value, True)
+
+    @property
+    def value(self):
+        """The value of the pin."""
+
+        level = self._pin.value
+        self._observe(level, False)
+        return level
+
+    @value.setter
+    def value(self, val):
+        self._pin.value = val
+        self._observe(val, True)
+
+    @property
+    def direction(self):
+        """The direction of the pin."""
+
+        return self._pin.direction
+
+    @direction.setter
+    def direction(self, val):
+        self._pin.direction = val
+
+    @property
+    def pull(self):
+        """The pull of the pin."""
+
+        return self._pin.pull
+
+    @pull.setter
+    def pull(self, val):
+        self._pin.pull = val
@@ -0,0 +1,312 @@
+"""Timestamped SPI, I2C and pin transition trace recording.
+
+Description
+-----------
+
+A CircuitPython module that records every transaction on the SPI and I2C buses
+used by the shift register and port expander drivers, with the bytes written
+and read, and every level transition of their pins, e.g. the 74HC165 SH/LD
+latch or the MCP23017 INTB pin, into a compact binary trace.  A trace
+recorded on a board captures the input patterns seen in the field, e.g. switch
+chatter or bursts of changes, which the simulator's sim_replay module replays
+against the programs on a host computer without any hardware.
+
+A TraceRecorder is a bus_hooks hook: register it with a bus_hooks.BusHooks
+instance, which wraps the buses and pins passed to the drivers.  When a
+TraceRecorder has no stream, it is disabled and the BusHooks instance ignores
+it, so tracing costs nothing unless it is enabled.
+
+Trace format:
+
+- Header: the MAGIC bytes followed by a 1 byte VERSION.
+- Records: a 1 byte record kind and the time since the previous record in us
+  as a varint (from the creation of the recorder for the first record),
+  followed by the kind's fields, where data is a varint number of bytes
+  followed by the bytes themselves.  The kinds of bus records are the
+  bus_hooks transaction kinds.
+
+    - SPI_WRITE: the data written.
+    - SPI_READ: the data read.
+    - SPI_TRANSFER: the data written, then the data read.
+    - I2C_WRITE: the 1 byte address, then the data written.
+    - I2C_READ: the 1 byte address, then the data read.
+    - I2C_WRITE_READ: the 1 byte address, the data written, then the data
+      read.
+    - PIN_LEVEL: the 1 byte pin id, then the 1 byte new level.
+    - PIN_NAME: the 1 byte pin id, then the UTF-8 name as data.
+
+Varints are unsigned LEB128, 7 bits per byte with the high bit set on all but
+the last byte.
+
+Libraries/Modules
+-----------------
+
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic_ns function.
+- bus_hooks Module (this repository)
+    - Provides the transaction kinds used as the bus record kinds.
+
+Notes
+-----
+
+- Records are collected in a preallocated buffer, which is written to the
+  stream when it is nearly full or flush_period seconds after the last
+  write, so the records of the last moments before a reset are lost unless
+  flush() is called.
+- A record takes a few bytes plus its data, e.g. 4 bytes for a single byte
+  74HC165 read, but polling loops record every poll, so the trace grows with
+  the polling rate even while the inputs are idle.
+- Use a separate BusHooks instance for each TraceRecorder, since the pin ids
+  in the trace are the ids assigned by the BusHooks instance.
+- Output pin transitions are recorded when written, input pin transitions
+  when a read returns a different level than the previous read, so input
+  pulses shorter than the polling interval are not recorded.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import time
+from bus_hooks import SPI_WRITE, SPI_READ, SPI_TRANSFER, I2C_WRITE, I2C_READ, I2C_WRITE_READ
+
+
+# Global Constants
+MAGIC = b"WWBT"
+"""The bytes identifying a bus trace."""
+
+VERSION = 1
+"""The version of the trace format."""
+
+PIN_LEVEL = 6
+"""Record kind of a pin level transition."""
+
+PIN_NAME = 7
+"""Record kind of the name of a wrapped pin."""
+
+_RECORD_SPACE = 24
+"""The buffer space kept free for the fixed size fields of a record."""
+
+
+# Functions
+def _read_varint(stream):
+    # Read an unsigned LEB128 varint, or return None at the end of the stream
+    value = 0
+    shift = 0
+    while True:
+        data = stream.read(1)
+        if not data:
+            return None
+        value |= (data[0] & 0x7F) << shift
+        if not data[0] & 0x80:
+            return value
+        shift += 7
+
+
+def _read_data(stream):
+    # Read a varint length followed by that many bytes
+    return stream.read(_read_varint(stream))
+
+
+def read_trace(stream):
+    """Decodes a trace.
+
+    :param: stream The stream to read from, e.g. a file opened in binary mode.
+
+    :return: A generator of (time, kind, target, written, read) tuples, where
+             time is in us since the start of the trace, target is the I2C
+             address or the pin name (None for SPI records), written and read
+             are the bytes written and read (None if not applicable), and
+             read is the new level (True or False) for PIN_LEVEL records.
+    """
+
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Stream is not a bus trace.")
+    if stream.read(1)[0] != VERSION:
+        raise ValueError("Unsupported bus trace version.")
+    names = {}
+    timestamp = 0
+    while True:
+        kind = stream.read(1)
+        if not kind:
+            return
+        kind = kind[0]
+        timestamp += _read_varint(stream)
+        if kind == SPI_WRITE:
+            yield timestamp, kind, None, _read_data(stream), None
+        elif kind == SPI_READ:
+            yield timestamp, kind, None, None, _read_data(stream)
+        elif kind == SPI_TRANSFER:
+            written = _read_data(stream)
+            yield timestamp, kind, None, written, _read_data(stream)
+        elif kind == I2C_WRITE:
+            yield timestamp, kind, stream.read(1)[0], _read_data(stream), None
+        elif kind == I2C_READ:
+            yield timestamp, kind, stream.read(1)[0], None, _read_data(stream)
+        elif kind == I2C_WRITE_READ:
+            address = stream.read(1)[0]
+            written = _read_data(stream)
+            yield timestamp, kind, address, written, _read_data(stream)
+        elif kind == PIN_LEVEL:
+            pin_id, level = stream.read(2)
+            yield timestamp, kind, names.get(pin_id, f"pin {pin_id}"), None, bool(level)
+        elif kind == PIN_NAME:
+            pin_id = stream.read(1)[0]
+            names[pin_id] = str(_read_data(stream), "utf-8")
+        else:
+            raise ValueError(f"Unknown bus trace record kind {kind}.")
+
+
+# Classes
+class TraceRecorder:
+    """Records bus transactions and pin transitions into a trace.
+
+    Example::
+
+        tracer = TraceRecorder(open("/bus_trace.bin", "wb"))
+        hooks = bus_hooks.BusHooks(tracer)
+        isr = ShiftRegister74HC165(hooks.wrap_spi(board.SPI()),
+                                   hooks.wrap_pin(DigitalInOut(board.D5), "isr_latch_pin"))
+
+    :param: stream       The stream the trace is written to, e.g. a file opened
+                         in binary mode, or None to record nothing.
+    :param: buffer_size  The size of the record buffer in bytes.
+    :param: flush_period The longest time records are held in the buffer, in
+                         seconds.
+    """
+
+    def __init__(self, stream=None, buffer_size=1024, flush_period=1.0):
+        self.stream = stream
+        self.enabled = stream is not None
+        self._buffer = bytearray(max(buffer_size, 2 * _RECORD_SPACE))
+        self._length = 0                          # number of buffered bytes
+        self._flush_period = int(flush_period * 1e9)  # in ns
+        self._flushed = time.monotonic_ns()       # time of the last write to the stream, in ns
+        self._previous = self._flushed // 1000    # time of the previous record, in us
+        self.records = 0                          # number of records
+        self.written = 0                          # number of bytes written to the stream
+        if self.enabled:
+            self._buffer[0:len(MAGIC)] = MAGIC
+            self._buffer[len(MAGIC)] = VERSION
+            self._length = len(MAGIC) + 1
+
+    def _add_varint(self, value):
+        # Append an unsigned LEB128 varint to the buffer
+        buffer = self._buffer
+        length = self._length
+        while value > 0x7F:
+            buffer[length] = (value & 0x7F) | 0x80
+            value >>= 7
+            length += 1
+        buffer[length] = value
+        self._length = length + 1
+
+    def begin(self, kind, address=None):
+        """Starts a record.
+
+        :param: kind    The record kind, e.g. SPI_WRITE.
+        :param: address The I2C address, or None for SPI and pin records.
+        """
+
+        if self._length > len(self._buffer) - _RECORD_SPACE:
+            self.flush()
+        now = time.monotonic_ns() // 1000
+        self._buffer[self._length] = kind
+        self._length += 1
+        self._add_varint(now - self._previous)
+        self._previous = now
+        if address is not None:
+            self._buffer[self._length] = address
+            self._length += 1
+
+    def add_data(self, data):
+        """Adds the length and bytes of a record's data.
+
+        :param: data The bytes, e.g. a memoryview of a transfer buffer.
+        """
+
+        self._add_varint(len(data))
+        if len(data) > len(self._buffer) - _RECORD_SPACE - self._length:
+            self.flush()
+            if len(data) > len(self._buffer) - _RECORD_SPACE:
+                self.stream.write(data)  # too long for the buffer
+                self.written += len(data)
+                return
+        self._buffer[self._length:self._length + len(data)] = data
+        self._length += len(data)
+
+    def end(self):
+        """Ends a record, writing the buffer to the stream if it is nearly full
+        or was last written more than flush_period ago."""
+
+        self.records += 1
+        if self._length > len(self._buffer) - 2 * _RECORD_SPACE or \
+                time.monotonic_ns() - self._flushed >= self._flush_period:
+            self.flush()
+
+    def transaction(self, kind, address, written, read, start):
+        """Records a bus transaction, see bus_hooks.
+
+        :param: kind    The transaction kind, e.g. bus_hooks.SPI_WRITE.
+        :param: address The I2C address, or None for SPI.
+        :param: written The bytes written, or None.
+        :param: read    The bytes read, or None.
+        :param: start   The time.monotonic_ns() value at the start of the
+                        transaction, unused since records are timestamped at
+                        their end.
+        """
+
+        self.begin(kind, address)
+        if written is not None:
+            self.add_data(written)
+        if read is not None:
+            self.add_data(read)
+        self.end()
+
+    def pin_added(self, pin_id, name):
+        """Records the name of a wrapped pin, see bus_hooks.
+
+        :param: pin_id The id of the pin.
+        :param: name   The name of the pin in the trace, e.g. "mcp23017_intb".
+        """
+
+        self.begin(PIN_NAME)
+        self._buffer[self._length] = pin_id
+        self._length += 1
+        self.add_data(bytes(name, "utf-8"))
+        self.end()
+
+    def pin_changed(self, pin_id, level, written):
+        """Records a pin level transition, see bus_hooks.
+
+        :param: pin_id  The id of the pin.
+        :param: level   The new level.
+        :param: written Whether the pin was written, unused.
+        """
+
+        self.begin(PIN_LEVEL)
+        self._buffer[self._length] = pin_id
+        self._buffer[self._length + 1] = 1 if level else 0
+        self._length += 2
+        self.end()
+
+    def flush(self):
+        """Writes the buffered records to the stream."""
+
+        if self._length:
+            self.stream.write(memoryview(self._buffer)[:self._length])
+            self.written += self._length
+            self._length = 0
+        if hasattr(self.stream, "flush"):
+            self.stream.flush()
+        self._flushed = time.monotonic_ns()
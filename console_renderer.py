@@ -0,0 +1,154 @@
+"""Table-driven console rendering of input and output states.
+
+Description
+-----------
+
+A CircuitPython module that renders the states of shift register or I/O
+expander pins to the console from precomputed text, instead of formatting
+every value with an f-string and printing it with a separate print() call.
+
+- Binary frames, e.g. "Inputs: 00000101 10000000 ", are built from a 256 entry
+  byte to binary string lookup table.
+- Pin lines, e.g. "Input A = True", are looked up from the two complete lines
+  of each labelled pin, prepared once from a label template, and either all
+  lines or only the lines of the pins that changed since the previous
+  rendering are written.
+
+Either way, the whole frame is joined and written to the console with a single
+write.
+
+Libraries/Modules
+-----------------
+
+- sys Standard Library
+    - https://docs.python.org/3/library/sys.html
+    - Access to the stdout console stream.
+- input_edges Module (this repository)
+    - Provides the lowest set bit lookup table for finding changed pins.
+
+Notes
+-----
+
+- On a serial console, every write has a fixed cost on top of the time to send
+  its characters, so writing each frame at once, and only the changed lines,
+  is what raises the achievable sample rate.
+- The tables take 256 strings of 8 characters, plus two lines per labelled pin.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import sys
+import input_edges
+
+
+# Global Constants
+BINARY = tuple(f"{value:08b}" for value in range(256))
+"""Lookup table of the 8 character binary string of each byte value."""
+
+
+# Classes
+class ConsoleRenderer:
+    """Renders the pin values of a sample, e.g. a shift register's gpio value,
+    to the console.
+
+    Example::
+
+        renderer = ConsoleRenderer(1, ["Input A", "Input B"])
+        renderer.render_binary(isr.gpio)              # Inputs: 00000010
+        renderer.render_lines(isr.gpio, changed=True)  # Input B = True
+
+    :param: number_of_shift_registers The number of bytes of each sample.
+    :param: labels                    The labels of pins 0, 1, 2, ... to render
+                                      as lines, or None for none.
+    :param: template                  The format of a pin line, with the label
+                                      and value fields.
+    :param: prefix                    The text preceding a binary frame.
+    :param: stream                    The stream written to, or None for the
+                                      console (sys.stdout).
+    """
+
+    def __init__(self, number_of_shift_registers=1, labels=None, template="{label} = {value}",
+                 prefix="Inputs: ", stream=None):
+        labels = labels or []
+        if len(labels) > 8 * number_of_shift_registers:
+            raise ValueError(f"Labels must not exceed {8 * number_of_shift_registers} pins.")
+        self._lines = [(template.format(label=label, value=False) + "\n",
+                        template.format(label=label, value=True) + "\n") for label in labels]  # low and high lines
+        self._prefix = prefix
+        self._parts = [""] * max(2 * number_of_shift_registers + 2, len(labels) + 1)  # preallocated frame parts
+        self.previous = bytearray(number_of_shift_registers)  # the sample of the last rendered lines
+        self._forced = True   # whether the next changed-only rendering writes all lines
+        self.stream = stream  # None writes to the current sys.stdout
+        self.writes = 0       # number of frames written
+
+    def _write(self, count):
+        # Writes the first count parts as a single frame
+        parts = self._parts
+        (sys.stdout if self.stream is None else self.stream).write("".join(parts[:count]))
+        self.writes += 1
+
+    def render_binary(self, sample):
+        """Writes all pin values in binary format, separated into bytes, as a
+        single line.
+
+        :param: sample The pin values, with pin 0 as bit 0 of the first byte.
+        """
+
+        parts = self._parts
+        parts[0] = self._prefix
+        count = 1
+        for byte in sample:
+            parts[count] = BINARY[byte]
+            parts[count + 1] = " "
+            count += 2
+        parts[count] = "\n"
+        self._write(count + 1)
+
+    def render_lines(self, sample, changed=False):
+        """Writes the line of each labelled pin, followed by an empty line.
+
+        :param: sample  The pin values, with pin 0 as bit 0 of the first byte.
+        :param: changed True to write only the lines of the pins that changed
+                        since the previous call, and nothing if none did.
+
+        :return: The number of lines written, excluding the empty line.
+        """
+
+        previous = self.previous
+        if changed and not self._forced and sample == previous:  # fast path for unchanged pins
+            return 0
+        parts = self._parts
+        lines = self._lines
+        count = 0
+        if changed and not self._forced:  # only the changed bits of the changed bytes
+            lowest_bit = input_edges.LOWEST_BIT
+            for byte in range(len(previous)):
+                difference = sample[byte] ^ previous[byte]
+                while difference:
+                    bit = lowest_bit[difference]
+                    pin = 8 * byte + bit
+                    if pin < len(lines):
+                        parts[count] = lines[pin][(sample[byte] >> bit) & 1]
+                        count += 1
+                    difference &= difference - 1  # clear the lowest set bit
+        else:
+            for pin in range(len(lines)):
+                parts[count] = lines[pin][(sample[pin >> 3] >> (pin & 7)) & 1]
+                count += 1
+        previous[:] = sample
+        self._forced = False
+        if count:
+            parts[count] = "\n"
+            self._write(count + 1)
+        return count
@@ -0,0 +1,125 @@
+"""Bit-parallel debouncer for 74HC165 inputs.
+
+Description
+-----------
+
+A CircuitPython module that debounces all of the inputs of a 74HC165 shift
+register chain at once using vertical counters.  Instead of keeping a counter
+object per input, bit n of every counter is stored in one byte per shift
+register, so the counters of all eight inputs of a shift register are updated
+together with a few bitwise operations per sample.
+
+An input's debounced (stable) value only changes after the raw input has
+differed from it for the configured number of consecutive samples.
+
+Notes
+-----
+
+- All state is kept in preallocated bytearrays; update() does not allocate.
+- Bytes whose inputs all match their stable values and have no counts pending,
+  the common case, are skipped after a single comparison.
+- The counters are as wide as needed for the sample count, e.g. 2 bits for up
+  to 3 samples and 3 bits for up to 7 samples.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Classes
+class Debouncer:
+    """Debounces the inputs of a shift register chain with vertical counters.
+
+    :param: number_of_shift_registers The number of daisy chained 74HC165s.
+    :param: samples                   The number of consecutive samples an input
+                                      must differ from its stable value before
+                                      the stable value changes.
+    """
+
+    def __init__(self, number_of_shift_registers=1, samples=4):
+        if samples < 1:
+            raise ValueError("Samples must be at least 1.")
+        self.samples = samples
+        self.stable = bytearray(number_of_shift_registers)   # debounced input values
+        self.changed = bytearray(number_of_shift_registers)  # inputs whose stable value changed in the last update
+        self._bits = samples.bit_length()
+        self._counters = [bytearray(number_of_shift_registers) for _ in range(self._bits)]  # bit planes of the counters
+        self._counting = bytearray(number_of_shift_registers)  # inputs with a nonzero counter
+
+    def reset(self, sample=None):
+        """Clears the counters and sets the stable values.
+
+        :param: sample The raw inputs to use as the stable values, or None for
+                       all low.
+        """
+
+        for counter in self._counters:
+            for byte in range(len(counter)):
+                counter[byte] = 0
+        for byte in range(len(self.stable)):
+            self.stable[byte] = sample[byte] if sample is not None else 0
+            self.changed[byte] = 0
+            self._counting[byte] = 0
+
+    def update(self, sample):
+        """Adds a sample of the raw inputs.
+
+        :param: sample The raw inputs, e.g. the shift register's gpio value.
+
+        :return: True if the stable value of any input changed.
+        """
+
+        counters = self._counters
+        bits = self._bits
+        samples = self.samples
+        stable = self.stable
+        changed = self.changed
+        counting = self._counting
+        any_changed = False
+        for byte in range(len(stable)):
+            delta = sample[byte] ^ stable[byte]  # inputs differing from their stable value
+            if not delta:  # fast path for bytes with all inputs stable
+                changed[byte] = 0
+                if counting[byte]:
+                    for bit in range(bits):
+                        counters[bit][byte] = 0
+                    counting[byte] = 0
+                continue
+            # Increment the counters of differing inputs and clear the others
+            carry = delta
+            reached = 0xFF
+            for bit in range(bits):
+                value = counters[bit][byte] & delta
+                next_carry = value & carry
+                value ^= carry
+                counters[bit][byte] = value
+                carry = next_carry
+                # Track the inputs whose counter equals the sample count
+                reached &= value if samples & (1 << bit) else ~value
+            toggled = reached & delta
+            changed[byte] = toggled
+            counting[byte] = delta & ~toggled
+            if toggled:
+                stable[byte] ^= toggled
+                for bit in range(bits):
+                    counters[bit][byte] &= ~toggled
+                any_changed = True
+        return any_changed
+
+    def value(self, pin):
+        """Returns the stable value of a single input.
+
+        :param: pin The chain wide input pin number.
+
+        :return: The stable value (True or False).
+        """
+
+        return bool(self.stable[pin // 8] & (1 << (pin % 8)))
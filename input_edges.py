@@ -0,0 +1,124 @@
+"""Allocation-free edge detection for 74HC165 inputs.
+
+Description
+-----------
+
+A CircuitPython module that detects which inputs of a 74HC165 shift register
+chain changed between samples and reports each change as an edge event with
+the input's pin number, its direction (rising or falling), and the sample's
+timestamp.
+
+Libraries/Modules
+-----------------
+
+- array Standard Library
+    - https://docs.python.org/3/library/array.html
+    - Provides the preallocated event pin number storage.
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic_ns function.
+
+Notes
+-----
+
+- The previous sample and the event storage are preallocated, so update() does
+  not allocate memory.  The events() convenience generator does allocate.
+- An unchanged sample costs a single buffer comparison.  Otherwise, changed
+  bytes are found by XORing each byte with the previous sample, which is
+  updated in place by XORing the changes into it, and the changed bits of a
+  byte are found with a 256 entry lowest set bit lookup table, so the work
+  done per changed input is constant.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import array
+import time
+
+
+# Global Constants
+RISING = True
+"""Event direction of an input changing from low to high."""
+
+FALLING = False
+"""Event direction of an input changing from high to low."""
+
+LOWEST_BIT = bytes([(value & -value).bit_length() - 1 if value else 0 for value in range(256)])
+"""Lookup table of the position of the lowest set bit of each byte value."""
+
+
+# Classes
+class EdgeDetector:
+    """Detects input changes of a shift register chain as edge events.
+
+    After each update(), the events are available in the pins and rising
+    buffers, indexes 0 to count - 1, in increasing pin number order, and all
+    share the timestamp attribute.
+
+    :param: number_of_shift_registers The number of daisy chained 74HC165s.
+    :param: initial                   The initial input values to detect
+                                      changes from, or None for all low.
+    """
+
+    def __init__(self, number_of_shift_registers=1, initial=None):
+        pins_num = 8 * number_of_shift_registers
+        self.previous = bytearray(number_of_shift_registers)  # the previous sample
+        self.pins = array.array("H", range(pins_num))        # pin numbers of the events
+        self.rising = bytearray(pins_num)                     # directions of the events
+        self.count = 0                                        # number of events of the last update
+        self.timestamp = 0                                    # time of the last update, in ns
+        if initial is not None:
+            self.previous[:] = initial
+
+    def update(self, sample, timestamp=None):
+        """Compares a sample with the previous one and records the edge events.
+
+        :param: sample    The input values, e.g. the shift register's gpio value.
+        :param: timestamp The time of the sample in ns, or None to use
+                          time.monotonic_ns().
+
+        :return: The number of events.
+        """
+
+        self.timestamp = time.monotonic_ns() if timestamp is None else timestamp
+        previous = self.previous
+        if sample == previous:  # fast path for unchanged inputs
+            self.count = 0
+            return 0
+        pins = self.pins
+        rising = self.rising
+        count = 0
+        for byte in range(len(previous)):
+            changed = sample[byte] ^ previous[byte]
+            if changed:
+                previous[byte] ^= changed  # now equal to the sample
+                current = sample[byte]
+                offset = 8 * byte
+                while changed:
+                    bit = LOWEST_BIT[changed]
+                    pins[count] = offset + bit
+                    rising[count] = (current >> bit) & 1
+                    count += 1
+                    changed &= changed - 1  # clear the lowest set bit
+        self.count = count
+        return count
+
+    def events(self):
+        """Generates the events of the last update.
+
+        :return: A generator of (pin, rising, timestamp) tuples.
+        """
+
+        for index in range(self.count):
+            yield self.pins[index], bool(self.rising[index]), self.timestamp
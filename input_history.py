@@ -0,0 +1,271 @@
+"""Preallocated timestamped input history recording with binary export.
+
+Description
+-----------
+
+A CircuitPython module that records timestamped snapshots of the inputs of a
+74HC165 shift register chain into a single preallocated ring buffer and
+exports them in a compact binary format for later analysis, either raw or
+with the unchanged bytes of each snapshot run-length encoded.
+
+Each ring entry is an 8 byte little-endian monotonic_ns timestamp followed by
+the chain's input bytes, so the memory used is fixed at
+samples * (8 + number_of_shift_registers) bytes.  When the ring is full, the
+oldest entries are overwritten.
+
+Export format (all integers little-endian):
+
+- Header: the MAGIC bytes, 1 byte encoding (RAW or DELTA), 2 byte chain width
+  in bytes, 4 byte number of entries.
+- RAW entries: 8 byte timestamp followed by the input bytes.
+- DELTA entries: the timestamp as a zigzag encoded varint difference from
+  the previous entry's timestamp (from 0 for the first entry), followed by
+  runs covering the chain width, each a varint number of bytes unchanged from
+  the previous entry (all zeros before the first entry), a varint number of
+  changed bytes and the changed bytes themselves.
+
+Varints are unsigned LEB128, 7 bits per byte with the high bit set on all but
+the last byte.  Zigzag encoding maps the signed timestamp differences 0, -1,
+1, -2, ... to 0, 1, 2, 3, ..., since timestamps passed to record() may
+decrease.
+
+Libraries/Modules
+-----------------
+
+- struct Standard Library
+    - https://docs.python.org/3/library/struct.html
+    - Provides packing of the timestamps and the export header.
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic_ns function.
+
+Notes
+-----
+
+- record() and record_from() only write into the ring and allocate no buffers
+  per sample, so memory use stays fixed and recording keeps up with reading
+  the chain as fast as the SPI bus allows.  export() allocates a little for
+  each entry and is meant to be called outside of the sampling loop.
+- Exports may be appended to the same file; read_history() decodes all of
+  them, on a board or a host computer.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import struct
+import time
+
+
+# Global Constants
+MAGIC = b"WWIH"
+"""The first bytes of exported input history."""
+
+RAW = 0
+"""Export encoding of complete entries."""
+
+DELTA = 1
+"""Export encoding of timestamp differences and run-length encoded unchanged
+bytes."""
+
+TIMESTAMP_SIZE = 8
+"""The number of bytes of an entry's timestamp."""
+
+
+# Functions
+def _write_varint(stream, scratch, value):
+    # Write an unsigned LEB128 varint using a preallocated scratch buffer
+    length = 0
+    while value > 0x7F:
+        scratch[length] = (value & 0x7F) | 0x80
+        value >>= 7
+        length += 1
+    scratch[length] = value
+    stream.write(scratch[:length + 1])
+
+
+def _read_varint(stream):
+    # Read an unsigned LEB128 varint
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)[0]
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value
+        shift += 7
+
+
+def read_history(stream):
+    """Decodes exported input history, including any further exports appended
+    to the same stream.
+
+    :param: stream The stream to read from, e.g. a file opened in binary mode.
+
+    :return: A generator of (timestamp, inputs) tuples, oldest first, with
+             the inputs as bytes.
+    """
+
+    while True:
+        header = stream.read(11)
+        if not header:  # end of the stream
+            return
+        magic, encoding, width, count = struct.unpack("<4sBHI", header)
+        if magic != MAGIC:
+            raise ValueError("Not an input history.")
+        inputs = bytearray(width)
+        timestamp = 0
+        for _ in range(count):
+            if encoding == RAW:
+                timestamp = struct.unpack("<Q", stream.read(TIMESTAMP_SIZE))[0]
+                inputs[:] = stream.read(width)
+            else:
+                difference = _read_varint(stream)
+                timestamp += (difference >> 1) ^ -(difference & 1)  # undo the zigzag encoding
+                position = 0
+                while position < width:
+                    position += _read_varint(stream)
+                    changed = _read_varint(stream)
+                    inputs[position:position + changed] = stream.read(changed)
+                    position += changed
+            yield timestamp, bytes(inputs)
+
+
+# Classes
+class InputHistory:
+    """A ring buffer of timestamped input snapshots.
+
+    Example::
+
+        history = InputHistory(SHIFT_REGISTERS_NUM, samples=1000)
+        history.record_from(isr)             # read the chain into the ring
+        with open("/history.bin", "wb") as file:
+            history.export(file, DELTA)
+
+    :param: number_of_shift_registers The number of daisy chained 74HC165s.
+    :param: samples                   The number of entries the ring holds.
+    """
+
+    def __init__(self, number_of_shift_registers=1, samples=256):
+        self.width = number_of_shift_registers
+        self.entry_size = TIMESTAMP_SIZE + number_of_shift_registers
+        self.samples = samples
+        self.ring = bytearray(samples * self.entry_size)  # the entries, oldest overwritten first
+        self._view = memoryview(self.ring)
+        self.head = 0          # index of the next entry to write
+        self.count = 0         # number of entries held
+        self.recorded = 0      # number of entries recorded since the last clear
+        self.overwritten = 0   # number of entries overwritten before being exported
+
+    def clear(self):
+        """Discards all entries."""
+
+        self.head = 0
+        self.count = 0
+        self.recorded = 0
+        self.overwritten = 0
+
+    def _next(self, timestamp):
+        # Claim the next entry, store its timestamp and return the offset of its inputs
+        offset = self.head * self.entry_size
+        struct.pack_into("<Q", self.ring, offset, time.monotonic_ns() if timestamp is None else timestamp)
+        self.head += 1
+        if self.head == self.samples:
+            self.head = 0
+        if self.count < self.samples:
+            self.count += 1
+        else:
+            self.overwritten += 1
+        self.recorded += 1
+        return offset + TIMESTAMP_SIZE
+
+    def record(self, sample, timestamp=None):
+        """Appends a copy of a sample of the inputs.
+
+        :param: sample    The input values, e.g. the shift register's gpio value.
+        :param: timestamp The time of the sample in ns, or None to use
+                          time.monotonic_ns().
+        """
+
+        offset = self._next(timestamp)
+        self.ring[offset:offset + self.width] = sample
+
+    def record_from(self, isr, timestamp=None):
+        """Reads the inputs of a shift register chain directly into the next
+        entry.
+
+        :param: isr       The shift_registers.InputShiftRegister instance.
+        :param: timestamp The time of the sample in ns, or None to use
+                          time.monotonic_ns() just before the read.
+
+        :return: A memoryview of the entry's inputs.
+        """
+
+        offset = self._next(timestamp)
+        return isr.readinto(self._view[offset:offset + self.width])
+
+    def entry(self, index):
+        """Returns an entry.
+
+        :param: index The entry index, 0 being the oldest held entry.
+
+        :return: A tuple of the timestamp in ns and a memoryview of the inputs.
+        """
+
+        if not 0 <= index < self.count:
+            raise IndexError("Entry index out of range.")
+        offset = ((self.head - self.count + index) % self.samples) * self.entry_size
+        timestamp = struct.unpack_from("<Q", self.ring, offset)[0]
+        return timestamp, self._view[offset + TIMESTAMP_SIZE:offset + self.entry_size]
+
+    def export(self, stream, encoding=DELTA, clear=True):
+        """Writes the held entries, oldest first, in the binary export format.
+
+        :param: stream   The stream to write to, e.g. a file opened in binary
+                         mode.
+        :param: encoding The entry encoding, RAW or DELTA.
+        :param: clear    Whether to discard the entries after writing them.
+
+        :return: The number of entries written.
+        """
+
+        count = self.count
+        stream.write(struct.pack("<4sBHI", MAGIC, encoding, self.width, count))
+        scratch = bytearray(10)  # longest varint of a zigzag encoded 64 bit difference
+        previous = bytearray(self.width)
+        previous_timestamp = 0
+        for index in range(count):
+            if encoding == RAW:
+                offset = ((self.head - count + index) % self.samples) * self.entry_size
+                stream.write(self._view[offset:offset + self.entry_size])  # entries are stored in the RAW format
+            else:
+                timestamp, inputs = self.entry(index)
+                difference = timestamp - previous_timestamp
+                _write_varint(stream, scratch, difference << 1 if difference >= 0 else (~difference << 1) | 1)
+                position = 0
+                while position < self.width:
+                    start = position
+                    while position < self.width and inputs[position] == previous[position]:
+                        position += 1
+                    end = position
+                    while end < self.width and inputs[end] != previous[end]:
+                        end += 1
+                    _write_varint(stream, scratch, position - start)
+                    _write_varint(stream, scratch, end - position)
+                    stream.write(inputs[position:end])
+                    position = end
+                previous[:] = inputs
+                previous_timestamp = timestamp
+        if clear:
+            self.clear()
+        return count
@@ -20,9 +20,6 @@ Circuit
 Libraries/Modules
 -----------------
 
-- time Standard Library
-    - https://docs.python.org/3/library/time.html
-    - Access to monotonic function.
 - board CircuitPython Core Module
     - https://circuitpython.readthedocs.io/en/latest/shared-bindings/board/
     - Access to board's GPIO pins and hardware.
@@ -32,6 +29,23 @@ Libraries/Modules
 - WoolseyWorkshop_CircuitPython_74HC165 CircuitPython Driver Library
     - https://woolseyworkshop-circuitpython-74hc165.readthedocs.io
     - Provides support for 74HC165 shift register IC.
+- shift_registers Module (this repository)
+    - Provides snapshot reads for the 74HC165 shift register IC.
+    - Imported on first use of the shift register.
+- input_debounce Module (this repository)
+    - Provides debouncing of all inputs at once.
+- input_edges Module (this repository)
+    - Provides detection of individual input changes.
+- scheduler Module (this repository)
+    - Provides drift-free periodic sampling.
+- pin_map Module (this repository)
+    - Provides named groups of inputs compiled to byte masks.
+- input_history Module (this repository)
+    - Provides recording of timestamped inputs with binary export.
+- lazy Module (this repository)
+    - Provides on-first-use creation of the pins, buses, and ICs.
+- console_renderer Module (this repository)
+    - Provides table-driven printing of the inputs with a single write.
 
 Notes
 -----
@@ -42,6 +56,11 @@ Notes
   If two or more '165s are daisy chained together, change the
   SHIFT_REGISTERS_NUM constant to the actual number of '165s being used.
 - Input values are printed to the console.
+- record_input_history() saves the input history to HISTORY_FILE, which
+  requires the board's filesystem to be writable by the program (see
+  storage.remount() in boot.py).
+- The pins, buses, and ICs are created on first use, and the driver libraries
+  imported then, so importing this program does not access the hardware.
 - Comments are Sphinx (reStructuredText) compatible.
 
 TODO
@@ -54,6 +73,7 @@ Author(s)
 
 - Created by John Woolsey on 04/14/2021.
 - Modified by John Woolsey on 08/17/2021.
+- Modified by agent on 10/18/2026.
 
 Copyright (c) 2021 Woolsey Workshop.  All rights reserved.
 
@@ -63,15 +83,24 @@ Members
 
 
 # Imports
-import time
 import board
+import console_renderer
 import digitalio
-import wws_74hc165
+import input_debounce
+import input_edges
+import input_history
+import lazy
+import pin_map
+import scheduler
 
 
 # Pin Mapping
-isr_latch_pin = digitalio.DigitalInOut(board.D5)
-"""The pin connected to the 74HC165 SH/LD (1) pin, used for latching data."""
+@lazy.instance(globals())
+def isr_latch_pin():
+    """The pin connected to the 74HC165 SH/LD (1) pin, used for latching data,
+    created on first use."""
+
+    return digitalio.DigitalInOut(board.D5)
 
 
 # Global Constants
@@ -81,15 +110,64 @@ SAMPLE_RATE = 0.2
 SHIFT_REGISTERS_NUM = 1
 """The number of daisy chained 74HC165 shift registers."""
 
+DEBOUNCE_SAMPLES = 4
+"""The number of consecutive samples an input must be stable for to register a
+change."""
+
+HISTORY_SAMPLES = 100
+"""The number of timestamped input samples held by the input history, about
+900 bytes for a single shift register."""
+
+HISTORY_FILE = "/input_history.bin"
+"""The file the input history is appended to."""
+
 
 # Global Variables
 previous_inputs = bytearray(SHIFT_REGISTERS_NUM)
 """The previous input values read from the shift register."""
 
+inputs_buffer = bytearray(SHIFT_REGISTERS_NUM)
+"""The preallocated buffer the shift register inputs are read into."""
+
 
 # Global Instances
-isr = wws_74hc165.ShiftRegister74HC165(board.SPI(), isr_latch_pin, SHIFT_REGISTERS_NUM)
-"""The instance of the connected 74HC165 shift register IC."""
+@lazy.instance(globals())
+def isr():
+    """The instance of the connected 74HC165 shift register IC, created on
+    first use."""
+
+    import shift_registers  # deferred import of the driver library
+    return shift_registers.InputShiftRegister(board.SPI(), lazy.resolve(isr_latch_pin), SHIFT_REGISTERS_NUM)
+
+
+debouncer = input_debounce.Debouncer(SHIFT_REGISTERS_NUM, DEBOUNCE_SAMPLES)
+"""The debouncer of the shift register inputs."""
+
+edge_detector = input_edges.EdgeDetector(SHIFT_REGISTERS_NUM)
+"""The detector of individual shift register input changes."""
+
+input_pins = pin_map.PinMap({"input_a": 0, "input_b": 1, "input_c": 2, "input_d": 3,
+                             "input_e": 4, "input_f": 5, "input_g": 6, "input_h": 7})
+"""The names of the shift register inputs."""
+
+first_inputs = input_pins.group("input_a", "input_b", "input_c", "input_d")
+"""Inputs A - D, compiled to byte masks."""
+
+last_inputs = input_pins.group("input_e", "input_f", "input_g", "input_h")
+"""Inputs E - H, compiled to byte masks."""
+
+console = console_renderer.ConsoleRenderer(SHIFT_REGISTERS_NUM, [f"Input {name}" for name in "ABCDEFGH"])
+"""The renderer of the shift register inputs to the console, with the lines of
+inputs A - H."""
+
+
+@lazy.instance(globals())
+def history():
+    """The recorded timestamped shift register inputs, with a fixed memory size
+    of HISTORY_SAMPLES * (8 + SHIFT_REGISTERS_NUM) bytes allocated on first
+    use."""
+
+    return input_history.InputHistory(SHIFT_REGISTERS_NUM, HISTORY_SAMPLES)
 
 
 # Functions
@@ -125,6 +203,38 @@ def read_single_inputs():
     print()
 
 
+def read_single_inputs_with_snapshot():
+    """Example code for reading individual shift register inputs from a single
+    snapshot of all inputs.
+
+    This approach uses the same familiar mechanism as read_single_inputs(), but
+    only the first input read within the snapshot block latches and shifts the
+    inputs.  All other input reads are served from the snapshot.
+    """
+
+    # Input pin definitions (pin references)
+    input_a = isr.get_pin(0)
+    input_b = isr.get_pin(1)
+    input_c = isr.get_pin(2)
+    input_d = isr.get_pin(3)
+    input_e = isr.get_pin(4)
+    input_f = isr.get_pin(5)
+    input_g = isr.get_pin(6)
+    input_h = isr.get_pin(7)
+
+    # Read and print individual inputs from a single shift register read
+    with isr.snapshot():
+        print(f"Input A = {input_a.value}")
+        print(f"Input B = {input_b.value}")
+        print(f"Input C = {input_c.value}")
+        print(f"Input D = {input_d.value}")
+        print(f"Input E = {input_e.value}")
+        print(f"Input F = {input_f.value}")
+        print(f"Input G = {input_g.value}")
+        print(f"Input H = {input_h.value}")
+    print()
+
+
 def read_inputs_with_binary_values():
     """Example code for reading all shift register inputs with each read using
     binary values (1 = True, 0 = False).
@@ -187,6 +297,57 @@ def read_inputs_with_defined_names():
     print()
 
 
+def read_inputs_with_lookup_tables():
+    """Example code for reading all shift register inputs into a preallocated
+    buffer and accessing individually named inputs using the shift register's
+    precomputed byte index and bit mask tables.
+
+    This approach provides the same named inputs as
+    read_inputs_with_defined_names(), but does not allocate memory for each
+    read or compute the positions of the inputs, making it suitable for long
+    daisy chains.
+    """
+
+    # Input pin definitions (bit positions)
+    input_a = 0
+    input_b = 1
+    input_c = 2
+    input_d = 3
+    input_e = 4
+    input_f = 5
+    input_g = 6
+    input_h = 7
+
+    # Read all inputs from shift register into the preallocated buffer
+    isr.readinto(inputs_buffer)
+
+    # Read and print individual inputs
+    print(f"Input A = {isr.value(input_a, inputs_buffer)}")
+    print(f"Input B = {isr.value(input_b, inputs_buffer)}")
+    print(f"Input C = {isr.value(input_c, inputs_buffer)}")
+    print(f"Input D = {isr.value(input_d, inputs_buffer)}")
+    print(f"Input E = {isr.value(input_e, inputs_buffer)}")
+    print(f"Input F = {isr.value(input_f, inputs_buffer)}")
+    print(f"Input G = {isr.value(input_g, inputs_buffer)}")
+    print(f"Input H = {isr.value(input_h, inputs_buffer)}")
+    print()
+
+
+def read_inputs_with_pin_map():
+    """Example code for reading all shift register inputs with each read and
+    checking named groups of inputs using a pin map.
+
+    This approach names the inputs once and compiles the groups of inputs into
+    byte masks when the program starts, so checking a group is a single masked
+    test per shift register instead of one test per input.
+    """
+
+    inputs = isr.readinto(inputs_buffer)  # read all inputs from shift register
+    print(f"Any of inputs A - D = {first_inputs.any(inputs)}")
+    print(f"All of inputs E - H = {last_inputs.all(inputs)}")
+    print()
+
+
 def read_and_print_inputs_on_change():
     """Example code for reading all shift register inputs in a single read and
     printing all values, separated into bytes, when an input change is detected.
@@ -202,23 +363,118 @@ def read_and_print_inputs_on_change():
         previous_inputs = current_inputs[:]  # save (copy) current inputs for next comparison
 
 
+def read_and_print_debounced_inputs_on_change():
+    """Example code for reading all shift register inputs in a single read and
+    printing all debounced values, separated into bytes, when a debounced input
+    change is detected.
+
+    This approach ignores switch bounce, but should be called at regular
+    intervals since inputs must be stable for DEBOUNCE_SAMPLES consecutive calls
+    to register a change.
+    """
+
+    if debouncer.update(isr.gpio):  # print values only if they changed
+        print("Inputs: ", end="")
+        for byte in debouncer.stable:
+            print(f"{byte:08b}", end=" ")  # print the current byte in binary format
+        print()
+
+
+def print_input_changes():
+    """Example code for reading all shift register inputs in a single read and
+    printing each input that changed along with the direction of the change.
+
+    This approach identifies exactly which inputs changed without copying the
+    inputs or allocating memory for each read.
+    """
+
+    if edge_detector.update(isr.gpio):  # print only if any inputs changed
+        for index in range(edge_detector.count):
+            direction = "rising" if edge_detector.rising[index] else "falling"
+            print(f"Input {edge_detector.pins[index]} {direction} at {edge_detector.timestamp} ns")
+
+
+def record_input_history():
+    """Example code for reading all shift register inputs in a single read
+    directly into a timestamped input history, and appending the history to
+    HISTORY_FILE in a compact binary format whenever it is full.
+
+    Unlike read_and_print_inputs_on_change(), this approach keeps a record of
+    every sample for later analysis, e.g. with input_history.read_history() on
+    a host computer, and does not allocate memory for each read.
+    """
+
+    history.record_from(isr)
+    if history.count == history.samples:  # save and clear the full history
+        with open(HISTORY_FILE, "ab") as file:
+            history.export(file, input_history.DELTA)
+
+
+def read_inputs_with_console_renderer():
+    """Example code for reading all shift register inputs into a preallocated
+    buffer and printing the named inputs and all inputs in binary format with a
+    table-driven console renderer.
+
+    This approach prints the same lines as read_inputs_with_lookup_tables() and
+    read_inputs_with_binary_values(), but looks up each line from precomputed
+    text instead of formatting it, and writes each frame to the console at
+    once instead of with a print() call per line or byte, making it suitable
+    for high sample rates and long daisy chains.
+    """
+
+    isr.readinto(inputs_buffer)
+    console.render_lines(inputs_buffer)
+    console.render_binary(inputs_buffer)
+
+
+def print_input_changes_with_console_renderer():
+    """Example code for reading all shift register inputs into a preallocated
+    buffer and printing only the lines of the named inputs that changed.
+
+    This approach writes nothing for unchanged inputs and a single short frame
+    for changed ones, so the console keeps up with continuous sampling.
+    """
+
+    isr.readinto(inputs_buffer)
+    console.render_lines(inputs_buffer, changed=True)
+
+
 def main():
     """Main program entry."""
 
     # Read and print inputs at the specified sampling rate
-    previous_time = time.monotonic()  # time in seconds
-    while True:
-        current_time = time.monotonic()  # time in seconds
-        if current_time - previous_time >= 1.0 / SAMPLE_RATE:
-            read_single_inputs()
-            # read_inputs_with_binary_values()
-            # read_inputs_with_defined_names()
-            previous_time = current_time
+    sampler = scheduler.Scheduler()
+    sampler.add(read_single_inputs, 1.0 / SAMPLE_RATE)
+    # sampler.add(read_single_inputs_with_snapshot, 1.0 / SAMPLE_RATE)
+    # sampler.add(read_inputs_with_binary_values, 1.0 / SAMPLE_RATE)
+    # sampler.add(read_inputs_with_defined_names, 1.0 / SAMPLE_RATE)
+    # sampler.add(read_inputs_with_lookup_tables, 1.0 / SAMPLE_RATE)
+    # sampler.add(read_inputs_with_pin_map, 1.0 / SAMPLE_RATE)
+    # sampler.add(read_inputs_with_console_renderer, 1.0 / SAMPLE_RATE)
+    sampler.run()
 
     # Read inputs and print values upon any change
     # while True:
     #     read_and_print_inputs_on_change()
 
+    # Read inputs and print the lines of the changed named inputs
+    # while True:
+    #     print_input_changes_with_console_renderer()
+
+    # Read inputs and print individual input changes
+    # while True:
+    #     print_input_changes()
+
+    # Read inputs every 5 ms and print debounced values upon any change
+    # sampler = scheduler.Scheduler()
+    # sampler.add(read_and_print_debounced_inputs_on_change, 0.005)
+    # sampler.run()
+
+    # Record inputs every 1 ms and save them to a file whenever the history is full
+    # sampler = scheduler.Scheduler()
+    # sampler.add(record_input_history, 0.001)
+    # sampler.run()
+
 
 if __name__ == "__main__":  # required for generating Sphinx documentation
     main()
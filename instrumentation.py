@@ -0,0 +1,217 @@
+"""Opt-in bus and latch instrumentation with per-function profiling.
+
+Description
+-----------
+
+A CircuitPython module that counts the transactions, bytes, latch pulses
+(rising edges of written pins) and time spent on the SPI and I2C buses used by
+the shift register and port expander drivers, attributed to the example
+function that was running at the time, along with each function's total time.
+The difference between a function's total time and its bus time is the time
+spent on everything else, e.g. print formatting.
+
+A Profiler is a bus_hooks hook: register it with a bus_hooks.BusHooks
+instance, which wraps the buses and latch pins passed to the drivers.  When a
+Profiler is disabled, the BusHooks instance ignores it and its profile method
+returns the original functions unchanged, so instrumentation costs nothing
+unless it is enabled.
+
+Libraries/Modules
+-----------------
+
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic_ns function.
+- bus_hooks Module (this repository)
+    - Provides the transaction kinds.
+
+Notes
+-----
+
+- Wrap the bus and latch objects before passing them to the drivers, e.g.
+  ShiftRegister74HC165(hooks.wrap_spi(board.SPI()), ...).
+- Bus activity outside of any profiled function is attributed to the
+  "(unprofiled)" section.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import time
+import bus_hooks
+
+
+# Classes
+class Section:
+    """The counters of one profiled function.
+
+    :param: name The name used in reports.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0          # number of calls
+        self.transactions = 0   # number of bus transactions
+        self.bytes = 0          # number of bytes transferred
+        self.latch_pulses = 0   # number of rising edges of the wrapped latch pins
+        self.bus_time = 0       # time spent in bus transactions, in ns
+        self.total_time = 0     # time spent in the function, in ns
+
+
+class Profiler:
+    """Collects bus and latch statistics per profiled function.
+
+    Example::
+
+        profiler = Profiler(enabled=PROFILING)
+        hooks = bus_hooks.BusHooks(profiler)
+        isr = ShiftRegister74HC165(hooks.wrap_spi(board.SPI()),
+                                   hooks.wrap_pin(DigitalInOut(board.D5)))
+
+        @profiler.profile
+        def read_inputs():
+            print(isr.gpio)
+
+        read_inputs()
+        profiler.print_report()
+
+    :param: enabled Whether to instrument anything at all.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.sections = {}   # sections by name
+        self._wrappers = {}  # profiled wrappers by function, used by call()
+        self._reported = time.monotonic_ns()  # time of the last report() table, in ns
+        self.current = self.section("(unprofiled)")
+
+    def section(self, name):
+        """Returns the section with the given name, creating it if needed.
+
+        :param: name The section name.
+
+        :return: The Section instance.
+        """
+
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = Section(name)
+        return section
+
+    def reset(self):
+        """Clears the statistics of all sections."""
+
+        for name in self.sections:
+            self.sections[name].__init__(name)
+
+    def profile(self, function, name=None):
+        """Returns a profiled version of a function, or the function itself
+        when disabled.
+
+        :param: function The function to profile.
+        :param: name     The section name, defaults to the function's name.
+
+        :return: The function to call instead.
+        """
+
+        if not self.enabled:
+            return function
+        section = self.section(name if name is not None else function.__name__)
+
+        def profiled(*args, **kwargs):
+            previous = self.current
+            self.current = section
+            start = time.monotonic_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                section.total_time += time.monotonic_ns() - start
+                section.calls += 1
+                self.current = previous
+
+        return profiled
+
+    def call(self, function):
+        """Calls a function, profiled when enabled.
+
+        :param: function The function to call without arguments.
+
+        :return: The function's return value.
+        """
+
+        if not self.enabled:
+            return function()
+        wrapper = self._wrappers.get(function)
+        if wrapper is None:
+            wrapper = self._wrappers[function] = self.profile(function)
+        return wrapper()
+
+    def transaction(self, kind, address, written, read, start):
+        """Records a bus transaction in the current section, see bus_hooks.
+
+        :param: kind    The transaction kind, e.g. bus_hooks.SPI_WRITE.
+        :param: address The I2C address, or None for SPI.
+        :param: written The bytes written, or None.
+        :param: read    The bytes read, or None.
+        :param: start   The time.monotonic_ns() value at the start of the
+                        transaction.
+        """
+
+        section = self.current
+        section.bus_time += time.monotonic_ns() - start
+        section.transactions += 1
+        if written is not None:
+            section.bytes += len(written)
+        if read is not None and kind != bus_hooks.SPI_TRANSFER:  # full duplex bytes are counted once
+            section.bytes += len(read)
+
+    def pin_added(self, pin_id, name):
+        """Does nothing, the latch pulses are counted for all pins, see
+        bus_hooks."""
+
+    def pin_changed(self, pin_id, level, written):
+        """Counts a rising edge of a written pin as a latch pulse in the
+        current section, see bus_hooks.
+
+        :param: pin_id  The id of the pin.
+        :param: level   The new level.
+        :param: written Whether the pin was written.
+        """
+
+        if level and written:
+            self.current.latch_pulses += 1
+
+    def report(self, period):
+        """Prints the summary table if enabled and at least period seconds
+        passed since the last one, for use in main loops.
+
+        :param: period The time between tables, in seconds.
+        """
+
+        if self.enabled and time.monotonic_ns() - self._reported >= int(period * 1e9):
+            self._reported = time.monotonic_ns()
+            self.print_report()
+
+    def print_report(self):
+        """Prints a summary table of all sections with calls or bus activity."""
+
+        print(f"{'function':<40} {'calls':>7} {'trans/call':>10} {'bytes/call':>10} {'latch/call':>10} "
+              f"{'bus us/call':>11} {'total us/call':>13}")
+        for section in self.sections.values():
+            if not (section.calls or section.transactions):
+                continue
+            calls = section.calls or 1
+            total = f"{section.total_time / calls / 1000:.0f}" if section.calls else "-"
+            print(f"{section.name:<40} {section.calls:>7} {section.transactions / calls:>10.1f} "
+                  f"{section.bytes / calls:>10.1f} {section.latch_pulses / calls:>10.1f} "
+                  f"{section.bus_time / calls / 1000:>11.0f} {total:>13}")
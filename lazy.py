@@ -0,0 +1,130 @@
+"""Lazy, on-first-use construction of module level instances.
+
+Description
+-----------
+
+A CircuitPython module that defers the creation of a program's pins, buses,
+and drivers (and the import of the driver libraries) from the time the
+program is imported to the time an instance is first used, so importing a
+program, e.g. for generating its documentation or from another program, does
+not touch the hardware, and the board gets to its first sample sooner.
+
+A lazy instance is declared with a factory function decorated with
+instance(), which replaces the function with a placeholder of the same name.
+On first use, the placeholder calls the factory and replaces itself in the
+module with the created instance, so later uses by the module's functions
+access the instance directly without any overhead.
+
+Libraries/Modules
+-----------------
+
+- None.
+
+Notes
+-----
+
+- Objects that keep a reference to a placeholder, e.g. an instance passed to
+  another instance's factory, forward every attribute access through the
+  placeholder.  Pass resolve(placeholder) instead to avoid that overhead.
+- Use resolve_all() to create all lazy instances of a module up front, e.g.
+  before time critical code.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Functions
+def instance(namespace):
+    """Returns a decorator that declares a lazy instance in a module.
+
+    Example::
+
+        @lazy.instance(globals())
+        def isr():
+            \"\"\"The 74HC165 shift register, created on first use.\"\"\"
+
+            import shift_registers
+            return shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5))
+
+    :param: namespace The module's globals() dictionary.
+
+    :return: The decorator, which returns the LazyInstance placeholder.
+    """
+
+    def decorator(factory):
+        return LazyInstance(factory, namespace)
+
+    return decorator
+
+
+def resolve(obj):
+    """Returns the instance of a lazy instance placeholder, creating it if
+    needed, or the object itself if it is not a placeholder.
+
+    :param: obj The LazyInstance placeholder or any other object.
+    """
+
+    return obj.resolve() if isinstance(obj, LazyInstance) else obj
+
+
+def resolve_all(namespace):
+    """Creates all lazy instances of a module that were not yet used.
+
+    :param: namespace The module's globals() dictionary.
+
+    :return: The number of created instances.
+    """
+
+    placeholders = [obj for obj in namespace.values() if isinstance(obj, LazyInstance)]
+    for placeholder in placeholders:
+        placeholder.resolve()
+    return len(placeholders)
+
+
+# Classes
+class LazyInstance:
+    """A placeholder that creates its instance on first use.
+
+    :param: factory   The function that creates the instance, whose name is
+                      the name of the module level variable to replace.
+    :param: namespace The module's globals() dictionary.
+    """
+
+    def __init__(self, factory, namespace):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_namespace", namespace)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "__doc__", factory.__doc__)
+
+    def resolve(self):
+        """Returns the instance, creating it and replacing the placeholder in
+        the module on first use.
+        """
+
+        if self._instance is None:
+            object.__setattr__(self, "_instance", self._factory())
+            name = self._factory.__name__
+            if self._namespace.get(name) is self:
+                self._namespace[name] = self._instance
+        return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resolve(), name, value)
+
+    def __enter__(self):
+        return self.resolve().__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self.resolve().__exit__(exc_type, exc_value, traceback)
@@ -0,0 +1,205 @@
+"""Binary code modulation brightness engine for 74HC595 outputs.
+
+Description
+-----------
+
+A CircuitPython module that dims the outputs of a 74HC595 shift register
+chain using binary code modulation (BCM).  Each output is given a brightness
+level of 1 to 8 bits.  The levels are compiled into one bit plane per level
+bit, a buffer as wide as the chain holding that bit of every output, and each
+refresh period simply writes the prebuilt bit planes in turn, holding bit
+plane n on the outputs for 2^n base time units.  No per-output comparisons are
+done while refreshing.
+
+Libraries/Modules
+-----------------
+
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic_ns function.
+
+Notes
+-----
+
+- All bit planes are stored in one contiguous bytearray, with each plane being
+  a memoryview slice of it.
+- Level changes are compiled into new bit planes at the start of the next
+  refresh period, so a period never shows a mix of old and new levels.
+- Each bit plane is held from the time it is actually written, so late tick()
+  calls stretch the refresh period but keep the brightness ratios.
+- One refresh period lasts (2^bits - 1) base times.  The base time can not be
+  shorter than the time it takes to write the chain, so the achievable refresh
+  rate falls as the chain grows.  Refresh rates above about 100 Hz are
+  generally seen as flicker free.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import time
+
+
+# Classes
+class BrightnessEngine:
+    """Dims the outputs of a 74HC595 shift register chain with binary code
+    modulation.
+
+    :param: shift_register The 74HC595 shift register instance to write to.
+    :param: bits           The number of bits per brightness level (1 - 8).
+    :param: base_time      The hold time of the least significant bit plane, in
+                           seconds.
+    """
+
+    def __init__(self, shift_register, bits=4, base_time=0.0002):
+        if not 1 <= bits <= 8:
+            raise ValueError("Bits must be 1 - 8.")
+        width = shift_register.number_of_shift_registers
+        self._shift_register = shift_register
+        self.bits = bits
+        self.levels = bytearray(8 * width)        # brightness level of each output pin
+        self._planes_buffer = bytearray(bits * width)
+        planes_view = memoryview(self._planes_buffer)
+        self._planes = [planes_view[plane * width:(plane + 1) * width] for plane in range(bits)]
+        self._hold_times = [0] * bits
+        self.base_time = base_time
+        self._dirty = True
+        self._plane = 0
+        self._deadline = None                     # time the next bit plane is due, in ns
+        self.reset_statistics()
+
+    @property
+    def base_time(self):
+        """The hold time of the least significant bit plane, in seconds."""
+
+        return self._hold_times[0] / 1e9
+
+    @base_time.setter
+    def base_time(self, value):
+        base = int(value * 1e9)
+        self._hold_times = [base << plane for plane in range(self.bits)]
+
+    @property
+    def period(self):
+        """The duration of one refresh period, in seconds."""
+
+        return sum(self._hold_times) / 1e9
+
+    def reset_statistics(self):
+        """Clears the refresh statistics."""
+
+        self.refreshes = 0          # number of completed refresh periods
+        self.plane_writes = 0       # number of bit plane writes
+        self._first_refresh = None  # time the first counted refresh period started, in ns
+        self._last_refresh = None   # time the last counted refresh period started, in ns
+
+    @property
+    def refresh_rate(self):
+        """The measured refresh rate in Hz, 0 until two periods have started."""
+
+        if self._first_refresh is None or self._last_refresh == self._first_refresh:
+            return 0.0
+        return self.refreshes * 1e9 / (self._last_refresh - self._first_refresh)
+
+    def set_level(self, pin, level):
+        """Sets the brightness level of a single output.
+
+        :param: pin   The output pin number.
+        :param: level The brightness level (0 - 2^bits - 1).
+        """
+
+        if not 0 <= level < 1 << self.bits:
+            raise ValueError(f"Level must be 0 - {(1 << self.bits) - 1}.")
+        self.levels[pin] = level
+        self._dirty = True
+
+    def set_levels(self, levels):
+        """Sets the brightness levels of all outputs.
+
+        :param: levels A sequence with one brightness level (0 - 2^bits - 1)
+                       per output pin.
+        """
+
+        levels = bytes(levels)
+        if len(levels) != len(self.levels):
+            raise ValueError("There must be one level per output pin.")
+        if not all(0 <= level < 1 << self.bits for level in levels):
+            raise ValueError(f"Levels must be 0 - {(1 << self.bits) - 1}.")
+        self.levels[:] = levels
+        self._dirty = True
+
+    def _compile(self):
+        # Rebuild the bit planes from the brightness levels
+        for plane in range(self.bits):
+            buffer = self._planes[plane]
+            mask = 1 << plane
+            for byte in range(len(buffer)):
+                value = 0
+                offset = 8 * byte
+                for bit in range(8):
+                    if self.levels[offset + bit] & mask:
+                        value |= 1 << bit
+                buffer[byte] = value
+        self._dirty = False
+
+    def _write_plane(self):
+        gpio = self._shift_register.gpio
+        gpio[:] = self._planes[self._plane]  # copy into the driver's own buffer
+        self._shift_register.gpio = gpio
+        self.plane_writes += 1
+
+    def tick(self, now=None):
+        """Writes the next bit plane if the current one has been held long
+        enough.  Must be called at least as often as the base time for accurate
+        brightness levels.
+
+        :param: now The current time.monotonic_ns() value, or None to read it.
+
+        :return: True if a bit plane was written to the shift registers.
+        """
+
+        if now is None:
+            now = time.monotonic_ns()
+        if self._deadline is None:
+            self._deadline = now
+        elif now < self._deadline:
+            return False
+        else:
+            self._plane = (self._plane + 1) % self.bits
+        if self._plane == 0:
+            if self._first_refresh is None:
+                self._first_refresh = now
+            else:
+                self.refreshes += 1
+            self._last_refresh = now
+            if self._dirty:
+                self._compile()
+        self._write_plane()
+        self._deadline = now + self._hold_times[self._plane]  # hold from the actual write time
+        return True
+
+    def refresh(self):
+        """Performs one complete refresh period, blocking until it is done."""
+
+        self.tick()
+        while self._plane != self.bits - 1 or time.monotonic_ns() < self._deadline:
+            self.tick()
+
+    def stop(self):
+        """Stops refreshing and turns off all outputs."""
+
+        self._deadline = None
+        self._plane = 0
+        gpio = self._shift_register.gpio
+        for byte in range(len(gpio)):
+            gpio[byte] = 0
+        self._shift_register.gpio = gpio
@@ -0,0 +1,211 @@
+"""Non-blocking frame sequencer for 74HC595 output animations.
+
+Description
+-----------
+
+A CircuitPython module that plays precompiled output frames on a 74HC595
+shift register chain without blocking in sleep() between frames.  The
+application calls tick() from its main loop as often as possible and the
+sequencer writes a new frame to the shift registers only when the current
+frame's duration has elapsed, leaving the rest of the time for other tasks
+such as input polling.
+
+Libraries/Modules
+-----------------
+
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic function.
+
+Notes
+-----
+
+- All frames are stored in one contiguous bytearray, with each frame being a
+  memoryview slice of it that is as wide as the shift register chain.
+- Frame deadlines are absolute, so a late tick() does not delay the frames
+  that follow it.  Frames whose deadlines have already passed are skipped.
+- The lateness of each frame write (the time between its deadline and the
+  tick() that wrote it) is recorded to report frame timing accuracy.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import time
+
+
+# Global Constants
+ONCE = 0
+"""Play the frames once and stop on the last frame."""
+
+LOOP = 1
+"""Play the frames from first to last repeatedly."""
+
+PING_PONG = 2
+"""Play the frames from first to last and back again repeatedly, without
+repeating the end frames."""
+
+
+# Functions
+def cycle_frames(number_of_shift_registers):
+    """Returns the frames for cycling a single on output through a chain, as
+    done by cycle_leds() in output_shift_register.py when played with the
+    PING_PONG mode.
+
+    :param: number_of_shift_registers The number of daisy chained 74HC595s.
+
+    :return: A list of bytearray frames, one for each output.
+    """
+
+    frames = []
+    for position in range(8 * number_of_shift_registers):
+        frame = bytearray(number_of_shift_registers)
+        frame[position // 8] = 1 << (position % 8)
+        frames.append(frame)
+    return frames
+
+
+# Classes
+class FrameSequencer:
+    """Plays precompiled output frames on a 74HC595 shift register chain.
+
+    :param: shift_register The 74HC595 shift register instance to write to.
+    :param: frames         A sequence of frames, each a bytes-like object as
+                           wide as the shift register chain.
+    :param: durations      The duration of each frame in seconds (greater than
+                           0), either a single number for all frames or a
+                           sequence.
+    :param: mode           ONCE, LOOP or PING_PONG.
+    """
+
+    def __init__(self, shift_register, frames, durations, mode=LOOP):
+        width = shift_register.number_of_shift_registers
+        self._shift_register = shift_register
+        self._buffer = bytearray(width * len(frames))  # all frames, contiguous
+        buffer_view = memoryview(self._buffer)
+        self._frames = []
+        for index, frame in enumerate(frames):
+            if len(frame) != width:
+                raise ValueError("Frame width must match the number of shift registers.")
+            self._buffer[index * width:(index + 1) * width] = frame
+            self._frames.append(buffer_view[index * width:(index + 1) * width])
+        if isinstance(durations, (int, float)):
+            durations = [durations] * len(frames)
+        if len(durations) != len(frames):
+            raise ValueError("There must be one duration per frame.")
+        if not all(duration > 0 for duration in durations):
+            raise ValueError("Frame durations must be greater than 0.")
+        self._durations = list(durations)
+        self.mode = mode
+        self.running = False
+        self.index = 0         # index of the frame currently shown
+        self.cycles = 0        # number of completed passes through the frames
+        self._step = 1
+        self._deadline = 0.0   # time the next frame is due
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """Clears the frame timing statistics."""
+
+        self.frames_written = 0   # number of frames written to the shift registers
+        self.frames_skipped = 0   # number of frames skipped because their deadline passed
+        self.max_lateness = 0.0   # worst time between a frame's deadline and its write, in seconds
+        self._total_lateness = 0.0
+
+    @property
+    def average_lateness(self):
+        """The average time between a frame's deadline and its write, in seconds."""
+
+        return self._total_lateness / self.frames_written if self.frames_written else 0.0
+
+    @property
+    def next_time(self):
+        """The time.monotonic() value at which the next frame is due."""
+
+        return self._deadline
+
+    def start(self, now=None):
+        """Writes the first frame and starts the sequence.
+
+        :param: now The current time.monotonic() value, or None to read it.
+        """
+
+        if now is None:
+            now = time.monotonic()
+        self.index = 0
+        self.cycles = 0
+        self._step = 1
+        self.running = True
+        self._deadline = now
+        self._write(now)
+
+    def stop(self):
+        """Stops the sequence, leaving the current frame on the outputs."""
+
+        self.running = False
+
+    def _write(self, now):
+        lateness = now - self._deadline
+        self._total_lateness += lateness
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+        self.frames_written += 1
+        gpio = self._shift_register.gpio
+        gpio[:] = self._frames[self.index]  # copy into the driver's own buffer
+        self._shift_register.gpio = gpio
+        self._deadline += self._durations[self.index]
+
+    def _advance(self):
+        # Move to the next frame index, returns False when a ONCE sequence has ended
+        last = len(self._frames) - 1
+        if self.mode == PING_PONG and last > 0:
+            if not 0 <= self.index + self._step <= last:
+                self._step = -self._step
+            self.index += self._step
+            if self.index == 0:  # back at the first frame
+                self.cycles += 1
+        elif self.index < last:
+            self.index += 1
+        elif self.mode != ONCE:  # LOOP, or PING_PONG with a single frame
+            self.index = 0
+            self.cycles += 1
+        else:
+            self.cycles = 1
+            return False
+        return True
+
+    def tick(self, now=None):
+        """Advances the sequence, writing a new frame only if one is due.
+
+        :param: now The current time.monotonic() value, or None to read it.
+
+        :return: True if a frame was written to the shift registers.
+        """
+
+        if not self.running:
+            return False
+        if now is None:
+            now = time.monotonic()
+        if now < self._deadline:
+            return False
+        if not self._advance():
+            self.running = False
+            return False
+        while now >= self._deadline + self._durations[self.index]:  # skip frames that are already over
+            self._deadline += self._durations[self.index]
+            self.frames_skipped += 1
+            if not self._advance():
+                self.running = False
+                break
+        self._write(now)
+        return True
@@ -22,7 +22,7 @@ Libraries/Modules
 
 - time Standard Library
     - https://docs.python.org/3/library/time.html
-    - Access to sleep function.
+    - Access to monotonic and sleep functions.
 - board CircuitPython Core Module
     - https://circuitpython.readthedocs.io/en/latest/shared-bindings/board/
     - Access to board's GPIO pins and hardware.
@@ -32,6 +32,17 @@ Libraries/Modules
 - Adafruit_CircuitPython_74HC595 CircuitPython Driver Library
     - https://circuitpython.readthedocs.io/projects/74hc595/
     - Provides support for 74HC595 shift register IC.
+- shift_registers Module (this repository)
+    - Provides batch writes for the 74HC595 shift register IC.
+    - Imported on first use of the shift register.
+- output_sequencer Module (this repository)
+    - Provides non-blocking playback of output frames.
+- output_brightness Module (this repository)
+    - Provides output brightness levels using binary code modulation.
+- pin_map Module (this repository)
+    - Provides named groups of outputs compiled to byte masks.
+- lazy Module (this repository)
+    - Provides on-first-use creation of the pins, buses, and ICs.
 
 Notes
 -----
@@ -42,6 +53,8 @@ Notes
   If two or more '595s are daisy chained together, change the
   SHIFT_REGISTERS_NUM constant to the actual number of '595s being used.
   See function specific comments for additional details.
+- The pins, buses, and ICs are created on first use, and the driver libraries
+  imported then, so importing this program does not access the hardware.
 - Comments are Sphinx (reStructuredText) compatible.
 
 TODO
@@ -54,6 +67,7 @@ Author(s)
 
 - Created by John Woolsey on 04/13/2021.
 - Modified by John Woolsey on 06/14/2021.
+- Modified by agent on 10/18/2026.
 
 Copyright (c) 2021 Woolsey Workshop.  All rights reserved.
 
@@ -63,15 +77,22 @@ Members
 
 
 # Imports
-from time import sleep
+from time import monotonic, sleep
 import board
 import digitalio
-import adafruit_74hc595
+import lazy
+import output_brightness
+import output_sequencer
+import pin_map
 
 
 # Pin Mapping
-osr_latch_pin = digitalio.DigitalInOut(board.D5)
-"""The pin connected to the 74HC595 RCLK (12) pin, used for latching data."""
+@lazy.instance(globals())
+def osr_latch_pin():
+    """The pin connected to the 74HC595 RCLK (12) pin, used for latching data,
+    created on first use."""
+
+    return digitalio.DigitalInOut(board.D5)
 
 
 # Global Constants
@@ -80,8 +101,24 @@ SHIFT_REGISTERS_NUM = 1
 
 
 # Global Instances
-osr = adafruit_74hc595.ShiftRegister74HC595(board.SPI(), osr_latch_pin, SHIFT_REGISTERS_NUM)
-"""The instance of the connected 74HC595 shift register IC."""
+@lazy.instance(globals())
+def osr():
+    """The instance of the connected 74HC595 shift register IC, created on
+    first use."""
+
+    import shift_registers  # deferred import of the driver library
+    return shift_registers.OutputShiftRegister(board.SPI(), lazy.resolve(osr_latch_pin), SHIFT_REGISTERS_NUM)
+
+
+output_pins = pin_map.PinMap({f"led_{n}": n for n in range(8 * SHIFT_REGISTERS_NUM)})
+"""The names of the shift register outputs, led_0 - led_7 for each shift
+register."""
+
+even_leds = output_pins.select(lambda name: int(name[4:]) % 2 == 0)
+"""The even numbered LEDs of all shift registers, compiled to byte masks."""
+
+odd_leds = output_pins.select(lambda name: int(name[4:]) % 2 == 1)
+"""The odd numbered LEDs of all shift registers, compiled to byte masks."""
 
 
 # Functions
@@ -136,6 +173,61 @@ def change_single_outputs():
     sleep(1)
 
 
+def change_single_outputs_with_batch():
+    """Example code for setting individual shift register outputs within
+    batches.
+
+    This approach uses the same familiar mechanism as change_single_outputs(),
+    but all outputs changed within a batch block are shifted out together with
+    a single shift register write at the end of the block, so multiple outputs
+    change at the same time.
+    """
+
+    # Output pin definitions (pin references)
+    led_0 = osr.get_pin(0)
+    led_1 = osr.get_pin(1)
+    led_2 = osr.get_pin(2)
+    led_3 = osr.get_pin(3)
+    led_4 = osr.get_pin(4)
+    led_5 = osr.get_pin(5)
+    led_6 = osr.get_pin(6)
+    led_7 = osr.get_pin(7)
+
+    # Set individual LEDs
+    led_1.value = True       # turn on LED 1 only
+    sleep(1)
+    with osr.batch():
+        led_1.value = False  # turn off LED 1 and turn on LED 6 together
+        led_6.value = True
+    sleep(1)
+    led_6.value = False      # turn off LED 6 only
+    sleep(1)
+
+    # Set multiple LEDs
+    with osr.batch():
+        led_0.value = True   # turn on even numbered LEDs
+        led_2.value = True
+        led_4.value = True
+        led_6.value = True
+    sleep(1)
+    with osr.batch():
+        led_0.value = False  # turn off even numbered LEDs
+        led_2.value = False
+        led_4.value = False
+        led_6.value = False
+        led_1.value = True   # turn on odd numbered LEDs
+        led_3.value = True
+        led_5.value = True
+        led_7.value = True
+    sleep(1)
+    with osr.batch():
+        led_1.value = False  # turn off odd numbered LEDs
+        led_3.value = False
+        led_5.value = False
+        led_7.value = False
+    sleep(1)
+
+
 def change_outputs_with_binary_values():
     """Example code for setting all shift register outputs with each write using
     binary values (1 = True, 0 = False).
@@ -220,6 +312,82 @@ def change_outputs_with_defined_names():
     sleep(1)
 
 
+def change_outputs_in_place():
+    """Example code for setting individually named outputs in the shift
+    register's own output buffer using its precomputed byte index and bit mask
+    tables, and then writing all outputs at once.
+
+    This approach provides named outputs on any shift register of a daisy chain
+    without computing output positions or allocating memory for each write,
+    making it suitable for long daisy chains.
+    """
+
+    # Output pin definitions (bit positions)
+    led_0 = 0
+    led_1 = 1
+    led_2 = 2
+    led_3 = 3
+    led_4 = 4
+    led_5 = 5
+    led_6 = 6
+    led_7 = 7
+    leds = (led_0, led_1, led_2, led_3, led_4, led_5, led_6, led_7)
+
+    # Set individual LEDs
+    osr.set_value(led_1, True)   # turn on LED 1 only
+    osr.write()                  # write all outputs to the shift registers
+    sleep(1)
+    osr.set_value(led_1, False)
+    osr.set_value(led_6, True)   # turn on LED 6 only
+    osr.write()
+    sleep(1)
+    osr.set_value(led_6, False)  # turn off all LEDs
+    osr.write()
+    sleep(1)
+
+    # Set multiple LEDs
+    for led in leds:
+        osr.set_value(led, led % 2 == 0)  # turn on only even numbered LEDs
+    osr.write()
+    sleep(1)
+    for led in leds:
+        osr.set_value(led, not osr.value(led))  # toggle all LEDs, turning on only odd numbered LEDs
+    osr.write()
+    sleep(1)
+    for led in leds:
+        osr.set_value(led, False)  # turn off all LEDs
+    osr.write()
+    sleep(1)
+
+
+def change_outputs_with_pin_map():
+    """Example code for setting named groups of outputs across all daisy
+    chained shift registers using a pin map.
+
+    This approach names the outputs once for the whole chain and compiles the
+    groups of outputs into byte masks when the program starts, so setting a
+    group is a single masked update per shift register instead of one
+    operation per output.
+    """
+
+    outputs = osr.gpio  # the shift register output buffer, modified in place
+
+    even_leds.set(outputs, True)   # turn on only even numbered LEDs
+    osr.write()
+    sleep(1)
+    even_leds.set(outputs, False)
+    odd_leds.set(outputs, True)    # turn on only odd numbered LEDs
+    osr.write()
+    sleep(1)
+    even_leds.toggle(outputs)      # turn on all LEDs
+    osr.write()
+    sleep(1)
+    even_leds.set(outputs, False)  # turn off all LEDs
+    odd_leds.set(outputs, False)
+    osr.write()
+    sleep(1)
+
+
 def cycle_leds():
     """Example code that continuously cycles through the LEDs (end to end)."""
 
@@ -236,14 +404,59 @@ def cycle_leds():
         led.value = False
 
 
+def cycle_leds_without_blocking():
+    """Example code that cycles through the LEDs (end to end) once without
+    blocking between LED changes.
+
+    This approach precompiles the LED patterns into frames that are played by
+    a sequencer.  The sequencer only writes to the shift register when the next
+    frame is due, so the loop is free to perform other tasks, e.g. polling
+    inputs, between frames.
+    """
+
+    frames = output_sequencer.cycle_frames(osr.number_of_shift_registers)
+    sequencer = output_sequencer.FrameSequencer(osr, frames, 0.1, output_sequencer.PING_PONG)
+    sequencer.start(monotonic())
+    while sequencer.cycles < 1:
+        sequencer.tick(monotonic())
+        # Perform other tasks here
+    osr.gpio = bytearray(osr.number_of_shift_registers)  # turn off all LEDs
+    print(f"Frames: {sequencer.frames_written} written, {sequencer.frames_skipped} skipped, "
+          f"{sequencer.max_lateness * 1000:.1f} ms maximum lateness")
+
+
+def dim_leds():
+    """Example code that shows a brightness gradient across the LEDs for
+    5 seconds.
+
+    This approach uses binary code modulation to provide 16 brightness levels
+    for each LED.  The outputs must be refreshed continuously for the LEDs to
+    appear dimmed.
+    """
+
+    engine = output_brightness.BrightnessEngine(osr, bits=4)
+    for pin in range(8 * osr.number_of_shift_registers):
+        engine.set_level(pin, (2 * pin + 1) % 16)  # increasing brightness from LED 0
+    end_time = monotonic() + 5
+    while monotonic() < end_time:
+        engine.refresh()
+    engine.stop()  # turn off all LEDs
+    print(f"Refresh rate: {engine.refresh_rate:.0f} Hz")
+
+
 def main():
     """Main program entry."""
 
     while True:
         change_single_outputs()
+        # change_single_outputs_with_batch()
         change_outputs_with_binary_values()
         change_outputs_with_defined_names()
+        # change_outputs_in_place()
+        # change_outputs_with_pin_map()
         # cycle_leds()
+        # cycle_leds_without_blocking()
+        # dim_leds()
 
 
 if __name__ == "__main__":  # required for generating Sphinx documentation
@@ -0,0 +1,173 @@
+"""Declarative named pin maps compiled to byte mask tables.
+
+Description
+-----------
+
+A CircuitPython module that declares names for the pins of a shift register
+chain (or port expanders) once and compiles named pins and groups of named
+pins into per-byte index and mask tables when the program starts.  A group
+is then read or written with one masked operation per affected byte of a
+pin buffer, such as a 74HC595 output buffer or a 74HC165 input buffer,
+instead of one operation per pin, and no names are looked up in the hot loop.
+
+Libraries/Modules
+-----------------
+
+- array Standard Library
+    - https://docs.python.org/3/library/array.html
+    - Provides the compiled byte index tables.
+
+Notes
+-----
+
+- Pin n of a buffer is bit n % 8 of byte n // 8, as used by the shift
+  register drivers and by the inputs of port_expanders.ExpanderBus.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import array
+
+
+# Classes
+class PinGroup:
+    """A compiled group of pins, read and written with one masked operation
+    per affected byte of a pin buffer.
+
+    :param: pins The pin numbers of the group.
+    """
+
+    def __init__(self, pins):
+        masks = {}
+        for pin in pins:
+            masks[pin >> 3] = masks.get(pin >> 3, 0) | (1 << (pin & 7))
+        byte_indexes = sorted(masks)
+        self.pins = tuple(pins)
+        self.byte_indexes = array.array("H", byte_indexes)  # indexes of the affected bytes
+        self.masks = bytes([masks[index] for index in byte_indexes])  # masks of the group's pins in those bytes
+
+    def set(self, buffer, val=True):
+        """Sets all pins of the group to the same value in a buffer.
+
+        :param: buffer The pin buffer, e.g. a 74HC595 output buffer.
+        :param: val    The new value of the pins (True or False).
+        """
+
+        masks = self.masks
+        if val:
+            for index, byte in enumerate(self.byte_indexes):
+                buffer[byte] |= masks[index]
+        else:
+            for index, byte in enumerate(self.byte_indexes):
+                buffer[byte] &= ~masks[index]
+
+    def toggle(self, buffer):
+        """Inverts the values of all pins of the group in a buffer.
+
+        :param: buffer The pin buffer, e.g. a 74HC595 output buffer.
+        """
+
+        masks = self.masks
+        for index, byte in enumerate(self.byte_indexes):
+            buffer[byte] ^= masks[index]
+
+    def any(self, buffer):
+        """Returns whether any pin of the group is high in a buffer.
+
+        :param: buffer The pin buffer, e.g. a 74HC165 input buffer.
+
+        :return: True if at least one pin is high.
+        """
+
+        masks = self.masks
+        for index, byte in enumerate(self.byte_indexes):
+            if buffer[byte] & masks[index]:
+                return True
+        return False
+
+    def all(self, buffer):
+        """Returns whether all pins of the group are high in a buffer.
+
+        :param: buffer The pin buffer, e.g. a 74HC165 input buffer.
+
+        :return: True if every pin is high.
+        """
+
+        masks = self.masks
+        for index, byte in enumerate(self.byte_indexes):
+            if buffer[byte] & masks[index] != masks[index]:
+                return False
+        return True
+
+    def value(self, buffer):
+        """Returns the value of a single pin group in a buffer.
+
+        :param: buffer The pin buffer, e.g. a 74HC165 input buffer.
+
+        :return: The pin value (True or False).
+        """
+
+        return bool(buffer[self.byte_indexes[0]] & self.masks[0])
+
+
+class PinMap:
+    """The pin names of a shift register chain or port expanders.
+
+    Example::
+
+        output_pins = PinMap({"led_0": 0, "led_1": 1, "led_2": 2, "led_3": 3})
+        even_leds = output_pins.group("led_0", "led_2")   # compiled once
+
+        even_leds.set(osr.gpio, True)   # one masked update per byte
+        osr.write()
+
+    :param: names A dictionary of pin numbers by pin name.
+    """
+
+    def __init__(self, names):
+        self.names = dict(names)
+
+    def pin(self, name):
+        """Compiles a single named pin.
+
+        :param: name The pin name.
+
+        :return: The PinGroup instance of the pin.
+        """
+
+        return self.group(name)
+
+    def group(self, *names):
+        """Compiles a group of named pins.
+
+        :param: names The pin names.
+
+        :return: The PinGroup instance of the pins.
+        """
+
+        try:
+            return PinGroup([self.names[name] for name in names])
+        except KeyError as error:
+            raise ValueError(f"Unknown pin name {error}.") from None
+
+    def select(self, predicate):
+        """Compiles a group of the named pins whose names satisfy a condition.
+
+        :param: predicate A function called with each pin name, returning True
+                          to include the pin.
+
+        :return: The PinGroup instance of the selected pins.
+        """
+
+        return self.group(*[name for name in self.names if predicate(name)])
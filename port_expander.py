@@ -32,12 +32,24 @@ Libraries/Modules
 - Adafruit_CircuitPython_MCP230xx CircuitPython Driver Library
     - https://circuitpython.readthedocs.io/projects/mcp230xx/
     - Provides support for MCP23017 I/O expander IC.
+- port_expanders Module (this repository)
+    - Provides a register shadow, batch writes, register image configuration
+      and adaptive interrupt pin polling for the MCP23017 I/O expander IC.
+    - Imported on first use of the MCP23017.
+- virtual_io Module (this repository)
+    - Provides global pin numbers for the MCP23017 pins.
+- reflex Module (this repository)
+    - Provides compiled switch to LED rules with measured latency.
+- lazy Module (this repository)
+    - Provides on-first-use creation of the pins, buses, and ICs.
 
 Notes
 -----
 
 - Provides examples for multiple approaches to configuring and using digital
   I/O with the MCP23017 I/O expander IC.
+- The pins, buses, and ICs are created on first use, and the driver libraries
+  imported then, so importing this program does not access the hardware.
 - Comments are Sphinx (reStructuredText) compatible.
 
 TODO
@@ -50,6 +62,7 @@ Author(s)
 
 - Created by John Woolsey on 07/08/2021.
 - Modified by John Woolsey on 07/27/2021.
+- Modified by agent on 10/18/2026.
 
 Copyright (c) 2021 Woolsey Workshop.  All rights reserved.
 
@@ -61,18 +74,27 @@ Members
 # Imports
 import board
 from digitalio import DigitalInOut, Direction, Pull
-from adafruit_mcp230xx.mcp23017 import MCP23017
+import lazy
+import reflex
+import virtual_io
 
 
 # Pin Mapping
-mcp23017_intb = DigitalInOut(board.D5)
-"""The pin connected to the MCP23017 INTB (19) pin."""
+@lazy.instance(globals())
+def mcp23017_intb():
+    """The pin connected to the MCP23017 INTB (19) pin, created on first use."""
+
+    return DigitalInOut(board.D5)
 
 
 # Global Constants
 MCP23017_I2C_ADDRESS = 0x20
 """The I2C address of the MCP23017 IC."""
 
+INTERRUPT_MAX_LATENCY = 0.01
+"""The longest time between polls of INTB while the switches are idle, in
+seconds, which bounds the switch change detection latency."""
+
 
 # Global Variables
 leds = []
@@ -83,8 +105,59 @@ switches = []
 
 
 # Global Instances
-mcp23017 = MCP23017(board.I2C(), address=MCP23017_I2C_ADDRESS)
-"""The instance of the connected MCP23017 IC."""
+@lazy.instance(globals())
+def mcp23017():
+    """The instance of the connected MCP23017 IC, with a write-through register
+    shadow so that pin writes do not need to read the IC first, created on
+    first use."""
+
+    import port_expanders  # deferred import of the driver library
+    return port_expanders.CachedMCP23017(board.I2C(), address=MCP23017_I2C_ADDRESS)
+
+
+@lazy.instance(globals())
+def port_mirror():
+    """Copies port B (switches) to port A (LEDs), skipping unchanged writes."""
+
+    import port_expanders
+    return port_expanders.PortMirror(lazy.resolve(mcp23017), source=1, destination=0)
+
+
+@lazy.instance(globals())
+def port_mirror_on_interrupt():
+    """Copies port B (switches) to port A (LEDs), reading port B only when INTB
+    is asserted."""
+
+    import port_expanders
+    return port_expanders.PortMirror(lazy.resolve(mcp23017), source=1, destination=0,
+                                     int_pin=lazy.resolve(mcp23017_intb))
+
+
+@lazy.instance(globals())
+def interrupt_queue():
+    """Queues the switch changes captured by the MCP23017 interrupts as events."""
+
+    import port_expanders
+    return port_expanders.InterruptQueue(lazy.resolve(mcp23017), lazy.resolve(mcp23017_intb))
+
+
+@lazy.instance(globals())
+def interrupt_poller():
+    """Polls INTB back to back after switch activity and backs off toward
+    INTERRUPT_MAX_LATENCY while the switches are idle."""
+
+    import port_expanders
+    return port_expanders.InterruptPoller([lazy.resolve(mcp23017_intb)], max_latency=INTERRUPT_MAX_LATENCY)
+
+
+@lazy.instance(globals())
+def reflex_engine():
+    """Drives the LEDs (port A) from the switches (port B) with a compiled rule
+    on a virtual I/O space of the MCP23017 pins."""
+
+    io_space = virtual_io.VirtualIO()
+    expander_pins = io_space.add_expander(lazy.resolve(mcp23017))  # global pin number of GPA0
+    return reflex.ReflexEngine(io_space, [(expander_pins + 8, expander_pins, 8, False)])
 
 
 # Functions
@@ -150,6 +223,33 @@ def configure_interrupts():
     mcp23017.clear_ints()  # clear all interrupts
 
 
+def configure_registers():
+    """Configures MCP23017 I/O pins and interrupts by applying a register image.
+
+    Sets up the same pins, ports and interrupts as configure_pins(),
+    configure_ports() and configure_interrupts() together, but writes only the
+    registers that differ from the IC's current configuration, each range of
+    them with a single sequential write, and nothing at all when called again
+    with an unchanged configuration.
+    """
+
+    import port_expanders
+    mcp23017_intb.direction = Direction.INPUT
+    mcp23017_intb.pull = Pull.UP
+    mcp23017.configure(port_expanders.register_image(
+        iodir=0xFF00,                     # port A pins (LEDs) as outputs and port B pins (switches) as inputs
+        gppu=0xFF00,                      # pull-ups on port B pins (switches) only
+        ipol=0xFF00,                      # inverted polarity on port B pins (switches) only
+        interrupt_enable=0xFF00,          # interrupts on port B pins (switches) only
+        interrupt_configuration=0x0000,   # compare pins against previous values
+        olat=0x0000))                     # all LEDs off
+    mcp23017.clear_ints()  # clear all interrupts
+
+    # LEDs - MCP23017 Port A (pins 0-7), Switches - MCP23017 Port B (pins 8-15)
+    leds[:] = [mcp23017.get_pin(pin) for pin in range(0, 8)]
+    switches[:] = [mcp23017.get_pin(pin) for pin in range(8, 16)]
+
+
 def read_and_write_pin():
     """Example code for reading and writing individual inputs and outputs.
 
@@ -166,6 +266,21 @@ def read_and_write_pin():
             leds[pin].value = False
 
 
+def read_and_write_pin_with_batch():
+    """Example code for reading and writing individual inputs and outputs
+    within a batch.
+
+    This approach keeps the familiar per-pin code of read_and_write_pin(), but
+    only the first switch read within the batch reads the IC and all LED
+    changes are written together in a single write at the end of the batch,
+    making it nearly as efficient as port_copy().
+    """
+
+    with mcp23017.batch():
+        for pin, switch in enumerate(switches):
+            leds[pin].value = switch.value
+
+
 def port_copy():
     """Example code for reading all inputs of port B in a single read and
     setting all outputs of port A with a single write.
@@ -177,6 +292,45 @@ def port_copy():
     mcp23017.gpioa = mcp23017.gpiob
 
 
+def port_copy_on_change():
+    """Example code for copying port B (switches) to port A (LEDs) only when
+    the switches changed.
+
+    This approach still reads port B on every call, but skips the port A write
+    while the switches are unchanged, halving the I2C traffic of port_copy()
+    when the inputs are idle.
+    """
+
+    port_mirror.update()
+
+
+def port_copy_on_interrupt():
+    """Example code for copying port B (switches) to port A (LEDs) only when
+    INTB indicates that a switch changed.
+
+    This approach uses no I2C traffic at all while the switches are idle,
+    leaving the bus free for other devices.  It requires
+    configure_interrupts() to be called first.
+    """
+
+    port_mirror_on_interrupt.update()
+
+
+def port_copy_with_reflex_engine():
+    """Example code for copying port B (switches) to port A (LEDs) with a
+    compiled reflex rule, writing port A only when a switch changed, and
+    periodically printing the measured switch to LED latency.
+
+    This approach declares which inputs drive which outputs once, as rules
+    that also work across shift registers and multiple MCP23017s, and runs
+    them without any per-pin work.
+    """
+
+    reflex_engine.update()
+    if reflex_engine.updates % 10000 == 0:
+        reflex_engine.print_report()
+
+
 def read_and_write_port_on_input_change():
     """Example code using interrupts to determine when an input pin has changed
     and then performs a simple copy from port B (switches) to port A (LEDs).
@@ -194,6 +348,22 @@ def read_and_write_port_on_input_change():
         mcp23017.clear_ints()  # clear all interrupts
 
 
+def read_and_write_port_on_polled_input_change():
+    """Example code using interrupts, polled with an adaptive interval, to
+    determine when an input pin has changed and then performs a simple copy
+    from port B (switches) to port A (LEDs).
+
+    This approach detects changes like read_and_write_port_on_input_change(),
+    but sleeps between polls while the switches are idle instead of using all
+    of the CPU, detecting a change at most INTERRUPT_MAX_LATENCY later.  It
+    requires configure_interrupts() to be called first.
+    """
+
+    if interrupt_poller.wait():  # sleeps until INTB is asserted
+        port_copy()  # copy port B (switches) values to port A (LEDs)
+        mcp23017.clear_ints()  # clear all interrupts
+
+
 def read_and_write_pin_on_input_change():
     """Example code using interrupts to determine when an input pin has
     changed, captures which pin caused the interrupt along with its associated
@@ -215,13 +385,46 @@ def read_and_write_pin_on_input_change():
         mcp23017.clear_ints()  # clear all interrupts
 
 
-# Main
-# configure_pins()
-configure_ports()
-# configure_interrupts()
+def read_and_write_pin_from_event_queue():
+    """Example code using interrupts to queue the changed pins along with
+    their captured values as events, and then updating the appropriate LED
+    pins from the queued events.
+
+    This approach retrieves the interrupt flags and captured values of both
+    ports and clears the interrupts in a single read, so no interrupt can be
+    lost between separate reads, and lets the application process the changes
+    later, e.g. when it is less busy.
+
+    Note: CircuitPython does not currently support GPIO interrupts, so interrupt
+    pin polling is implemented instead.
+    """
+
+    interrupt_queue.service()
+    while interrupt_queue.count:
+        pin, value, _ = interrupt_queue.get()
+        leds[pin - 8].value = value  # set LED output value to captured switch input value
+
+
+def main():
+    """Main program entry."""
+
+    # configure_pins()
+    configure_ports()
+    # configure_interrupts()
+    # configure_registers()
+
+    while True:
+        # read_and_write_pin()
+        # read_and_write_pin_with_batch()
+        port_copy()
+        # port_copy_on_change()
+        # port_copy_on_interrupt()
+        # port_copy_with_reflex_engine()
+        # read_and_write_port_on_input_change()
+        # read_and_write_port_on_polled_input_change()
+        # read_and_write_pin_on_input_change()
+        # read_and_write_pin_from_event_queue()
+
 
-while True:
-    # read_and_write_pin()
-    port_copy()
-    # read_and_write_port_on_input_change()
-    # read_and_write_pin_on_input_change()
+if __name__ == "__main__":  # required for generating Sphinx documentation
+    main()
@@ -0,0 +1,980 @@
+"""Performance extensions for the MCP23017 port expander driver.
+
+Description
+-----------
+
+A CircuitPython module that extends the MCP23017 driver library used by
+port_expander.py with features that reduce the number of I2C transactions
+needed by per-pin code.
+
+- CachedMCP23017 keeps a write-through shadow of the writable registers
+  (IODIR, IPOL, GPINTEN, DEFVAL, INTCON, IOCON, GPPU and OLAT), so reading
+  them (including the read part of every pin level read-modify-write) never
+  uses the bus.
+- A whole register image, e.g. made with register_image(), is applied by
+  comparing it with the shadow and writing only the differing register
+  ranges, each with a single sequential write, so the configuration of all
+  pins, ports and interrupts takes a few transactions, and none if nothing
+  changed.
+- Within a batch, output changes only update the OLAT shadow and all of them
+  are written with a single 16-bit write at the end of the batch, and only if
+  they changed.  The first input read within a batch reads both ports once
+  and later reads are served from that snapshot.
+- PortMirror copies one port to the other, skipping the write while the
+  source port is unchanged and optionally skipping the read while the
+  interrupt pin is not asserted.
+- InterruptQueue services interrupts with a single burst read of the interrupt
+  flag and capture registers of both ports and queues the pin changes as
+  events in a preallocated ring buffer, recording the service latency of each
+  event when it is dequeued.
+- ExpanderBus manages up to eight MCP23017s on one I2C bus as a single 128-pin
+  address space and scans their inputs with one burst read per expander,
+  reporting the achievable per expander and whole bus scan rates, and
+  configures all of them from one register image.
+- InterruptPoller polls one or more INTA/INTB pins, back to back right after
+  activity and with an interval that backs off toward a maximum latency while
+  idle, reporting the detection latency and the CPU duty of the polling.
+
+Libraries/Modules
+-----------------
+
+- array Standard Library
+    - https://docs.python.org/3/library/array.html
+    - Provides the preallocated event timestamp and histogram storage.
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic, monotonic_ns and sleep functions.
+- Adafruit_CircuitPython_MCP230xx CircuitPython Driver Library
+    - https://circuitpython.readthedocs.io/projects/mcp230xx/
+    - Provides support for MCP23017 I/O expander IC.
+
+Notes
+-----
+
+- Copy this file to the board alongside the program that uses it.
+- The shadow assumes that only this instance changes the cached registers.
+  Call reload(), or configure() with read_back enabled, after the MCP23017 was
+  reset or written by other code.
+- Register images use the IOCON.BANK = 0 addressing with sequential operation
+  enabled (IOCON.SEQOP = 0), the MCP23017 power-on default.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import array
+import time
+from adafruit_mcp230xx.digital_inout import DigitalInOut
+from adafruit_mcp230xx.mcp23017 import MCP23017
+
+
+# Global Constants
+IODIRA = 0x00
+"""The address of the IODIRA register (IOCON.BANK = 0)."""
+
+IPOLA = 0x02
+"""The address of the IPOLA register (IOCON.BANK = 0)."""
+
+GPINTENA = 0x04
+"""The address of the GPINTENA register (IOCON.BANK = 0)."""
+
+DEFVALA = 0x06
+"""The address of the DEFVALA register (IOCON.BANK = 0)."""
+
+INTCONA = 0x08
+"""The address of the INTCONA register (IOCON.BANK = 0)."""
+
+IOCON = 0x0A
+"""The address of the IOCON register, which is also accessible at IOCON + 1
+(IOCON.BANK = 0)."""
+
+GPPUA = 0x0C
+"""The address of the GPPUA register (IOCON.BANK = 0)."""
+
+INTFA = 0x0E
+"""The address of the INTFA register (IOCON.BANK = 0)."""
+
+GPIOA = 0x12
+"""The address of the GPIOA register (IOCON.BANK = 0)."""
+
+OLATA = 0x14
+"""The address of the OLATA register (IOCON.BANK = 0)."""
+
+REGISTERS_NUM = 0x16
+"""The number of MCP23017 registers."""
+
+ADDRESSES = tuple(range(0x20, 0x28))
+"""The I2C addresses selectable with the MCP23017 A0-A2 pins."""
+
+IOCON_BANK = 0x80
+"""The IOCON bit selecting the separate port register addressing."""
+
+IOCON_SEQOP = 0x20
+"""The IOCON bit disabling the sequential register address increment."""
+
+BURST_GAP_MAX = 2
+"""The largest number of unchanged registers between two changed ones that
+are rewritten to join both into a single sequential write, since a register
+byte costs less than the address and register bytes of another write.  Never
+joins across the read-only INTF, INTCAP and GPIO registers."""
+
+POLL_BACKOFF_START = 0.0001
+"""The first polling interval, in seconds, when an InterruptPoller backs off
+from polling back to back."""
+
+CACHED_REGISTERS = tuple(range(IODIRA, INTFA)) + (OLATA, OLATA + 1)
+"""The addresses of the writable registers, which are kept in the shadow and
+make up a register image."""
+
+
+# Functions
+def find_expanders(i2c):
+    """Returns the addresses of the MCP23017s (or other devices) responding at
+    the MCP23017 addresses.
+
+    :param: i2c The I2C bus to scan.
+
+    :return: A list of addresses in increasing order.
+    """
+
+    while not i2c.try_lock():
+        pass
+    try:
+        return [address for address in i2c.scan() if address in ADDRESSES]
+    finally:
+        i2c.unlock()
+
+
+def register_image(iodir=0xFFFF, ipol=0x0000, interrupt_enable=0x0000, default_value=0x0000,
+                   interrupt_configuration=0x0000, iocon=0x00, gppu=0x0000, olat=0x0000):
+    """Returns the image of all MCP23017 registers for a configuration, with
+    the 16-bit values of the A register in the low byte and the B register in
+    the high byte, like the driver's combined port properties.
+
+    The defaults are the configuration of a CachedMCP23017 created with reset
+    enabled, i.e. all pins inputs without pull-ups or inverted polarity and
+    interrupts disabled.
+
+    :param: iodir                   The IODIR (1 = input) values.
+    :param: ipol                    The IPOL (1 = inverted input) values.
+    :param: interrupt_enable        The GPINTEN (1 = interrupt on change) values.
+    :param: default_value           The DEFVAL values compared against.
+    :param: interrupt_configuration The INTCON (1 = compare against DEFVAL,
+                                    0 = against the previous value) values.
+    :param: iocon                   The IOCON value.
+    :param: gppu                    The GPPU (1 = pull-up enabled) values.
+    :param: olat                    The OLAT output values.
+
+    :return: A bytearray of the REGISTERS_NUM register values by address, with
+             the read-only registers set to 0.
+    """
+
+    image = bytearray(REGISTERS_NUM)
+    for register, value in ((IODIRA, iodir), (IPOLA, ipol), (GPINTENA, interrupt_enable), (DEFVALA, default_value),
+                            (INTCONA, interrupt_configuration), (IOCON, iocon | (iocon << 8)), (GPPUA, gppu),
+                            (OLATA, olat)):
+        image[register] = value & 0xFF
+        image[register + 1] = (value >> 8) & 0xFF
+    return image
+
+
+# Classes
+class CachedDigitalInOut(DigitalInOut):
+    """A CachedMCP23017 pin.  Writing an output pin value updates the OLAT
+    shadow and writes it without reading GPIO first, and reading an output
+    pin value returns its OLAT bit without using the bus.
+    """
+
+    @property
+    def value(self):
+        """The value of the pin, either True for high or False for low."""
+
+        mask = 1 << self._pin
+        if self._mcp.iodir & mask:
+            return bool(self._mcp.gpio & mask)
+        return bool(self._mcp.olat & mask)
+
+    @value.setter
+    def value(self, val):
+        if val:
+            self._mcp.gpio = self._mcp.olat | (1 << self._pin)
+        else:
+            self._mcp.gpio = self._mcp.olat & ~(1 << self._pin)
+
+
+class CachedMCP23017(MCP23017):
+    """An MCP23017 with a write-through register shadow and batch writes.
+
+    Outside of a batch, every write still goes to the device immediately, but
+    reads of the writable registers are served from the shadow, so a pin level
+    write is one I2C write instead of a read and a write.  Within a batch,
+    writes to GPIO/OLAT are coalesced into one 16-bit write when the batch
+    ends, and GPIO is read only once.
+
+    Example::
+
+        with mcp.batch():
+            for pin, switch in enumerate(switches):
+                leds[pin].value = switch.value   # first read reads GPIO once
+        # single 16-bit OLAT write here
+
+        mcp.configure(register_image(iodir=0xFF00, gppu=0xFF00))
+        # writes only the changed IODIRA and GPPUB registers
+
+    :param: i2c     The I2C bus the MCP23017 is connected to.
+    :param: address The I2C address of the MCP23017.
+    :param: reset   Whether to reset all pins to inputs without pull-ups.
+    """
+
+    def __init__(self, i2c, address=0x20, reset=True):
+        self._shadow = bytearray(REGISTERS_NUM)  # cached register values, by address
+        self._latched = bytearray(2)              # OLAT values last written to the device
+        self._batch_depth = 0                     # number of nested batch blocks
+        self._inputs_cached = False               # whether the GPIO snapshot may be reused
+        self._burst = bytearray(1 + REGISTERS_NUM)  # register address and data of a sequential transfer
+        self.olat_writes = 0                      # number of OLAT writes sent to the device
+        self.configuration_writes = 0             # number of sequential writes sent by configure()
+        super().__init__(i2c, address, reset)
+        self.reload()
+
+    def reload(self):
+        """Reads the cached registers from the device into the shadow, with one
+        sequential read of IODIRA through GPPUB and one of both OLAT
+        registers."""
+
+        burst = self._burst
+        with self._device as device:
+            for start, end in ((IODIRA, INTFA), (OLATA, OLATA + 2)):
+                burst[0] = start
+                device.write_then_readinto(burst, burst, out_end=1, in_start=1, in_end=1 + end - start)
+                self._shadow[start:end] = burst[1:1 + end - start]
+        self._latched[:] = self._shadow[OLATA:OLATA + 2]
+
+    def configure(self, image, read_back=False):
+        """Applies a register image, writing each range of registers that
+        differs from the shadow with a single sequential write.
+
+        Ranges separated by up to BURST_GAP_MAX unchanged registers are joined
+        into one write, but never across the read-only INTF, INTCAP and GPIO
+        registers, whatever BURST_GAP_MAX is.  The read-only registers of the
+        image are ignored.
+
+        :param: image     The REGISTERS_NUM register values by address, e.g.
+                          from register_image().
+        :param: read_back Whether to read the registers from the device first
+                          instead of trusting the shadow, e.g. after the
+                          MCP23017 may have been reset.
+
+        :return: The number of writes sent, 0 if the device already had the
+                 configuration.
+        """
+
+        if len(image) != REGISTERS_NUM:
+            raise ValueError(f"Register image must be {REGISTERS_NUM} bytes.")
+        if image[IOCON] != image[IOCON + 1]:
+            raise ValueError("Register image must have the same IOCON value at both addresses.")
+        if image[IOCON] & (IOCON_BANK | IOCON_SEQOP):
+            raise ValueError("Register image must not set IOCON.BANK or IOCON.SEQOP.")
+        if read_back:
+            self.reload()
+        shadow = self._shadow
+        ranges = []  # [start, end) register ranges to write
+        for register in CACHED_REGISTERS:
+            if image[register] != shadow[register]:
+                joinable = ranges and register - ranges[-1][1] <= BURST_GAP_MAX
+                if joinable and (ranges[-1][1] > GPIOA + 1 or register < INTFA):  # never join across INTFA - GPIOB
+                    ranges[-1][1] = register + 1
+                else:
+                    ranges.append([register, register + 1])
+        if not ranges:
+            return 0
+        burst = self._burst
+        with self._device as device:
+            for start, end in ranges:
+                burst[0] = start
+                burst[1:1 + end - start] = image[start:end]
+                device.write(burst, end=1 + end - start)
+                shadow[start:end] = image[start:end]
+        self._latched[:] = shadow[OLATA:OLATA + 2]
+        self._inputs_cached = False  # the configuration may change the input values
+        self.configuration_writes += len(ranges)
+        return len(ranges)
+
+    def __enter__(self):
+        if self._batch_depth == 0:
+            self._inputs_cached = False  # the first read within the block takes a fresh snapshot
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._inputs_cached = False
+            if self._shadow[OLATA:OLATA + 2] != self._latched:
+                self._write_olat()
+        return False
+
+    def batch(self):
+        """Starts a batch block, to be used with the with statement.
+
+        :return: The MCP23017 itself as the context manager.
+        """
+
+        return self
+
+    def _write_olat(self):
+        # Write both OLAT registers in a single transaction
+        super()._write_u16le(OLATA, self._shadow[OLATA] | (self._shadow[OLATA + 1] << 8))
+        self._latched[:] = self._shadow[OLATA:OLATA + 2]
+        self.olat_writes += 1
+
+    def _read_gpio_snapshot(self):
+        value = super()._read_u16le(GPIOA)
+        self._shadow[GPIOA] = value & 0xFF
+        self._shadow[GPIOA + 1] = value >> 8
+        self._inputs_cached = True
+
+    @property
+    def olat(self):
+        """The OLAT output latch registers of both ports, from the shadow."""
+
+        return self._shadow[OLATA] | (self._shadow[OLATA + 1] << 8)
+
+    def read_interrupts(self, buffer):
+        """Reads the INTFA, INTFB, INTCAPA and INTCAPB registers in a single
+        sequential read, which also clears the interrupts of both ports.
+
+        :param: buffer A bytearray of at least 4 bytes that receives the
+                       register values in that order.
+        """
+
+        buffer[0] = INTFA
+        with self._device as device:
+            device.write_then_readinto(buffer, buffer, out_end=1, in_end=4)
+
+    def get_pin(self, pin):
+        """Returns a CachedDigitalInOut instance for a pin of this MCP23017.
+
+        :param: pin The pin number (0 - 7 = GPA0 - GPA7, 8 - 15 = GPB0 - GPB7).
+
+        :return: The CachedDigitalInOut instance.
+        """
+
+        if not 0 <= pin <= 15:
+            raise ValueError("Pin number must be 0-15.")
+        return CachedDigitalInOut(pin, self)
+
+    # Register access, used by all properties of the base driver
+    def _read_u8(self, register):
+        if register in CACHED_REGISTERS:
+            return self._shadow[register]
+        if self._batch_depth and register in (GPIOA, GPIOA + 1):
+            if not self._inputs_cached:
+                self._read_gpio_snapshot()
+            return self._shadow[register]
+        return super()._read_u8(register)
+
+    def _read_u16le(self, register):
+        if register in CACHED_REGISTERS:
+            return self._shadow[register] | (self._shadow[register + 1] << 8)
+        if self._batch_depth and register == GPIOA:
+            if not self._inputs_cached:
+                self._read_gpio_snapshot()
+            return self._shadow[GPIOA] | (self._shadow[GPIOA + 1] << 8)
+        return super()._read_u16le(register)
+
+    def _write_u8(self, register, val):
+        if register in (GPIOA, GPIOA + 1):
+            register += OLATA - GPIOA  # writing GPIO writes OLAT
+        if register in CACHED_REGISTERS:
+            self._shadow[register] = val & 0xFF
+            if register in (IOCON, IOCON + 1):
+                self._shadow[IOCON] = self._shadow[IOCON + 1] = val & 0xFF  # a single register at both addresses
+            if register >= OLATA:
+                if not self._batch_depth:
+                    self._write_olat()
+                return
+        super()._write_u8(register, val)
+
+    def _write_u16le(self, register, val):
+        if register == GPIOA:
+            register = OLATA  # writing GPIO writes OLAT
+        if register in CACHED_REGISTERS:
+            self._shadow[register] = val & 0xFF
+            self._shadow[register + 1] = (val >> 8) & 0xFF
+            if register == OLATA:
+                if not self._batch_depth:
+                    self._write_olat()
+                return
+        super()._write_u16le(register, val)
+
+
+class PortMirror:
+    """Copies one MCP23017 port to the other, e.g. switches to LEDs, while
+    skipping the bus operations that would not change anything.
+
+    The value last written to the destination port is remembered, so the
+    write is skipped while the source port is unchanged.  If an interrupt pin
+    is given, the source port is only read while the (active low) interrupt
+    pin is asserted, which requires interrupt-on-change to be enabled for the
+    source port pins.  Reading the source port clears its interrupt.
+
+    Example::
+
+        port_mirror = PortMirror(mcp23017, int_pin=mcp23017_intb)
+        while True:
+            port_mirror.update()
+
+    :param: mcp         The MCP23017 instance.
+    :param: source      The port to read (0 = A, 1 = B).
+    :param: destination The port to write (0 = A, 1 = B).
+    :param: int_pin     The DigitalInOut connected to the interrupt pin of the
+                        source port, or None to read the source port on every
+                        update.
+    """
+
+    def __init__(self, mcp, source=1, destination=0, int_pin=None):
+        self._mcp = mcp
+        self._source = source
+        self._destination = destination
+        self._int_pin = int_pin
+        self._value = None  # value last written to the destination port, None before the first write
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """Clears the transaction statistics."""
+
+        self.updates = 0   # number of update() calls
+        self.reads = 0     # number of source port reads
+        self.writes = 0    # number of destination port writes
+        self._started = time.monotonic()
+
+    @property
+    def transactions_saved(self):
+        """The number of transactions saved compared to a read and a write on
+        every update."""
+
+        return 2 * self.updates - self.reads - self.writes
+
+    @property
+    def transactions_saved_per_second(self):
+        """The number of transactions saved per second since the statistics
+        were cleared."""
+
+        elapsed = time.monotonic() - self._started
+        return self.transactions_saved / elapsed if elapsed > 0 else 0.0
+
+    def update(self):
+        """Copies the source port to the destination port if it may have
+        changed.
+
+        :return: True if the destination port was written.
+        """
+
+        self.updates += 1
+        if self._int_pin is not None and self._int_pin.value and self._value is not None:
+            return False  # interrupt not asserted, the source port has not changed
+        value = self._mcp.gpiob if self._source else self._mcp.gpioa
+        self.reads += 1
+        if value == self._value:
+            return False
+        if self._destination:
+            self._mcp.gpiob = value
+        else:
+            self._mcp.gpioa = value
+        self._value = value
+        self.writes += 1
+        return True
+
+    def print_report(self):
+        """Prints the transaction statistics."""
+
+        print(f"Port mirror: {self.updates} updates, {self.reads} reads, {self.writes} writes, "
+              f"{self.transactions_saved_per_second:.0f} transactions/s saved")
+
+
+class InterruptQueue:
+    """Services CachedMCP23017 interrupts into a ring buffer of pin change
+    events.
+
+    Each service reads INTF and INTCAP of both ports in one burst read, which
+    also clears the interrupts, so no interrupt can arrive between reading the
+    flags, reading the captures and clearing them.  A (pin, value, timestamp)
+    event is queued for each flagged pin, where value is the pin's captured
+    value and timestamp is the time the interrupt was detected: the time
+    passed to service(), e.g. the detected time of the InterruptPoller poll
+    that found INTB low, otherwise the time service() itself found INTB low.
+    Events that do not fit in the queue are dropped and counted as overflows.
+
+    The latency of each event, the time from detecting the interrupt to
+    dequeuing the event, is recorded in a histogram when it is dequeued.
+
+    Example::
+
+        interrupt_queue = InterruptQueue(mcp23017, mcp23017_intb)
+        while True:
+            if interrupt_poller.wait():
+                interrupt_queue.service(interrupt_poller.detected)
+            while interrupt_queue.count:
+                pin, value, timestamp = interrupt_queue.get()
+
+    :param: mcp       The CachedMCP23017 instance, with interrupts configured.
+    :param: int_pin   The DigitalInOut connected to the (active low) INTA or
+                      INTB pin, or None to read the interrupt registers on
+                      every service.
+    :param: size      The maximum number of queued events.
+    :param: bins      The number of latency histogram bins, the last of which
+                      also counts all longer latencies.
+    :param: bin_width The latency range of each histogram bin, in seconds.
+    """
+
+    def __init__(self, mcp, int_pin=None, size=32, bins=16, bin_width=0.0005):
+        self._mcp = mcp
+        self._int_pin = int_pin
+        self._buffer = bytearray(4)                  # INTFA, INTFB, INTCAPA, INTCAPB
+        self._pins = bytearray(size)                 # pin numbers of the events
+        self._values = bytearray(size)               # captured values of the events
+        self._timestamps = array.array("Q", [0] * size)  # detection times of the events, in ns
+        self._head = 0                               # index of the oldest event
+        self.count = 0                               # number of queued events
+        self._bin_width = int(bin_width * 1e9)       # in ns
+        self.histogram = array.array("L", [0] * bins)  # number of events per latency bin
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """Clears the counters and the latency histogram."""
+
+        self.services = 0      # number of interrupt register reads
+        self.events = 0        # number of queued events
+        self.overflows = 0     # number of events dropped because the queue was full
+        self.max_latency = 0   # worst time from detection to dequeue, in ns
+        for index in range(len(self.histogram)):
+            self.histogram[index] = 0
+
+    def service(self, timestamp=None):
+        """Reads the interrupt registers if an interrupt is asserted and queues
+        an event for each flagged pin.
+
+        :param: timestamp The time the interrupt was detected in ns, e.g. the
+                          detected time of an InterruptPoller, or None to use
+                          the time this service finds INTB low (or reads the
+                          registers without an interrupt pin).
+
+        :return: The number of flagged pins.
+        """
+
+        if self._int_pin is not None and self._int_pin.value:
+            return 0  # no interrupt asserted
+        if timestamp is None:
+            timestamp = time.monotonic_ns()
+        buffer = self._buffer
+        self._mcp.read_interrupts(buffer)
+        self.services += 1
+        flagged = 0
+        size = len(self._pins)
+        for port in (0, 1):
+            flags = buffer[port]
+            bit = 0
+            while flags:
+                if flags & 1:
+                    flagged += 1
+                    if self.count == size:
+                        self.overflows += 1
+                    else:
+                        tail = (self._head + self.count) % size
+                        self._pins[tail] = 8 * port + bit
+                        self._values[tail] = (buffer[2 + port] >> bit) & 1
+                        self._timestamps[tail] = timestamp
+                        self.count += 1
+                        self.events += 1
+                flags >>= 1
+                bit += 1
+        return flagged
+
+    def get(self, now=None):
+        """Dequeues the oldest event and records its latency.
+
+        :param: now The current time.monotonic_ns() value, or None to read it.
+
+        :return: A (pin, value, timestamp) tuple, or None if the queue is empty.
+        """
+
+        if not self.count:
+            return None
+        if now is None:
+            now = time.monotonic_ns()
+        head = self._head
+        timestamp = self._timestamps[head]
+        latency = now - timestamp
+        if latency > self.max_latency:
+            self.max_latency = latency
+        self.histogram[min(latency // self._bin_width, len(self.histogram) - 1)] += 1
+        self._head = (head + 1) % len(self._pins)
+        self.count -= 1
+        return self._pins[head], bool(self._values[head]), timestamp
+
+    def print_report(self):
+        """Prints the counters and the latency histogram."""
+
+        print(f"Interrupt queue: {self.services} services, {self.events} events, {self.overflows} overflows, "
+              f"{self.max_latency / 1000:.0f} us maximum latency")
+        width = self._bin_width // 1000
+        for index, events in enumerate(self.histogram):
+            if events:
+                upper = f"{(index + 1) * width} us" if index < len(self.histogram) - 1 else "longer"
+                print(f"  {index * width} us - {upper}: {events}")
+
+
+class ExpanderBus:
+    """Manages up to eight MCP23017s on one I2C bus as a single 128-pin
+    address space.
+
+    Pin n of the address space is pin n % 16 of the expander at index n // 16
+    (the expanders are ordered by address), so the inputs buffer holds the
+    GPIOA and GPIOB values of every expander in pin order.
+
+    A scan reads the GPIO registers of the expanders with one burst read per
+    expander while holding the bus lock once for the whole scan, instead of
+    once per expander.  Expanders can be scanned all at once, one per call in
+    round-robin order, or only when their interrupt pin is asserted.
+
+    Example::
+
+        expanders = ExpanderBus(board.I2C())
+        while True:
+            expanders.scan()
+            if expanders.value(37):   # GPA5 of the third expander
+                ...
+
+    :param: i2c       The I2C bus the MCP23017s are connected to.
+    :param: addresses The I2C addresses of the MCP23017s, or None to use all
+                      MCP23017 addresses (0x20 - 0x27) found on the bus.
+    :param: int_pins  A sequence of DigitalInOuts connected to the (active low)
+                      interrupt pin of each MCP23017 (or None where not
+                      connected), or None if no interrupt pins are connected.
+                      Enable IOCON.MIRROR to have one pin signal both ports.
+    :param: reset     Whether to reset all pins to inputs without pull-ups.
+    """
+
+    def __init__(self, i2c, addresses=None, int_pins=None, reset=True):
+        if addresses is None:
+            addresses = find_expanders(i2c)
+        if not 1 <= len(addresses) <= 8:
+            raise ValueError("There must be 1 to 8 MCP23017 addresses.")
+        self._i2c = i2c
+        self.addresses = tuple(addresses)
+        self.expanders = [CachedMCP23017(i2c, address, reset) for address in self.addresses]
+        self.int_pins = tuple(int_pins) if int_pins is not None else (None,) * len(self.addresses)
+        self.inputs = bytearray(2 * len(self.addresses))  # GPIOA and GPIOB of each expander
+        inputs_view = memoryview(self.inputs)
+        self._inputs = [inputs_view[2 * index:2 * index + 2] for index in range(len(self.addresses))]
+        self._command = bytes((GPIOA,))
+        self._next = 0  # index of the next expander to read in round-robin order
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """Clears the scan statistics."""
+
+        self.reads = array.array("L", [0] * len(self.addresses))      # number of reads of each expander
+        self.read_time = array.array("Q", [0] * len(self.addresses))  # total read time of each expander, in ns
+        self.scans = 0       # number of full scans
+        self.scan_time = 0   # total time of the full scans, in ns
+
+    @property
+    def pins_num(self):
+        """The number of pins in the address space."""
+
+        return 16 * len(self.addresses)
+
+    def _read(self, indexes):
+        # Read the GPIO registers of the given expanders while holding the bus lock once
+        i2c = self._i2c
+        while not i2c.try_lock():
+            pass
+        try:
+            for index in indexes:
+                start = time.monotonic_ns()
+                i2c.writeto_then_readfrom(self.addresses[index], self._command, self._inputs[index])
+                self.read_time[index] += time.monotonic_ns() - start
+                self.reads[index] += 1
+        finally:
+            i2c.unlock()
+
+    def scan(self):
+        """Reads the inputs of all expanders, one burst read per expander.
+
+        :return: The inputs buffer.
+        """
+
+        start = time.monotonic_ns()
+        self._read(range(len(self.addresses)))
+        self.scan_time += time.monotonic_ns() - start
+        self.scans += 1
+        return self.inputs
+
+    def scan_next(self):
+        """Reads the inputs of the next expander in round-robin order.
+
+        :return: The index of the expander that was read.
+        """
+
+        index = self._next
+        self._read((index,))
+        self._next = (index + 1) % len(self.addresses)
+        return index
+
+    def scan_interrupted(self):
+        """Reads the inputs of the expanders whose interrupt pin is asserted,
+        and of the expanders without an interrupt pin.
+
+        :return: The number of expanders that were read.
+        """
+
+        indexes = [index for index, int_pin in enumerate(self.int_pins) if int_pin is None or not int_pin.value]
+        if indexes:
+            self._read(indexes)
+        return len(indexes)
+
+    def value(self, pin):
+        """Returns the value of an input pin from the last scan of its
+        expander.
+
+        :param: pin The pin number in the address space (0 - 127).
+
+        :return: The input value (True or False).
+        """
+
+        return bool(self.inputs[pin >> 3] & (1 << (pin & 7)))
+
+    def get_pin(self, pin):
+        """Returns a CachedDigitalInOut instance for a pin of the address
+        space.
+
+        :param: pin The pin number in the address space (0 - 127).
+
+        :return: The CachedDigitalInOut instance.
+        """
+
+        if not 0 <= pin < self.pins_num:
+            raise ValueError(f"Pin number must be 0-{self.pins_num - 1}.")
+        return self.expanders[pin >> 4].get_pin(pin & 15)
+
+    def configure(self, image, read_back=False):
+        """Applies a register image to every expander, writing only the
+        registers that differ on each (see CachedMCP23017.configure()).
+
+        :param: image     The REGISTERS_NUM register values by address, e.g.
+                          from register_image().
+        :param: read_back Whether to read the registers from the devices first
+                          instead of trusting their shadows.
+
+        :return: The total number of writes sent.
+        """
+
+        writes = 0
+        for expander in self.expanders:
+            writes += expander.configure(image, read_back)
+        return writes
+
+    def __enter__(self):
+        for expander in self.expanders:
+            expander.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for expander in self.expanders:
+            expander.__exit__(exc_type, exc_value, traceback)
+        return False
+
+    def batch(self):
+        """Starts a batch block on all expanders, to be used with the with
+        statement, so that each expander's output changes are written with a
+        single write at the end of the block.
+
+        :return: The expander bus itself as the context manager.
+        """
+
+        return self
+
+    def print_report(self):
+        """Prints the per expander and whole bus read rate ceilings."""
+
+        for index, address in enumerate(self.addresses):
+            if self.reads[index]:
+                average = self.read_time[index] / self.reads[index]
+                print(f"MCP23017 0x{address:02X}: {self.reads[index]} reads, {average / 1000:.0f} us average, "
+                      f"{1e9 / average:.0f} reads/s maximum")
+        if self.scans:
+            average = self.scan_time / self.scans
+            print(f"All {len(self.addresses)} MCP23017s: {self.scans} scans, {average / 1000:.0f} us average, "
+                  f"{1e9 / average:.0f} scans/s maximum")
+
+
+class InterruptPoller:
+    """Polls the (active low) interrupt pins of one or more MCP23017s with an
+    interval that adapts to the interrupt activity.
+
+    CircuitPython does not currently support GPIO interrupts, so an interrupt
+    pin has to be polled, and polling it back to back uses all of the CPU.
+    Instead, the pins are polled back to back (or every min_interval) while
+    interrupts were asserted within the last hold seconds, and then with an
+    interval that doubles from POLL_BACKOFF_START up to max_latency, sleeping
+    in between.  A change is therefore detected at most max_latency (plus the
+    time of a poll) after it happened, and max_latency is the setting that
+    trades CPU time and power for responsiveness.
+
+    Every poll that finds an interrupt asserted is a detection, whose latency
+    is at most the time since the previous poll.  The worst and average of
+    that bound are reported as the detection latency.  The time of the poll
+    that first found the currently asserted interrupts is kept as detected,
+    e.g. to timestamp the events of an InterruptQueue.
+
+    Example::
+
+        poller = InterruptPoller([mcp23017_intb], max_latency=0.01)
+        while True:
+            if poller.wait():
+                port_copy()
+                mcp23017.clear_ints()
+
+    :param: int_pins     A sequence of DigitalInOuts connected to the (active
+                         low) INTA or INTB pins.
+    :param: max_latency  The longest interval between polls, in seconds.
+    :param: hold         The time after the last asserted interrupt to keep
+                         polling at min_interval, in seconds.
+    :param: min_interval The interval between polls while active, in seconds,
+                         0 to poll back to back.
+    """
+
+    def __init__(self, int_pins, max_latency=0.01, hold=0.1, min_interval=0.0):
+        if not int_pins:
+            raise ValueError("There must be at least one interrupt pin.")
+        if max_latency < min_interval:
+            raise ValueError("The maximum latency must not be less than the minimum interval.")
+        self.int_pins = tuple(int_pins)
+        self._max_interval = int(max_latency * 1e9)            # in ns
+        self._min_interval = int(min_interval * 1e9)           # in ns
+        self._backoff_start = max(int(POLL_BACKOFF_START * 1e9), self._min_interval)  # in ns
+        self._hold = int(hold * 1e9)                           # in ns
+        self.interval = self._min_interval                     # current time between polls, in ns
+        self._last_poll = None                                 # time of the previous poll, in ns
+        self._asserted = 0                                     # interrupt pins asserted at the previous poll
+        self.detected = None                                   # time of the poll that first found them asserted, in ns
+        self._last_activity = time.monotonic_ns()              # time of the last asserted interrupt, in ns
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """Clears the counters and restarts the CPU duty measurement."""
+
+        self.polls = 0          # number of polls
+        self.detections = 0     # number of polls that found an interrupt newly asserted
+        self.max_latency = 0    # worst detection latency bound, in ns
+        self._total_latency = 0
+        self._sleep_time = 0    # time spent sleeping in wait(), in ns
+        self._started = time.monotonic_ns()
+
+    @property
+    def average_latency(self):
+        """The average detection latency bound, in ns."""
+
+        return self._total_latency / self.detections if self.detections else 0
+
+    @property
+    def cpu_duty(self):
+        """The fraction of time since the statistics were cleared not spent
+        sleeping between polls (0.0 - 1.0)."""
+
+        elapsed = time.monotonic_ns() - self._started
+        return 1.0 - self._sleep_time / elapsed if elapsed else 0.0
+
+    def poll(self, now=None):
+        """Reads the interrupt pins once and adapts the polling interval.
+
+        :param: now The current time.monotonic_ns() value, or None to read it.
+
+        :return: A bit mask of the asserted interrupt pins (bit n for
+                 int_pins[n]), 0 if none.
+        """
+
+        if now is None:
+            now = time.monotonic_ns()
+        asserted = 0
+        for index, int_pin in enumerate(self.int_pins):
+            if not int_pin.value:  # active low
+                asserted |= 1 << index
+        self.polls += 1
+        if asserted:
+            if asserted & ~self._asserted:  # count each interrupt once, not every poll until it is cleared
+                if self._last_poll is not None:
+                    latency = now - self._last_poll  # the interrupt was asserted after the previous poll
+                    self._total_latency += latency
+                    if latency > self.max_latency:
+                        self.max_latency = latency
+                self.detections += 1
+            if not self._asserted:
+                self.detected = now
+            self._last_activity = now
+            self.interval = self._min_interval
+        elif now - self._last_activity >= self._hold:
+            self.interval = min(max(2 * self.interval, self._backoff_start), self._max_interval)
+        self._last_poll = now
+        self._asserted = asserted
+        return asserted
+
+    def wait(self, timeout=None):
+        """Polls the interrupt pins, sleeping between polls, until an interrupt
+        is asserted.  The caller must clear the interrupt before waiting again.
+
+        :param: timeout The longest time to wait, in seconds, or None to wait
+                        forever.
+
+        :return: A bit mask of the asserted interrupt pins (bit n for
+                 int_pins[n]), 0 if the wait timed out.
+        """
+
+        end = None if timeout is None else time.monotonic_ns() + int(timeout * 1e9)
+        while True:
+            asserted = self.poll()
+            if asserted:
+                return asserted
+            now = time.monotonic_ns()
+            if end is not None and now >= end:
+                return 0
+            delay = self._last_poll + self.interval - now
+            if end is not None:
+                delay = min(delay, end - now)
+            if delay > 0:
+                time.sleep(delay / 1e9)
+                self._sleep_time += time.monotonic_ns() - now
+
+    def run(self, function, duration=None):
+        """Calls a function with the mask of the asserted interrupt pins every
+        time an interrupt is asserted.  The function must clear the interrupts.
+
+        :param: function The function to call, as function(asserted).
+        :param: duration The number of seconds to run for, or None to run
+                         forever.
+        """
+
+        end = None if duration is None else time.monotonic_ns() + int(duration * 1e9)
+        while end is None or time.monotonic_ns() < end:
+            asserted = self.wait(None if end is None else (end - time.monotonic_ns()) / 1e9)
+            if asserted:
+                function(asserted)
+
+    def print_report(self):
+        """Prints the counters, the detection latency and the CPU duty."""
+
+        print(f"Interrupt poller: {self.polls} polls, {self.detections} detections, "
+              f"latency {self.average_latency / 1000:.0f} us average / {self.max_latency / 1000:.0f} us maximum, "
+              f"interval {self.interval / 1000:.0f} us, CPU duty {self.cpu_duty * 100:.1f} %")
@@ -0,0 +1,144 @@
+"""Profiles the bus cost of three ways of reading 74HC165 inputs.
+
+Description
+-----------
+
+A CircuitPython program that reads the inputs of a 74HC165 shift register IC
+one pin at a time, one pin at a time from a single snapshot, and all at once,
+the same as read_single_inputs(), read_single_inputs_with_snapshot() and
+read_inputs_with_binary_values() of input_shift_register.py, with the SPI bus
+and latch pin wrapped by a profiler.  Every PROFILING_REPORT_PERIOD seconds it
+prints the bus transactions, bytes, latch pulses, bus time and total time per
+call of each approach, so the cost of the bus can be told apart from
+everything else, e.g. print formatting.
+
+Circuit
+-------
+
+- The same circuit as input_shift_register.py.
+- A 74HC165 shift register IC is connected to the board's SPI serial bus and D5
+  pins.
+    - The SPI SCK pin is connected to the 74HC165 CLK (2) pin.
+    - The SPI MISO pin is connected to the 74HC165 QH (9) pin.
+    - The D5 pin is connected to the 74HC165 SH/LD (1) pin.
+    - 8 switches, with pull-down resistors, are connected to the 74HC165's input
+      pins (A - H).
+
+Libraries/Modules
+-----------------
+
+- board CircuitPython Core Module
+    - https://circuitpython.readthedocs.io/en/latest/shared-bindings/board/
+    - Access to board's GPIO pins and hardware.
+- digitalio CircuitPython Core Module
+    - https://circuitpython.readthedocs.io/en/latest/shared-bindings/digitalio/
+    - Provides basic digital pin I/O support.
+- WoolseyWorkshop_CircuitPython_74HC165 CircuitPython Driver Library
+    - https://woolseyworkshop-circuitpython-74hc165.readthedocs.io
+    - Provides support for 74HC165 shift register IC.
+- bus_hooks Module (this repository)
+    - Provides the wrapping of the SPI bus and latch pin.
+- instrumentation Module (this repository)
+    - Provides bus and latch profiling of the example functions.
+- shift_registers Module (this repository)
+    - Provides snapshot reads for the 74HC165 shift register IC.
+
+Notes
+-----
+
+- Setting PROFILING to False runs the same functions on the original bus and
+  pin objects, for comparing the overhead of the profiler.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import board
+import digitalio
+import bus_hooks
+import instrumentation
+import shift_registers
+
+
+# Global Constants
+SHIFT_REGISTERS_NUM = 1
+"""The number of daisy chained 74HC165 shift registers."""
+
+PROFILING = True
+"""Whether to count the bus transactions, bytes, latch pulses and time of each
+example function and periodically print them."""
+
+PROFILING_REPORT_PERIOD = 10
+"""The time between profiling reports in seconds."""
+
+
+# Global Instances
+profiler = instrumentation.Profiler(enabled=PROFILING)
+"""The profiler of the example functions."""
+
+hooks = bus_hooks.BusHooks(profiler)
+"""The wrapper of the SPI bus and latch pin, passing their activity to the
+profiler."""
+
+isr = shift_registers.InputShiftRegister(hooks.wrap_spi(board.SPI()),
+                                         hooks.wrap_pin(digitalio.DigitalInOut(board.D5), "isr_latch_pin"),
+                                         SHIFT_REGISTERS_NUM)
+"""The instance of the connected 74HC165 shift register IC, on the profiled
+SPI bus and latch pin."""
+
+inputs = [isr.get_pin(pin) for pin in range(8 * SHIFT_REGISTERS_NUM)]
+"""The input pins of the shift register."""
+
+
+# Functions
+@profiler.profile
+def read_single_inputs():
+    """Reads and prints the inputs one pin at a time, latching and shifting
+    all inputs for each pin."""
+
+    for pin, switch in enumerate(inputs):
+        print(f"Input {pin} = {switch.value}")
+
+
+@profiler.profile
+def read_single_inputs_with_snapshot():
+    """Reads and prints the inputs one pin at a time from a single snapshot of
+    all inputs."""
+
+    with isr.snapshot():
+        for pin, switch in enumerate(inputs):
+            print(f"Input {pin} = {switch.value}")
+
+
+@profiler.profile
+def read_inputs_with_binary_values():
+    """Reads all inputs at once and prints them in binary format."""
+
+    print("Inputs: ", end="")
+    for byte in isr.gpio:
+        print(f"{byte:08b}", end=" ")  # print the current byte in binary format
+    print()
+
+
+def main():
+    """Main program entry."""
+
+    while True:
+        read_single_inputs()
+        read_single_inputs_with_snapshot()
+        read_inputs_with_binary_values()
+        profiler.report(PROFILING_REPORT_PERIOD)
+
+
+if __name__ == "__main__":  # required for generating Sphinx documentation
+    main()
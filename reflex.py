@@ -0,0 +1,216 @@
+"""Compiled input-to-output reflex rules with measured latency.
+
+Description
+-----------
+
+A CircuitPython module that copies inputs of 74HC165 chains or MCP23017s to
+outputs of 74HC595 chains or MCP23017s according to rules declared on the
+global pins of a virtual_io.VirtualIO space, e.g. "switches 0 - 7 drive LEDs
+8 - 15, inverted".  The rules are compiled once into per-byte mask, shift and
+invert operations, so an update reads each input device once, runs a few
+bitwise operations per byte and writes each changed output device once,
+without any per-pin work.
+
+Each update whose inputs changed records its reaction latency, the time from
+the start of the input reads (or a given change time) to the end of the
+output writes, in a preallocated ring, and the report shows the p50 and p99
+percentiles and the maximum.
+
+Libraries/Modules
+-----------------
+
+- array Standard Library
+    - https://docs.python.org/3/library/array.html
+    - Provides the compiled operation tables and the latency storage.
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic_ns function.
+
+Notes
+-----
+
+- The input-to-output latency of a change is at most the time between
+  updates plus the reaction latency, so the reaction p99 plus the update
+  period is the figure to check against interlock timing requirements.
+- Output pins of an MCP23017 must be configured as outputs on the device
+  before the rules are compiled.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import array
+import time
+
+
+# Classes
+class ReflexEngine:
+    """Runs compiled input-to-output rules on a virtual I/O space.
+
+    Each rule is an (input_pin, output_pin, count, invert) tuple that drives
+    count consecutive output pins starting at output_pin from count
+    consecutive input pins starting at input_pin, inverted if invert is True.
+
+    Example::
+
+        vio = virtual_io.VirtualIO()
+        switches = vio.add_inputs(isr)
+        leds = vio.add_outputs(osr)
+        engine = ReflexEngine(vio, [(switches, leds, 8, False)])
+        while True:
+            engine.update()
+
+    :param: vio       The virtual_io.VirtualIO instance the rules refer to.
+    :param: rules     The (input_pin, output_pin, count, invert) rules.
+    :param: latencies The number of most recent latencies kept for the
+                      percentiles.
+    """
+
+    def __init__(self, vio, rules, latencies=256):
+        self._vio = vio
+        self._latencies = array.array("Q", [0] * latencies)  # most recent reaction latencies, in ns
+        self._compile(rules)
+        self.reset_statistics()
+
+    def _compile(self, rules):
+        # Group the rule bits into one operation per (input byte, output byte, shift, invert) combination
+        vio = self._vio
+        groups = {}
+        outputs = set()
+        for input_pin, output_pin, count, invert in rules:
+            for offset in range(count):
+                source = input_pin + offset
+                target = output_pin + offset
+                input_device, input_byte, input_mask = vio.locate(source)
+                output_device, output_byte, output_mask = vio.locate(target)
+                if not vio.devices[input_device].inputs:
+                    raise ValueError(f"Pin {source} is not an input.")
+                device = vio.devices[output_device]
+                if not device.outputs or device.inputs and device.input_bits(output_byte) & output_mask:
+                    raise ValueError(f"Pin {target} is not an output.")
+                if target in outputs:
+                    raise ValueError(f"Pin {target} is driven by more than one rule.")
+                outputs.add(target)
+                shift = output_mask.bit_length() - input_mask.bit_length()
+                key = (input_device, input_byte, output_device, output_byte, shift, bool(invert))
+                groups[key] = groups.get(key, 0) | input_mask
+        keys = sorted(groups)
+        self._input_device = bytearray([key[0] for key in keys])
+        self._input_byte = array.array("H", [key[1] for key in keys])
+        self._output_device = bytearray([key[2] for key in keys])
+        self._output_byte = array.array("H", [key[3] for key in keys])
+        self._shift = array.array("b", [key[4] for key in keys])
+        self._mask = bytearray([groups[key] for key in keys])  # input bits
+        self._output_mask = bytearray([(groups[key] << key[4]) & 0xFF if key[4] >= 0 else groups[key] >> -key[4]
+                                       for key in keys])      # output bits
+        self._invert = bytearray([self._output_mask[index] if keys[index][5] else 0 for index in range(len(keys))])
+        self._buffers = [device.buffer for device in vio.devices]
+        sources = sorted(set(self._input_device))
+        targets = sorted(set(self._output_device))
+        self._sources = [vio.devices[index] for index in sources]
+        self._previous = [bytearray(len(device.buffer)) for device in self._sources]  # inputs of the last update
+        self._targets = [vio.devices[index] for index in targets]
+        self._latched = [bytearray(device.buffer) for device in self._targets]  # outputs last written
+        self._forced = True  # whether the next update computes the outputs even if no inputs changed
+
+    @property
+    def operations(self):
+        """The number of compiled byte operations run per update."""
+
+        return len(self._mask)
+
+    def reset_statistics(self):
+        """Clears the counters and the recorded latencies."""
+
+        self.updates = 0       # number of updates
+        self.reactions = 0     # number of updates with changed inputs
+        self.writes = 0        # number of output device writes
+        self.max_latency = 0   # worst reaction latency, in ns
+        self._recorded = 0     # number of latencies recorded since the last reset
+
+    def update(self, changed_at=None):
+        """Reads the input devices and, if any of their inputs changed, computes
+        the outputs and writes the output devices whose outputs changed.
+
+        :param: changed_at The time the inputs are known to have changed in ns,
+                           e.g. an interrupt timestamp, or None to measure the
+                           latency from the start of the input reads.
+
+        :return: True if the inputs changed.
+        """
+
+        start = time.monotonic_ns() if changed_at is None else changed_at
+        changed = self._forced
+        for index, device in enumerate(self._sources):
+            device.read()
+            if device.buffer != self._previous[index]:
+                changed = True
+        self.updates += 1
+        if not changed:
+            return False
+        self._forced = False
+        for device in self._targets:
+            device.load()  # pick up outputs written directly to the devices
+
+        buffers = self._buffers
+        input_device = self._input_device
+        input_byte = self._input_byte
+        output_device = self._output_device
+        output_byte = self._output_byte
+        shifts = self._shift
+        masks = self._mask
+        output_masks = self._output_mask
+        inverts = self._invert
+        for op in range(len(masks)):
+            value = buffers[input_device[op]][input_byte[op]] & masks[op]
+            shift = shifts[op]
+            value = value << shift if shift >= 0 else value >> -shift
+            target = buffers[output_device[op]]
+            byte = output_byte[op]
+            target[byte] = (target[byte] & ~output_masks[op]) | (value ^ inverts[op])
+
+        for index, device in enumerate(self._targets):
+            if device.buffer != self._latched[index]:
+                device.write()
+                self._latched[index][:] = device.buffer
+                self.writes += 1
+        for index, device in enumerate(self._sources):
+            self._previous[index][:] = device.buffer  # includes the outputs of devices that are also targets
+        latency = time.monotonic_ns() - start
+        self._latencies[self._recorded % len(self._latencies)] = latency
+        self._recorded += 1
+        self.reactions += 1
+        if latency > self.max_latency:
+            self.max_latency = latency
+        return True
+
+    def percentile(self, percent):
+        """Returns a percentile of the recorded reaction latencies.
+
+        :param: percent The percentile (0 - 100), e.g. 99.
+
+        :return: The latency in ns, or 0 if none were recorded.
+        """
+
+        count = min(self._recorded, len(self._latencies))
+        if not count:
+            return 0
+        latencies = sorted(self._latencies[:count])
+        return latencies[min(count - 1, int(count * percent / 100))]
+
+    def print_report(self):
+        """Prints the counters and the reaction latency percentiles."""
+
+        print(f"Reflex engine: {self.operations} operations, {self.updates} updates, {self.reactions} reactions, "
+              f"{self.writes} writes, latency p50 {self.percentile(50) / 1000:.0f} us, "
+              f"p99 {self.percentile(99) / 1000:.0f} us, max {self.max_latency / 1000:.0f} us")
@@ -0,0 +1,201 @@
+"""Drift-free fixed-rate task scheduler.
+
+Description
+-----------
+
+A CircuitPython module that runs periodic tasks, e.g. input sampling, output
+refreshes and port expander polling, on absolute deadlines.  Each task's next
+deadline is computed from its previous deadline rather than from the time it
+actually ran, so late runs do not accumulate into drift.  Between deadlines
+the scheduler sleeps instead of spinning.
+
+For each task, the scheduler records the period jitter (the difference between
+the actual and the nominal time between runs), the worst lateness, and the
+number of overruns (deadlines missed by a whole period or more, which are
+skipped).  The scheduler also records its CPU duty, the fraction of time spent
+running tasks rather than sleeping.
+
+Libraries/Modules
+-----------------
+
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic_ns and sleep functions.
+
+Notes
+-----
+
+- All times are kept as integer nanoseconds from time.monotonic_ns() to avoid
+  the loss of precision of time.monotonic() floats on long running boards.
+- Task functions take no arguments.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import time
+
+
+# Classes
+class Task:
+    """A periodic task and its timing statistics.
+
+    :param: function The function to run.
+    :param: period   The time between runs, in seconds.
+    :param: name     The name used in reports, defaults to the function's name.
+    """
+
+    def __init__(self, function, period, name=None):
+        self.function = function
+        self.period = int(period * 1e9)  # in ns
+        self.name = name if name is not None else function.__name__
+        self.deadline = 0                # time of the next run, in ns
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """Clears the timing statistics."""
+
+        self.runs = 0            # number of runs
+        self.overruns = 0        # number of deadlines skipped because they were missed by a whole period
+        self.max_lateness = 0    # worst time between a deadline and the run, in ns
+        self.max_jitter = 0      # worst absolute difference between the actual and nominal period, in ns
+        self.busy_time = 0       # total time spent running, in ns
+        self.total_jitter = 0    # sum of the absolute period jitter, in ns
+        self.last_start = None   # time of the previous run, in ns
+
+    @property
+    def average_jitter(self):
+        """The average absolute period jitter, in ns."""
+
+        return self.total_jitter // (self.runs - 1) if self.runs > 1 else 0
+
+
+class Scheduler:
+    """Runs periodic tasks on absolute deadlines.
+
+    Example::
+
+        scheduler = Scheduler()
+        scheduler.add(read_inputs, 1.0 / SAMPLE_RATE)
+        scheduler.add(refresh_outputs, 0.01)
+        scheduler.run()
+    """
+
+    def __init__(self):
+        self.tasks = []
+        self._busy_time = 0  # time spent running tasks, in ns
+        self._started = None
+
+    def add(self, function, period, name=None):
+        """Adds a periodic task, first run as soon as the scheduler starts.
+
+        :param: function The function to run.
+        :param: period   The time between runs, in seconds.
+        :param: name     The name used in reports.
+
+        :return: The new Task instance.
+        """
+
+        task = Task(function, period, name)
+        self.tasks.append(task)
+        if self._started is not None:
+            task.deadline = time.monotonic_ns()
+        return task
+
+    def start(self, now=None):
+        """Sets the first deadline of all tasks and clears the statistics.
+
+        :param: now The current time.monotonic_ns() value, or None to read it.
+        """
+
+        if now is None:
+            now = time.monotonic_ns()
+        self._started = now
+        self._busy_time = 0
+        for task in self.tasks:
+            task.deadline = now
+            task.reset_statistics()
+
+    @property
+    def cpu_duty(self):
+        """The fraction of time since start() spent running tasks (0.0 - 1.0)."""
+
+        if self._started is None:
+            return 0.0
+        elapsed = time.monotonic_ns() - self._started
+        return self._busy_time / elapsed if elapsed else 0.0
+
+    def run_pending(self, now=None):
+        """Runs every task whose deadline has been reached, without blocking.
+
+        :param: now The current time.monotonic_ns() value, or None to read it.
+
+        :return: The time of the next deadline, in ns.
+        """
+
+        if self._started is None:
+            self.start(now)
+        if now is None:
+            now = time.monotonic_ns()
+        for task in self.tasks:
+            if now < task.deadline:
+                continue
+            lateness = now - task.deadline
+            if lateness > task.max_lateness:
+                task.max_lateness = lateness
+            if task.last_start is not None:
+                jitter = abs(now - task.last_start - task.period)
+                task.total_jitter += jitter
+                if jitter > task.max_jitter:
+                    task.max_jitter = jitter
+            task.last_start = now
+            task.function()
+            finished = time.monotonic_ns()
+            task.runs += 1
+            task.busy_time += finished - now
+            self._busy_time += finished - now
+            # Next deadline is absolute.  A deadline missed by less than a
+            # period runs late on the next call, whole periods are skipped.
+            task.deadline += task.period
+            skipped = (finished - task.deadline) // task.period
+            if skipped > 0:
+                task.overruns += skipped
+                task.deadline += skipped * task.period
+            now = finished
+        return min(task.deadline for task in self.tasks)
+
+    def run(self, duration=None):
+        """Runs the tasks, sleeping between deadlines.
+
+        :param: duration The number of seconds to run for, or None to run
+                         forever.
+        """
+
+        self.start()
+        end = None if duration is None else self._started + int(duration * 1e9)
+        while end is None or time.monotonic_ns() < end:
+            next_deadline = self.run_pending()
+            delay = next_deadline - time.monotonic_ns()
+            if end is not None:
+                delay = min(delay, end - time.monotonic_ns())
+            if delay > 0:
+                time.sleep(delay / 1e9)
+
+    def print_report(self):
+        """Prints the timing statistics of all tasks."""
+
+        print(f"CPU duty: {self.cpu_duty * 100:.1f} %")
+        for task in self.tasks:
+            print(f"{task.name}: {task.runs} runs, {task.overruns} overruns, "
+                  f"jitter {task.average_jitter / 1000:.0f} us average / {task.max_jitter / 1000:.0f} us maximum, "
+                  f"lateness {task.max_lateness / 1000:.0f} us maximum")
@@ -0,0 +1,403 @@
+"""Performance extensions for the 74HC165 and 74HC595 shift register drivers.
+
+Description
+-----------
+
+A CircuitPython module that extends the shift register driver libraries used
+by input_shift_register.py and output_shift_register.py with features that
+reduce the number of SPI shift operations needed by per-pin code.
+
+- InputShiftRegister extends the 74HC165 driver with snapshot reads, where the
+  first read within a snapshot latches and shifts the whole chain once and
+  later reads are served from the cached input buffer.
+- OutputShiftRegister extends the 74HC595 driver with batch writes, where all
+  output changes made within a batch are collected in the output buffer and
+  shifted and latched once at the end of the batch, only if they changed.
+- Both provide readinto()/write() style transfers of whole chains to and from
+  preallocated buffers and per-pin access through precomputed byte index and
+  bit mask tables, so long chains (64+ registers) can be refreshed without
+  allocating memory or computing pin positions in the hot loop.
+- FullDuplexShiftRegisters refreshes a 74HC165 chain and a 74HC595 chain
+  sharing the same SPI bus with a single full-duplex transfer, shifting the
+  outputs out on MOSI while the inputs are shifted in on MISO.
+
+Libraries/Modules
+-----------------
+
+- array Standard Library
+    - https://docs.python.org/3/library/array.html
+    - Provides the preallocated byte index tables.
+- time Standard Library
+    - https://docs.python.org/3/library/time.html
+    - Access to monotonic function.
+- WoolseyWorkshop_CircuitPython_74HC165 CircuitPython Driver Library
+    - https://woolseyworkshop-circuitpython-74hc165.readthedocs.io
+    - Provides support for 74HC165 shift register IC.
+- Adafruit_CircuitPython_74HC595 CircuitPython Driver Library
+    - https://circuitpython.readthedocs.io/projects/74hc595/
+    - Provides support for 74HC595 shift register IC.
+- Adafruit_CircuitPython_BusDevice CircuitPython Driver Library
+    - https://circuitpython.readthedocs.io/projects/busdevice/
+    - Provides the SPI device used for full-duplex transfers.
+
+Notes
+-----
+
+- Copy this file to the board alongside the program that uses it.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import array
+import time
+import adafruit_74hc595
+import wws_74hc165
+from adafruit_bus_device import spi_device
+
+
+# Functions
+def pin_tables(number_of_shift_registers):
+    """Returns the byte index and bit mask lookup tables of a chain's pins.
+
+    :param: number_of_shift_registers The number of daisy chained shift
+                                      registers.
+
+    :return: A tuple of an array of the index of each pin's byte in the chain
+             buffer and a bytes object of each pin's bit mask within its byte.
+    """
+
+    pins = range(8 * number_of_shift_registers)
+    return array.array("H", [pin >> 3 for pin in pins]), bytes([1 << (pin & 7) for pin in pins])
+
+
+# Classes
+class InputShiftRegister(wws_74hc165.ShiftRegister74HC165):
+    """A 74HC165 shift register chain with snapshot reads.
+
+    Outside of a snapshot, every read of gpio (and therefore every pin value
+    read) latches and shifts the whole chain, the same as the base driver.
+    Within a snapshot, only the first read shifts the chain and later reads
+    return the cached inputs until the snapshot expires or is invalidated.
+
+    Example::
+
+        with isr.snapshot():           # or isr.snapshot(lifetime=0.01)
+            a = isr.get_pin(0).value   # latches and shifts the chain
+            b = isr.get_pin(1).value   # served from the snapshot
+
+    :param: spi                       The SPI bus the chain is connected to.
+    :param: latch                     The pin connected to the SH/LD pin.
+    :param: number_of_shift_registers The number of daisy chained 74HC165s.
+    :param: baudrate                  The SPI clock rate in Hz.
+    :param: snapshot_lifetime         If not None, the number of seconds any
+                                      read is reused for, even outside of a
+                                      snapshot block.
+    """
+
+    def __init__(self, spi, latch, number_of_shift_registers=1, baudrate=1000000, snapshot_lifetime=None):
+        super().__init__(spi, latch, number_of_shift_registers, baudrate)
+        self.snapshot_lifetime = snapshot_lifetime
+        self.shifts = 0           # number of times the chain was latched and shifted
+        self._snapshot_depth = 0  # number of nested snapshot blocks
+        self._lifetime = None     # lifetime of the current snapshot block (None = whole block)
+        self._cached = False      # whether the cached inputs may be reused
+        self._expiry = None       # time the cached inputs expire, None if they never expire
+        self.byte_index, self.bit_mask = pin_tables(number_of_shift_registers)
+
+    def __enter__(self):
+        if self._snapshot_depth == 0:
+            self.invalidate()  # the first read within the block takes a fresh snapshot
+        self._snapshot_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._snapshot_depth -= 1
+        if self._snapshot_depth == 0:
+            self._lifetime = None
+            self.invalidate()
+        return False
+
+    def snapshot(self, lifetime=None):
+        """Starts a snapshot block, to be used with the with statement.
+
+        :param: lifetime The number of seconds the snapshot remains valid, or
+                         None to keep it valid until the end of the block.
+
+        :return: The shift register itself as the context manager.
+        """
+
+        self._lifetime = lifetime
+        return self
+
+    def invalidate(self):
+        """Discards the cached inputs so that the next read shifts the chain."""
+
+        self._cached = False
+
+    @property
+    def gpio(self):
+        """The raw GPIO input register.  Each bit represents the input value of
+        the associated pin (0 = low, 1 = high).  Served from the cached inputs
+        while a snapshot is valid.
+        """
+
+        if self._cached and (self._expiry is None or time.monotonic() < self._expiry):
+            return self._gpio
+        gpio = super().gpio
+        self.shifts += 1
+        lifetime = self._lifetime if self._snapshot_depth else self.snapshot_lifetime
+        self._cached = bool(self._snapshot_depth) or lifetime is not None
+        self._expiry = None if lifetime is None else time.monotonic() + lifetime
+        return gpio
+
+    @gpio.setter
+    def gpio(self, val):
+        raise RuntimeError("Setting gpio is not supported.")
+
+    def readinto(self, buffer):
+        """Latches and shifts the whole chain directly into a preallocated
+        buffer, bypassing the snapshot cache.
+
+        :param: buffer A bytearray or memoryview as wide as the chain.
+
+        :return: The buffer.
+        """
+
+        self._latch.value = True
+        with self._device as spi:
+            spi.readinto(buffer)
+        self._latch.value = False
+        self.shifts += 1
+        return buffer
+
+    def value(self, pin, inputs=None):
+        """Returns the value of an input from already read inputs, without
+        shifting the chain.
+
+        :param: pin    The pin number (0 - 8 * number_of_shift_registers - 1).
+        :param: inputs The inputs buffer, e.g. filled by readinto(), or None
+                       for the inputs last read through gpio.
+
+        :return: The input value (True or False).
+        """
+
+        if inputs is None:
+            inputs = self._gpio
+        return bool(inputs[self.byte_index[pin]] & self.bit_mask[pin])
+
+
+class OutputShiftRegister(adafruit_74hc595.ShiftRegister74HC595):
+    """A 74HC595 shift register chain with batch writes.
+
+    Outside of a batch, every write of gpio (and therefore every pin value
+    write) shifts and latches the whole chain, the same as the base driver.
+    Within a batch, writes only update the output buffer and the chain is
+    shifted and latched once when the batch ends, which also avoids visible
+    intermediate output states, and not at all if the outputs did not change
+    since the last shift.  Since the chain's outputs are unknown after
+    power-up, the first batch is always shifted out.
+
+    Example::
+
+        with osr.batch():
+            led_0.value = True   # no shift
+            led_2.value = True   # no shift
+        # single shift and latch here
+
+    :param: spi                       The SPI bus the chain is connected to.
+    :param: latch                     The pin connected to the RCLK pin.
+    :param: number_of_shift_registers The number of daisy chained 74HC595s.
+    :param: baudrate                  The SPI clock rate in Hz.
+    """
+
+    def __init__(self, spi, latch, number_of_shift_registers=1, baudrate=1000000):
+        super().__init__(spi=spi, latch=latch, number_of_shift_registers=number_of_shift_registers, baudrate=baudrate)
+        self.shifts = 0        # number of times the chain was shifted and latched
+        self._batch_depth = 0  # number of nested batch blocks
+        self._latched = None   # outputs last shifted to the chain, None until the first shift
+        self.byte_index, self.bit_mask = pin_tables(number_of_shift_registers)
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        if self._batch_depth == 0 and self._gpio != self._latched:
+            self._shift_out()
+        return False
+
+    def batch(self):
+        """Starts a batch block, to be used with the with statement.
+
+        :return: The shift register itself as the context manager.
+        """
+
+        return self
+
+    def _shift_out(self):
+        # Shift out the output buffer and latch it (the latch is the SPI chip select)
+        with self._device as spi:
+            spi.write(self._gpio)
+        if self._latched is None:
+            self._latched = bytearray(self._gpio)
+        else:
+            self._latched[:] = self._gpio
+        self.shifts += 1
+
+    @property
+    def gpio(self):
+        """The raw GPIO output register.  Each bit represents the output value
+        of the associated pin (0 = low, 1 = high).  Includes changes pending
+        within a batch.
+        """
+
+        return self._gpio
+
+    @gpio.setter
+    def gpio(self, val):
+        self._gpio = val
+        if not self._batch_depth:
+            self._shift_out()
+
+    def write(self, buffer=None):
+        """Copies a buffer into the output buffer in place and shifts and
+        latches it, or only records the change within a batch.
+
+        :param: buffer A bytes-like object as wide as the chain, or None to
+                       write the output buffer as modified in place, e.g. by
+                       set_value().
+        """
+
+        if buffer is not None:
+            self._gpio[:] = buffer
+        if not self._batch_depth:
+            self._shift_out()
+
+    def value(self, pin):
+        """Returns the value of an output from the output buffer.
+
+        :param: pin The pin number (0 - 8 * number_of_shift_registers - 1).
+
+        :return: The output value (True or False).
+        """
+
+        return bool(self._gpio[self.byte_index[pin]] & self.bit_mask[pin])
+
+    def set_value(self, pin, val):
+        """Sets the value of an output in the output buffer without shifting
+        the chain.  Call write() to shift the changes out.
+
+        :param: pin The pin number (0 - 8 * number_of_shift_registers - 1).
+        :param: val The new output value (True or False).
+        """
+
+        if val:
+            self._gpio[self.byte_index[pin]] |= self.bit_mask[pin]
+        else:
+            self._gpio[self.byte_index[pin]] &= ~self.bit_mask[pin]
+
+
+class FullDuplexShiftRegisters:
+    """A 74HC165 input chain and a 74HC595 output chain on the same SPI bus,
+    refreshed with a single full-duplex transfer.
+
+    The 74HC165 QH pin is connected to MISO and the 74HC595 SER pin to MOSI,
+    and both chains share SCK.  Each refresh freezes the inputs with SH/LD,
+    shifts the outputs out while shifting the inputs in with one
+    write_readinto() transaction, and then latches the outputs with RCLK,
+    instead of the separate read and write transactions (each with its own
+    bus lock, configuration and latch sequence) of the two drivers.
+
+    If the chains differ in length, the transfer is as long as the longer
+    chain and the outputs are padded at the front so that they end up in the
+    74HC595s.
+
+    Example::
+
+        shift_registers = FullDuplexShiftRegisters(board.SPI(), DigitalInOut(board.D5), DigitalInOut(board.D6))
+        shift_registers.set_value(0, shift_registers.value(0))   # copy input A to output QA
+        shift_registers.refresh()                                # one transaction
+
+    :param: spi           The SPI bus both chains are connected to.
+    :param: input_latch   The pin connected to the 74HC165 SH/LD pin.
+    :param: output_latch  The pin connected to the 74HC595 RCLK pin.
+    :param: inputs_num    The number of daisy chained 74HC165s.
+    :param: outputs_num   The number of daisy chained 74HC595s.
+    :param: baudrate      The SPI clock rate in Hz.
+    """
+
+    def __init__(self, spi, input_latch, output_latch, inputs_num=1, outputs_num=1, baudrate=1000000):
+        self._device = spi_device.SPIDevice(spi, baudrate=baudrate)
+        self._input_latch = input_latch
+        self._input_latch.switch_to_output(value=False)   # parallel load mode
+        self._output_latch = output_latch
+        self._output_latch.switch_to_output(value=False)
+        length = max(inputs_num, outputs_num)
+        self._out = bytearray(length)  # transfer buffer, outputs at the end
+        self._in = bytearray(length)   # transfer buffer, inputs at the start
+        self.inputs = memoryview(self._in)[:inputs_num]                # inputs of the last refresh
+        self.outputs = memoryview(self._out)[length - outputs_num:]    # outputs written by the next refresh
+        self.input_byte_index, self.input_bit_mask = pin_tables(inputs_num)
+        self.output_byte_index, self.output_bit_mask = pin_tables(outputs_num)
+        self.refreshes = 0  # number of full-duplex transfers
+
+    def refresh(self):
+        """Shifts the outputs out and the inputs in with a single transfer and
+        latches the outputs.
+
+        :return: The inputs.
+        """
+
+        self._input_latch.value = True    # freeze the inputs for shifting
+        with self._device as spi:
+            spi.write_readinto(self._out, self._in)
+        self._input_latch.value = False   # back to parallel load mode
+        self._output_latch.value = True   # latch the outputs
+        self._output_latch.value = False
+        self.refreshes += 1
+        return self.inputs
+
+    def value(self, pin):
+        """Returns the value of an input from the last refresh.
+
+        :param: pin The input pin number (0 - 8 * inputs_num - 1).
+
+        :return: The input value (True or False).
+        """
+
+        return bool(self.inputs[self.input_byte_index[pin]] & self.input_bit_mask[pin])
+
+    def output_value(self, pin):
+        """Returns the value of an output from the output buffer.
+
+        :param: pin The output pin number (0 - 8 * outputs_num - 1).
+
+        :return: The output value (True or False).
+        """
+
+        return bool(self.outputs[self.output_byte_index[pin]] & self.output_bit_mask[pin])
+
+    def set_value(self, pin, val):
+        """Sets the value of an output in the output buffer.  Call refresh() to
+        shift the changes out.
+
+        :param: pin The output pin number (0 - 8 * outputs_num - 1).
+        :param: val The new output value (True or False).
+        """
+
+        if val:
+            self.outputs[self.output_byte_index[pin]] |= self.output_bit_mask[pin]
+        else:
+            self.outputs[self.output_byte_index[pin]] &= ~self.output_bit_mask[pin]
@@ -0,0 +1,89 @@
+"""Host-side stand-in for the CircuitPython board core module.
+
+Description
+-----------
+
+Provides the pins and default buses of a generic CircuitPython compatible
+board so that the programs in this repository can be imported and run on a
+host computer.  The buses returned by SPI() and I2C() are singletons, the
+same as on a real board, and are routed to the device models created with the
+sim_hardware module.
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import busio
+from microcontroller import Pin
+
+
+# Pin Mapping
+D0 = Pin("D0")
+D1 = Pin("D1")
+D2 = Pin("D2")
+D3 = Pin("D3")
+D4 = Pin("D4")
+D5 = Pin("D5")
+D6 = Pin("D6")
+D7 = Pin("D7")
+D8 = Pin("D8")
+D9 = Pin("D9")
+D10 = Pin("D10")
+D11 = Pin("D11")
+D12 = Pin("D12")
+D13 = Pin("D13")
+A0 = Pin("A0")
+A1 = Pin("A1")
+A2 = Pin("A2")
+A3 = Pin("A3")
+A4 = Pin("A4")
+A5 = Pin("A5")
+SCK = Pin("SCK")
+MOSI = Pin("MOSI")
+MISO = Pin("MISO")
+SCL = Pin("SCL")
+SDA = Pin("SDA")
+LED = D13
+
+PINS = (D0, D1, D2, D3, D4, D5, D6, D7, D8, D9, D10, D11, D12, D13,
+        A0, A1, A2, A3, A4, A5, SCK, MOSI, MISO, SCL, SDA)
+"""All of the simulated pins of the board."""
+
+
+# Global Variables
+_spi = None
+_i2c = None
+
+
+# Functions
+def SPI():
+    """Returns the board's default SPI bus singleton."""
+
+    global _spi
+    if _spi is None:
+        _spi = busio.SPI(SCK, MOSI, MISO)
+    return _spi
+
+
+def I2C():
+    """Returns the board's default I2C bus singleton."""
+
+    global _i2c
+    if _i2c is None:
+        _i2c = busio.I2C(SCL, SDA)
+    return _i2c
@@ -0,0 +1,252 @@
+"""Host-side stand-in for the CircuitPython busio core module.
+
+Description
+-----------
+
+Implements simulated SPI and I2C buses that route transfers to the device
+models attached to them (see the sim_hardware module) and keep statistics of
+the traffic they carry.
+
+Each bus keeps a BusStats instance with the number of transactions, the number
+of bytes written and read, and an estimate of the time the transfers would
+occupy on a real bus at the configured clock rate.
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- SPI devices are clocked with every byte on the bus, the same as real
+  shift registers that have no chip select of their own.  Devices that drive
+  MISO are combined with a wired-OR.
+- I2C bus time estimates count 9 clocks (8 data bits plus ACK) for every
+  address and data byte and ignore start/stop conditions.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+class BusStats:
+    """Traffic statistics of a simulated bus."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clears all of the statistics."""
+
+        self.transactions = 0  # number of read, write or combined transfers
+        self.bytes_out = 0     # number of bytes written by the board
+        self.bytes_in = 0      # number of bytes read by the board
+        self.bus_time = 0.0    # estimated time on a real bus, in seconds
+
+    @property
+    def bytes(self):
+        """The total number of bytes transferred in both directions."""
+
+        return self.bytes_out + self.bytes_in
+
+    def snapshot(self):
+        """Returns the current statistics as a tuple.
+
+        :return: A (transactions, bytes_out, bytes_in, bus_time) tuple.
+        """
+
+        return (self.transactions, self.bytes_out, self.bytes_in, self.bus_time)
+
+
+class _Lockable:
+    """Provides the locking protocol shared by the SPI and I2C buses."""
+
+    def __init__(self):
+        self._locked = False
+        self.devices = []  # device models attached to this bus
+        self.stats = BusStats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.deinit()
+
+    def deinit(self):
+        """Releases the bus."""
+
+        self._locked = False
+
+    def try_lock(self):
+        """Attempts to grab the bus lock.
+
+        :return: True when the lock was acquired.
+        """
+
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        """Releases the bus lock."""
+
+        self._locked = False
+
+    def _check_lock(self):
+        if not self._locked:
+            raise RuntimeError("Function requires lock")
+
+
+class SPI(_Lockable):
+    """A simulated SPI bus.
+
+    :param: clock The pin used for SCK.
+    :param: MOSI  The pin used for MOSI.
+    :param: MISO  The pin used for MISO.
+    """
+
+    def __init__(self, clock, MOSI=None, MISO=None):
+        super().__init__()
+        self.clock = clock
+        self.mosi = MOSI
+        self.miso = MISO
+        self.frequency = 250000
+        self.polarity = 0
+        self.phase = 0
+
+    def configure(self, *, baudrate=100000, polarity=0, phase=0, bits=8):
+        """Configures the SPI bus, only valid while locked."""
+
+        self._check_lock()
+        self.frequency = baudrate
+        self.polarity = polarity
+        self.phase = phase
+
+    def _clock_byte(self, out_byte):
+        in_byte = 0
+        for device in self.devices:
+            result = device.clock_byte(out_byte)
+            if result is not None:
+                in_byte |= result
+        return in_byte
+
+    def _account(self, bytes_out, bytes_in, clocked):
+        self.stats.transactions += 1
+        self.stats.bytes_out += bytes_out
+        self.stats.bytes_in += bytes_in
+        self.stats.bus_time += 8 * clocked / self.frequency
+
+    def write(self, buffer, *, start=0, end=None):
+        """Writes the data contained in buffer to the bus."""
+
+        self._check_lock()
+        if end is None:
+            end = len(buffer)
+        for index in range(start, end):
+            self._clock_byte(buffer[index])
+        self._account(end - start, 0, end - start)
+
+    def readinto(self, buffer, *, start=0, end=None, write_value=0):
+        """Reads into buffer while writing write_value for each byte read."""
+
+        self._check_lock()
+        if end is None:
+            end = len(buffer)
+        for index in range(start, end):
+            buffer[index] = self._clock_byte(write_value)
+        self._account(0, end - start, end - start)
+
+    def write_readinto(self, out_buffer, in_buffer, *, out_start=0, out_end=None, in_start=0, in_end=None):
+        """Writes out the data in out_buffer while simultaneously reading data
+        into in_buffer.  The lengths of the two slices must be equal.
+        """
+
+        self._check_lock()
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        if out_end - out_start != in_end - in_start:
+            raise ValueError("buffer slices must be of equal length")
+        for offset in range(out_end - out_start):
+            in_buffer[in_start + offset] = self._clock_byte(out_buffer[out_start + offset])
+        self._account(out_end - out_start, in_end - in_start, out_end - out_start)
+
+
+class I2C(_Lockable):
+    """A simulated I2C bus.
+
+    :param: scl       The pin used for SCL.
+    :param: sda       The pin used for SDA.
+    :param: frequency The clock frequency in Hz.
+    """
+
+    def __init__(self, scl, sda, *, frequency=100000, timeout=255):
+        super().__init__()
+        self.scl = scl
+        self.sda = sda
+        self.frequency = frequency
+
+    def _device(self, address):
+        for device in self.devices:
+            if device.address == address:
+                return device
+        raise OSError(19, "No such device")  # ENODEV, same as CircuitPython
+
+    def _account(self, bytes_out, bytes_in, addresses):
+        self.stats.transactions += 1
+        self.stats.bytes_out += bytes_out
+        self.stats.bytes_in += bytes_in
+        self.stats.bus_time += 9 * (addresses + bytes_out + bytes_in) / self.frequency
+
+    def scan(self):
+        """Scans all I2C addresses between 0x08 and 0x77 inclusive.
+
+        :return: A list of the addresses that responded.
+        """
+
+        self._check_lock()
+        return sorted(device.address for device in self.devices)
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        """Writes the bytes in buffer to the device at address."""
+
+        self._check_lock()
+        if end is None:
+            end = len(buffer)
+        device = self._device(address)
+        self._account(end - start, 0, 1)
+        device.i2c_write(buffer[start:end])
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        """Reads from the device at address into buffer."""
+
+        self._check_lock()
+        if end is None:
+            end = len(buffer)
+        device = self._device(address)
+        self._account(0, end - start, 1)
+        for index in range(start, end):
+            buffer[index] = device.i2c_read_byte()
+
+    def writeto_then_readfrom(self, address, out_buffer, in_buffer, *, out_start=0, out_end=None, in_start=0, in_end=None):
+        """Writes the bytes in out_buffer to the device at address, then reads
+        into in_buffer after a repeated start condition.
+        """
+
+        self._check_lock()
+        if out_end is None:
+            out_end = len(out_buffer)
+        if in_end is None:
+            in_end = len(in_buffer)
+        device = self._device(address)
+        self._account(out_end - out_start, in_end - in_start, 2)
+        device.i2c_write(out_buffer[out_start:out_end])
+        for index in range(in_start, in_end):
+            in_buffer[index] = device.i2c_read_byte()
@@ -0,0 +1,160 @@
+"""Host-side stand-in for the CircuitPython digitalio core module.
+
+Description
+-----------
+
+Implements the subset of the ``digitalio`` API used by the programs and
+driver libraries in this repository on top of the simulated pins provided by
+the host-side ``microcontroller`` module.
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Constructing a DigitalInOut on a pin that is already in use raises
+  ValueError, the same as on a real board.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+class Direction:
+    """Defines the direction of a digital pin."""
+
+    INPUT = "INPUT"
+    """Read digital data in."""
+
+    OUTPUT = "OUTPUT"
+    """Write digital data out."""
+
+
+class Pull:
+    """Defines the pull of a digital input pin."""
+
+    UP = "UP"
+    """When the input line isn't being driven the pull up can pull the state of
+    the line high so it reads as true."""
+
+    DOWN = "DOWN"
+    """When the input line isn't being driven the pull down can pull the state
+    of the line low so it reads as false."""
+
+
+class DriveMode:
+    """Defines the drive mode of a digital output pin."""
+
+    PUSH_PULL = "PUSH_PULL"
+    """Output both high and low digital values."""
+
+    OPEN_DRAIN = "OPEN_DRAIN"
+    """Output low digital values but go into high z for digital high."""
+
+
+class DigitalInOut:
+    """Digital input and output of a simulated pin.
+
+    :param: pin The simulated pin (e.g. board.D5) to control.
+    """
+
+    def __init__(self, pin):
+        if pin.claimed:
+            raise ValueError(f"{pin.name} in use")
+        pin.claimed = True
+        self._pin = pin
+        self._direction = Direction.INPUT
+        self._pull = None
+        self._drive_mode = DriveMode.PUSH_PULL
+        self._pin.release()
+        self._pin.pull_level = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.deinit()
+
+    def deinit(self):
+        """Turns off the DigitalInOut and releases the pin for other use."""
+
+        if self._pin is not None:
+            self._pin.release()
+            self._pin.pull_level = None
+            self._pin.claimed = False
+            self._pin = None
+
+    def switch_to_output(self, value=False, drive_mode=DriveMode.PUSH_PULL):
+        """Sets the pin to be an output with the given value and drive mode."""
+
+        self._direction = Direction.OUTPUT
+        self._drive_mode = drive_mode
+        self._pull = None
+        self._pin.pull_level = None
+        self.value = value
+
+    def switch_to_input(self, pull=None):
+        """Sets the pin to be an input with the given pull."""
+
+        self._direction = Direction.INPUT
+        self._pin.release()
+        self.pull = pull
+
+    @property
+    def direction(self):
+        """The direction of the pin (Direction.INPUT or Direction.OUTPUT)."""
+
+        return self._direction
+
+    @direction.setter
+    def direction(self, value):
+        if value == Direction.OUTPUT:
+            self.switch_to_output()
+        elif value == Direction.INPUT:
+            self.switch_to_input()
+        else:
+            raise ValueError("Invalid direction.")
+
+    @property
+    def value(self):
+        """The digital logic level of the pin."""
+
+        return self._pin.level
+
+    @value.setter
+    def value(self, val):
+        if self._direction != Direction.OUTPUT:
+            raise AttributeError("Cannot set value when direction is input.")
+        self._pin.drive(val)
+
+    @property
+    def pull(self):
+        """The pull of the pin (Pull.UP, Pull.DOWN or None)."""
+
+        return self._pull
+
+    @pull.setter
+    def pull(self, value):
+        if self._direction != Direction.INPUT:
+            raise AttributeError("Pull not used when direction is output.")
+        self._pull = value
+        self._pin.pull_level = {Pull.UP: True, Pull.DOWN: False}.get(value)
+
+    @property
+    def drive_mode(self):
+        """The drive mode of the pin (DriveMode.PUSH_PULL or DriveMode.OPEN_DRAIN)."""
+
+        return self._drive_mode
+
+    @drive_mode.setter
+    def drive_mode(self, value):
+        if self._direction != Direction.OUTPUT:
+            raise AttributeError("Drive mode not used when direction is input.")
+        self._drive_mode = value
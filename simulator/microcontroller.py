@@ -0,0 +1,83 @@
+"""Host-side stand-in for the CircuitPython microcontroller core module.
+
+Description
+-----------
+
+Provides the simulated ``Pin`` objects used by the host-side ``board``,
+``digitalio`` and ``busio`` stand-in modules.  A simulated pin remembers the
+level last driven onto it by the board (through ``digitalio``) or by an
+attached device model (e.g. an MCP23017 INTB output), counts its level
+transitions, and notifies attached device models of edges so that latch
+(SH/LD, RCLK) behavior can be modeled.
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+class Pin:
+    """A simulated microcontroller pin.
+
+    :param: name The board name of the pin (e.g. "D5").
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def __repr__(self):
+        return f"board.{self.name}"
+
+    def reset(self):
+        """Returns the pin to its power-on state and detaches all listeners."""
+
+        self.claimed = False
+        self.board_level = None     # level driven by the board, None if not driving
+        self.external_level = None  # level driven by an attached device, None if released
+        self.pull_level = None      # level provided by a pull resistor, None if floating
+        self.edges = 0              # number of level transitions driven by the board
+        self.listeners = []         # callables invoked as listener(pin, level) on board driven edges
+
+    @property
+    def level(self):
+        """The logic level currently present on the pin."""
+
+        if self.board_level is not None:
+            return self.board_level
+        if self.external_level is not None:
+            return self.external_level
+        if self.pull_level is not None:
+            return self.pull_level
+        return False
+
+    def drive(self, level):
+        """Drives the pin from the board side and notifies listeners of any edge.
+
+        :param: level The new logic level (True or False).
+        """
+
+        level = bool(level)
+        previous = self.level
+        self.board_level = level
+        if level != previous:
+            self.edges += 1
+            for listener in self.listeners:
+                listener(self, level)
+
+    def release(self):
+        """Stops driving the pin from the board side (input mode)."""
+
+        self.board_level = None
@@ -0,0 +1,357 @@
+"""Behavioral models of the 74HC165, 74HC595 and MCP23017 ICs.
+
+Description
+-----------
+
+Models the register level behavior of the ICs used in this repository so that
+the programs and their driver libraries can be run against the host-side
+``board``, ``digitalio`` and ``busio`` stand-in modules.
+
+- Chain74HC165 models a daisy chain of 74HC165 parallel-in serial-out shift
+  registers with SH/LD connected to a board pin and QH connected to MISO.
+- Chain74HC595 models a daisy chain of 74HC595 serial-in parallel-out shift
+  registers with RCLK connected to a board pin and SER connected to MOSI.
+- MCP23017Model models an MCP23017 I/O expander on an I2C bus, including
+  sequential register addressing, input polarity, interrupt-on-change and the
+  INTA/INTB outputs.
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- Call reset() before wiring up a new circuit; it releases all pins and
+  detaches all device models from the board's buses.
+- Byte 0 of the chain models is always the IC closest to the board.  With the
+  driver libraries, the 74HC165 gpio byte 0 is the closest IC while the
+  74HC595 gpio byte 0 is shifted through to the farthest IC.
+- The MCP23017 model assumes IOCON.BANK = 0, the only mode the
+  Adafruit_CircuitPython_MCP230xx library supports.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import board
+
+
+# Global Constants
+MCP23017_REGISTERS_NUM = 0x16
+"""The number of registers of the MCP23017 (BANK = 0 addressing)."""
+
+IODIRA = 0x00
+IPOLA = 0x02
+GPINTENA = 0x04
+DEFVALA = 0x06
+INTCONA = 0x08
+IOCON = 0x0A
+GPPUA = 0x0C
+INTFA = 0x0E
+INTCAPA = 0x10
+GPIOA = 0x12
+OLATA = 0x14
+
+_IOCON_MIRROR = 0x40
+_IOCON_SEQOP = 0x20
+_IOCON_INTPOL = 0x02
+
+
+# Functions
+def reset():
+    """Returns the simulated board to its power-on state.
+
+    Releases all pins, detaches all device models from the board's buses and
+    clears the bus statistics.
+    """
+
+    for pin in board.PINS:
+        pin.reset()
+    for bus in (board.SPI(), board.I2C()):
+        bus.devices.clear()
+        bus.stats.reset()
+        bus.unlock()
+
+
+def latch_edges(pin):
+    """Returns the number of level transitions the board has driven on a pin.
+
+    :param: pin The simulated pin (e.g. board.D5).
+
+    :return: The number of transitions.
+    """
+
+    return pin.edges
+
+
+# Classes
+class Chain74HC165:
+    """A daisy chain of 74HC165 shift registers on an SPI bus.
+
+    :param: spi     The simulated SPI bus whose MISO line QH is connected to.
+    :param: latch   The simulated pin connected to SH/LD.
+    :param: number  The number of daisy chained 74HC165s.
+    """
+
+    def __init__(self, spi, latch, number=1):
+        self.number = number
+        self.inputs = bytearray(number)    # parallel input levels (A = bit 0), byte 0 closest to board
+        self._register = bytearray(number)
+        self._latch = latch
+        self.loads = 0                     # number of parallel loads (SH/LD rising edges)
+        latch.listeners.append(self._on_latch)
+        spi.devices.append(self)
+
+    def set_input(self, pin, value):
+        """Sets the level of a single parallel input.
+
+        :param: pin   The chain wide pin number (0 = A of the closest IC).
+        :param: value The new level (True or False).
+        """
+
+        if value:
+            self.inputs[pin // 8] |= 1 << (pin % 8)
+        else:
+            self.inputs[pin // 8] &= ~(1 << (pin % 8)) & 0xFF
+
+    def _on_latch(self, pin, level):
+        if level:  # rising edge of SH/LD freezes the loaded inputs for shifting
+            self._register[:] = self.inputs
+            self.loads += 1
+
+    def clock_byte(self, out_byte):
+        """Clocks eight bits out of QH.
+
+        :param: out_byte The byte present on MOSI (unused by the 74HC165).
+
+        :return: The byte shifted out of the chain, MSB (input H) first.
+        """
+
+        if not self._latch.level:  # parallel load mode, QH follows input H of the closest IC
+            return 0xFF if self.inputs[0] & 0x80 else 0x00
+        result = self._register[0]
+        self._register[:-1] = self._register[1:]
+        self._register[-1] = 0  # SER of the farthest IC is tied low
+        return result
+
+
+class Chain74HC595:
+    """A daisy chain of 74HC595 shift registers on an SPI bus.
+
+    :param: spi     The simulated SPI bus whose MOSI line SER is connected to.
+    :param: latch   The simulated pin connected to RCLK.
+    :param: number  The number of daisy chained 74HC595s.
+    """
+
+    def __init__(self, spi, latch, number=1):
+        self.number = number
+        self.outputs = bytearray(number)   # storage register outputs (QA = bit 0), byte 0 closest to board
+        self._register = bytearray(number)
+        self.latches = 0                   # number of storage register updates (RCLK rising edges)
+        self.output_changes = 0            # number of latches that changed at least one output
+        latch.listeners.append(self._on_latch)
+        spi.devices.append(self)
+
+    def get_output(self, pin):
+        """Returns the level of a single output of the chain.
+
+        :param: pin The pin number as used by the driver (0 = QA of gpio byte 0).
+
+        :return: The output level (True or False).
+        """
+
+        byte = self.outputs[self.number - 1 - pin // 8]
+        return bool(byte & (1 << (pin % 8)))
+
+    def driver_outputs(self):
+        """Returns the outputs ordered the same as the driver's gpio buffer.
+
+        :return: A bytearray of the output levels.
+        """
+
+        return bytearray(reversed(self.outputs))
+
+    def _on_latch(self, pin, level):
+        if level:  # rising edge of RCLK copies the shift register to the outputs
+            self.latches += 1
+            if self.outputs != self._register:
+                self.outputs[:] = self._register
+                self.output_changes += 1
+
+    def clock_byte(self, out_byte):
+        """Clocks eight bits from MOSI into SER.
+
+        :param: out_byte The byte present on MOSI, MSB first.
+
+        :return: None since QH' is not connected to MISO.
+        """
+
+        self._register[1:] = self._register[:-1]
+        self._register[0] = out_byte
+        return None
+
+
+class MCP23017Model:
+    """An MCP23017 I/O expander on an I2C bus.
+
+    :param: i2c     The simulated I2C bus.
+    :param: address The I2C address (0x20 - 0x27).
+    :param: inta    The simulated pin connected to INTA, or None.
+    :param: intb    The simulated pin connected to INTB, or None.
+    """
+
+    def __init__(self, i2c, address=0x20, inta=None, intb=None):
+        self.address = address
+        self.registers = bytearray(MCP23017_REGISTERS_NUM)
+        self.registers[IODIRA] = 0xFF
+        self.registers[IODIRA + 1] = 0xFF
+        self.levels = 0              # 16-bit external levels driven onto the pins (GPA0 = bit 0)
+        self.driven = 0              # 16-bit mask of the pins driven externally
+        self.register_reads = 0      # number of register bytes read
+        self.register_writes = 0     # number of register bytes written
+        self._pointer = 0
+        self._reference = 0          # pin values used for interrupt-on-change comparisons
+        self._inta = inta
+        self._intb = intb
+        i2c.devices.append(self)
+        self._reference = self._input_levels()
+        self._update_int_pins()
+
+    # Register helpers
+    def _u16(self, register):
+        return self.registers[register] | (self.registers[register + 1] << 8)
+
+    def _set_u16(self, register, value):
+        self.registers[register] = value & 0xFF
+        self.registers[register + 1] = (value >> 8) & 0xFF
+
+    def _input_levels(self):
+        # Undriven pins read the pull-up state (floating pins read low)
+        gppu = self._u16(GPPUA)
+        return (self.levels & self.driven) | (gppu & ~self.driven & 0xFFFF)
+
+    def _gpio_value(self):
+        iodir = self._u16(IODIRA)
+        inputs = (self._input_levels() ^ self._u16(IPOLA)) & iodir
+        outputs = self._u16(OLATA) & ~iodir & 0xFFFF
+        return inputs | outputs
+
+    # External side
+    @property
+    def outputs(self):
+        """The 16-bit levels of the pins configured as outputs (GPA0 = bit 0)."""
+
+        return self._u16(OLATA) & ~self._u16(IODIRA) & 0xFFFF
+
+    def set_input(self, pin, value):
+        """Drives a single pin externally, e.g. by a switch.
+
+        :param: pin   The pin number (0 - 7 = GPA0 - GPA7, 8 - 15 = GPB0 - GPB7).
+        :param: value The new level (True or False).
+        """
+
+        mask = 1 << pin
+        self.driven |= mask
+        self.levels = self.levels | mask if value else self.levels & ~mask
+        self._evaluate_interrupts()
+
+    def set_port(self, port, value):
+        """Drives all eight pins of a port externally.
+
+        :param: port  The port (0 = A, 1 = B).
+        :param: value The new 8-bit levels.
+        """
+
+        shift = 8 * port
+        self.driven |= 0xFF << shift
+        self.levels = (self.levels & ~(0xFF << shift)) | ((value & 0xFF) << shift)
+        self._evaluate_interrupts()
+
+    # Interrupt logic
+    def _evaluate_interrupts(self):
+        values = self._input_levels() ^ self._u16(IPOLA)
+        enabled = self._u16(GPINTENA) & self._u16(IODIRA)
+        intcon = self._u16(INTCONA)
+        changed = (values ^ self._reference) & ~intcon
+        mismatched = (values ^ self._u16(DEFVALA)) & intcon
+        self._reference = values
+        triggered = (changed | mismatched) & enabled
+        intf = self._u16(INTFA)
+        for port in (0, 1):
+            port_mask = 0xFF << (8 * port)
+            if triggered & port_mask and not intf & port_mask:  # capture only the first change
+                self.registers[INTFA + port] = (triggered >> (8 * port)) & 0xFF
+                self.registers[INTCAPA + port] = (self._gpio_value() >> (8 * port)) & 0xFF
+        self._update_int_pins()
+
+    def _clear_interrupt(self, port):
+        self.registers[INTFA + port] = 0
+        self._reference = (self._reference & ~(0xFF << (8 * port))) | (
+            (self._input_levels() ^ self._u16(IPOLA)) & (0xFF << (8 * port)))
+        self._evaluate_interrupts()
+
+    def _update_int_pins(self):
+        iocon = self.registers[IOCON]
+        active_a = self.registers[INTFA] != 0
+        active_b = self.registers[INTFA + 1] != 0
+        if iocon & _IOCON_MIRROR:
+            active_a = active_b = active_a or active_b
+        active_high = bool(iocon & _IOCON_INTPOL)
+        for pin, active in ((self._inta, active_a), (self._intb, active_b)):
+            if pin is not None:
+                pin.external_level = active == active_high
+
+    # I2C side
+    def _advance(self):
+        if self.registers[IOCON] & _IOCON_SEQOP:
+            self._pointer ^= 1  # byte mode toggles between the A/B register pair
+        else:
+            self._pointer = (self._pointer + 1) % MCP23017_REGISTERS_NUM
+
+    def i2c_write(self, data):
+        """Handles an I2C write of a register address followed by data bytes.
+
+        :param: data The bytes written by the board.
+        """
+
+        if not data:  # address probe
+            return
+        self._pointer = data[0] % MCP23017_REGISTERS_NUM
+        for byte in data[1:]:
+            register = self._pointer
+            self.register_writes += 1
+            if register in (IOCON, IOCON + 1):
+                self.registers[IOCON] = self.registers[IOCON + 1] = byte & 0x7F
+            elif register in (GPIOA, GPIOA + 1):
+                self.registers[register + 2] = byte  # writing GPIO writes OLAT
+            elif register not in (INTFA, INTFA + 1, INTCAPA, INTCAPA + 1):  # read-only
+                self.registers[register] = byte
+            self._advance()
+        self._evaluate_interrupts()
+
+    def i2c_read_byte(self):
+        """Handles an I2C read of the register at the address pointer.
+
+        :return: The register value.
+        """
+
+        register = self._pointer
+        self.register_reads += 1
+        if register in (GPIOA, GPIOA + 1):
+            value = (self._gpio_value() >> (8 * (register - GPIOA))) & 0xFF
+            self._clear_interrupt(register - GPIOA)
+        elif register in (INTCAPA, INTCAPA + 1):
+            value = self.registers[register]
+            self._clear_interrupt(register - INTCAPA)
+        else:
+            value = self.registers[register]
+        self._advance()
+        return value
@@ -0,0 +1,229 @@
+"""Replay of recorded bus traces against the simulated ICs.
+
+Description
+-----------
+
+Derives the input changes of a 74HC165 chain and an MCP23017 from a trace
+recorded with the bus_trace module, e.g. on a board in the field, and replays
+them to the Chain74HC165 and MCP23017Model of the sim_hardware module while a
+function of a program, e.g. one of the polling or change detection examples,
+runs against the simulated ICs.
+
+- The chain inputs are the data of the SPI reads (or full-duplex transfers)
+  of the chain's length.
+- The expander inputs are the values of the GPIO and INTCAP registers of the
+  replayed ports, found in the I2C reads of the expander's address by
+  tracking its register address pointer, with the polarity inversion of the
+  IPOL registers, tracked from the I2C writes, undone, so the pin levels are
+  replayed.
+
+Events are replayed at their recorded times, at real or scaled speed with
+the function called back to back in between, as a program's main loop does,
+or as fast as possible with a single call per event.  Each event's latency is
+the time from when it was due to the end of the first call after it was
+applied, and the results are the events per second replayed, the latency
+percentiles and the bus transactions per event.
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- The repository directory must be on the import path for the bus_trace
+  module, as set up by the benchmarks' bench_common module.
+- The IPOL registers are assumed to be 0 until the trace writes them, so a
+  trace should be recorded from before the expander is configured.
+- The recorded INTB transitions are not replayed, since the MCP23017 model
+  generates its own from the replayed port changes.
+- The trace decides when inputs changed, not how the replayed function reads
+  them, so a trace recorded with one example can be replayed against any
+  other using the same ICs.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import time
+import board
+import bus_trace
+
+
+# Global Constants
+MCP23017_REGISTERS_NUM = 0x16
+"""The number of registers of the MCP23017 (BANK = 0 addressing)."""
+
+IPOLA = 0x02
+"""The address of the IPOLA register."""
+
+INTCAPA = 0x10
+"""The address of the INTCAPA register."""
+
+GPIOA = 0x12
+"""The address of the GPIOA register."""
+
+BUS_KINDS = (bus_trace.SPI_WRITE, bus_trace.SPI_READ, bus_trace.SPI_TRANSFER, bus_trace.I2C_WRITE,
+             bus_trace.I2C_READ, bus_trace.I2C_WRITE_READ)
+"""The record kinds of bus transactions."""
+
+
+# Functions
+def _transactions():
+    # Total number of transactions on both simulated buses
+    return board.SPI().stats.transactions + board.I2C().stats.transactions
+
+
+# Classes
+class TraceReplay:
+    """Replays the input changes of a bus trace to simulated ICs.
+
+    Example::
+
+        chain = sim_hardware.Chain74HC165(board.SPI(), board.D5)
+        with open("bus_trace.bin", "rb") as file:
+            replay = TraceReplay(file, chain=chain)
+        program = load_program("input_shift_register")
+        replay.run(program.read_and_print_inputs_on_change, speed=10)
+        replay.print_report()
+
+    :param: stream   The stream the trace is read from, e.g. a file opened in
+                     binary mode.
+    :param: chain    The Chain74HC165 model to replay the SPI reads to, or None.
+    :param: expander The MCP23017Model to replay the I2C reads of its address
+                     to, or None.
+    :param: ports    The expander ports (0 = A, 1 = B) to replay.
+    """
+
+    def __init__(self, stream, chain=None, expander=None, ports=(1,)):
+        self._chain = chain
+        self._expander = expander
+        self.events = []                 # (time in us, port or None for the chain, value) input changes
+        self.initial = []                # the first seen state of each input, as events
+        self.recorded_transactions = 0   # number of bus transactions in the trace
+        self.duration = 0                # time span of the trace, in us
+        self._decode(stream, ports)
+        self.latencies = []              # latency of each replayed event, in ns, once run
+        self.elapsed = 0                 # time of the last run, in ns
+        self.calls = 0                   # number of function calls of the last run
+        self.transactions = 0            # number of simulated bus transactions of the last run
+
+    def _decode(self, stream, ports):
+        chain = self._chain
+        expander = self._expander
+        registers = {}                   # replayed register addresses of each expander port value
+        for port in ports:
+            registers[GPIOA + port] = port
+            registers[INTCAPA + port] = port
+        polarities = [0, 0]              # the last written IPOL register value of each port
+        states = {}                      # the last seen state of each input
+        pointer = 0                      # expander register address pointer
+        first = None
+        for timestamp, kind, target, written, read in bus_trace.read_trace(stream):
+            if first is None:
+                first = timestamp
+            self.duration = timestamp - first
+            if kind not in BUS_KINDS:
+                continue
+            self.recorded_transactions += 1
+            changes = []
+            if chain is not None and kind in (bus_trace.SPI_READ, bus_trace.SPI_TRANSFER) and \
+                    len(read) == chain.number:
+                changes.append((None, bytes(read)))
+            elif expander is not None and target == expander.address:
+                if written:
+                    pointer = written[0]
+                    for byte in written[1:]:  # the written register values
+                        if IPOLA <= pointer <= IPOLA + 1:
+                            polarities[pointer - IPOLA] = byte
+                        pointer = (pointer + 1) % MCP23017_REGISTERS_NUM
+                if read:
+                    for byte in read:
+                        if pointer in registers:
+                            port = registers[pointer]
+                            changes.append((port, byte ^ polarities[port]))  # the pin levels
+                        pointer = (pointer + 1) % MCP23017_REGISTERS_NUM
+            for input_id, value in changes:
+                if input_id not in states:
+                    self.initial.append((timestamp, input_id, value))
+                elif states[input_id] != value:
+                    self.events.append((timestamp, input_id, value))
+                states[input_id] = value
+
+    def _apply(self, input_id, value):
+        # Drive an input change onto the simulated ICs
+        if input_id is None:
+            self._chain.inputs[:] = value
+        else:
+            self._expander.set_port(input_id, value)
+
+    def run(self, function, speed=None):
+        """Replays the events while running a function.
+
+        :param: function The function to run, without arguments.
+        :param: speed    The replay speed relative to the recording, e.g. 1 for
+                         real time or 10 for ten times faster, with the
+                         function called back to back between events, or None
+                         to apply the events as fast as possible with a single
+                         call after each.
+        """
+
+        for _, input_id, value in self.initial:
+            self._apply(input_id, value)
+        function()
+        latencies = []
+        calls = 1
+        before = _transactions()
+        start = time.monotonic_ns()
+        first = self.events[0][0] if self.events else 0
+        for timestamp, input_id, value in self.events:
+            if speed is None:
+                due = time.monotonic_ns()
+            else:
+                due = start + int((timestamp - first) * 1000 / speed)
+                while time.monotonic_ns() < due:
+                    function()
+                    calls += 1
+            self._apply(input_id, value)
+            function()
+            calls += 1
+            latencies.append(time.monotonic_ns() - due)
+        self.elapsed = time.monotonic_ns() - start
+        self.transactions = _transactions() - before
+        self.calls = calls
+        self.latencies = sorted(latencies)
+
+    @property
+    def events_per_second(self):
+        """The number of events replayed per second by the last run."""
+
+        return len(self.latencies) / (self.elapsed / 1e9) if self.elapsed else 0.0
+
+    def percentile(self, percent):
+        """Returns a percentile of the event latencies of the last run.
+
+        :param: percent The percentile (0 - 100), e.g. 99.
+
+        :return: The latency in ns, or 0 if there were no events.
+        """
+
+        count = len(self.latencies)
+        if not count:
+            return 0
+        return self.latencies[min(count - 1, int(count * percent / 100))]
+
+    def print_report(self):
+        """Prints the results of the last run."""
+
+        events = len(self.latencies)
+        print(f"Trace replay: {events} events in {self.elapsed / 1e6:.1f} ms ({self.events_per_second:.0f} events/s), "
+              f"{self.calls} calls, {self.transactions / max(events, 1):.1f} transactions/event, "
+              f"latency p50 {self.percentile(50) / 1000:.0f} us, p99 {self.percentile(99) / 1000:.0f} us, "
+              f"max {self.percentile(100) / 1000:.0f} us")
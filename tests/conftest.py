@@ -0,0 +1,110 @@
+"""Common pytest configuration of the host-side tests.
+
+Description
+-----------
+
+Puts the repository's modules and the host-side simulator (see the simulator
+directory) on the import path and provides a fixture that returns the
+simulated board to its power-on state before a test wires up its circuit,
+and fixtures of the circuits shared by the tests:
+
+- A 74HC165 with its SH/LD pin on D5.
+- A 74HC595 with its RCLK pin on D6.
+- An MCP23017 at address 0x20 with its INTB pin on D7.
+
+Notes
+-----
+
+- Only intended to be used on a host computer, never copied to a board.
+- The simulator modules take precedence over any installed Blinka modules of
+  the same names.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import os
+import sys
+import pytest
+
+
+# Global Constants
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""The top level directory of the repository."""
+
+SIMULATOR_DIR = os.path.join(REPOSITORY_DIR, "simulator")
+"""The directory containing the host-side simulator modules."""
+
+for path in (REPOSITORY_DIR, SIMULATOR_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+# Imports (simulator)
+import board  # noqa: E402
+import digitalio  # noqa: E402
+import sim_hardware  # noqa: E402
+import port_expanders  # noqa: E402
+import shift_registers  # noqa: E402
+
+
+# Functions
+@pytest.fixture
+def simulator():
+    """Resets the simulated board and returns the sim_hardware module."""
+
+    sim_hardware.reset()
+    return sim_hardware
+
+
+@pytest.fixture
+def input_chain(simulator):
+    """Returns the model of a single 74HC165 with its SH/LD pin on D5."""
+
+    return simulator.Chain74HC165(board.SPI(), board.D5, 1)
+
+
+@pytest.fixture
+def isr(input_chain):
+    """Returns an InputShiftRegister reading the 74HC165 model."""
+
+    return shift_registers.InputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D5), 1)
+
+
+@pytest.fixture
+def output_chain(simulator):
+    """Returns the model of a single 74HC595 with its RCLK pin on D6."""
+
+    return simulator.Chain74HC595(board.SPI(), board.D6, 1)
+
+
+@pytest.fixture
+def osr(output_chain):
+    """Returns an OutputShiftRegister driving the 74HC595 model."""
+
+    return shift_registers.OutputShiftRegister(board.SPI(), digitalio.DigitalInOut(board.D6), 1)
+
+
+@pytest.fixture
+def expander_model(simulator):
+    """Returns the model of an MCP23017 at address 0x20 with its INTB pin on
+    D7."""
+
+    return simulator.MCP23017Model(board.I2C(), 0x20, intb=board.D7)
+
+
+@pytest.fixture
+def mcp(expander_model):
+    """Returns a CachedMCP23017 driving the MCP23017 model."""
+
+    return port_expanders.CachedMCP23017(board.I2C(), 0x20)
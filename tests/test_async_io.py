@@ -0,0 +1,66 @@
+"""Tests of the async_io module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import asyncio
+import board
+import digitalio
+import pytest
+import async_io
+import port_expanders
+
+
+# Functions
+@pytest.fixture(autouse=True)
+def bus_locks(monkeypatch):
+    """Gives each test its own bus locks, since a lock belongs to the event
+    loop it was first used in."""
+
+    monkeypatch.setattr(async_io, "_bus_locks", {})
+
+
+def test_bus_lock_is_shared_per_bus(simulator):
+    assert async_io.bus_lock(board.SPI()) is async_io.bus_lock(board.SPI())
+    assert async_io.bus_lock(board.SPI()) is not async_io.bus_lock(board.I2C())
+
+
+def test_bus_lock_serializes_transfers_on_one_bus(isr, input_chain, mcp):
+    spi_lock = async_io.bus_lock(board.SPI())
+    i2c_lock = async_io.bus_lock(board.I2C())
+    input_chain.set_input(1, True)
+
+    async def main():
+        async with spi_lock:  # another task's transfer on the SPI bus
+            read = asyncio.create_task(async_io.read_inputs(isr, spi_lock))
+            await async_io.read_port(mcp, i2c_lock, 1)  # a different bus is not held up
+            for _ in range(3):
+                await asyncio.sleep(0)
+            assert not read.done() and isr.shifts == 0
+        assert (await read)[0] == 0b00000010
+        assert isr.shifts == 1
+
+    asyncio.run(main())
+
+
+def test_port_copier_copies_port_b_on_interrupt(mcp, expander_model):
+    mcp.configure(port_expanders.register_image(iodir=0xFF00, gppu=0xFF00, interrupt_enable=0xFF00))
+    mcp.clear_ints()
+    runtime = async_io.IORuntime()
+    runtime.add_port_copier(mcp, board.I2C(), digitalio.DigitalInOut(board.D7))
+
+    async def press_switch():
+        await asyncio.sleep(0.01)
+        expander_model.set_input(10, False)
+
+    runtime.add_task(press_switch())
+    runtime.run(0.05)
+    assert expander_model.outputs == 0b11111011  # the switch on GPB2 pulls its LED on GPA2 low
+    assert runtime.statistics[0].runs == 1 and runtime.statistics[0].operations == 2
@@ -0,0 +1,104 @@
+"""Tests of the bus_hooks module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import io
+import board
+import digitalio
+import bus_hooks
+import bus_trace
+import instrumentation
+import shift_registers
+
+
+# Functions
+def test_profiler_and_tracer_share_one_wrapper(input_chain):
+    input_chain.set_input(3, True)
+    profiler = instrumentation.Profiler(enabled=True)
+    stream = io.BytesIO()
+    tracer = bus_trace.TraceRecorder(stream)
+    hooks = bus_hooks.BusHooks(profiler, tracer)
+    spi = hooks.wrap_spi(board.SPI())
+    latch = hooks.wrap_pin(digitalio.DigitalInOut(board.D5), "isr_latch_pin")
+    isr = shift_registers.InputShiftRegister(spi, latch, 1)
+
+    read = profiler.profile(lambda: isr.gpio, "read")
+    assert read()[0] == 0b00001000
+    tracer.flush()
+
+    section = profiler.sections["read"]
+    assert (section.calls, section.transactions, section.bytes, section.latch_pulses) == (1, 1, 1, 1)
+    records = list(bus_trace.read_trace(io.BytesIO(stream.getvalue())))
+    reads = [record for record in records if record[1] == bus_hooks.SPI_READ]
+    assert [record[4] for record in reads] == [bytes([0b00001000])]
+    assert any(record[1] == bus_trace.PIN_LEVEL and record[2] == "isr_latch_pin" and record[4] for record in records)
+
+
+def test_no_enabled_hooks_returns_originals(simulator):
+    hooks = bus_hooks.BusHooks(instrumentation.Profiler(enabled=False), bus_trace.TraceRecorder())
+    spi = board.SPI()
+    pin = digitalio.DigitalInOut(board.D5)
+    assert hooks.wrap_spi(spi) is spi
+    assert hooks.wrap_pin(pin, "latch") is pin
+
+
+def test_hooked_buses_pass_integer_bounds():
+    profiler = instrumentation.Profiler(enabled=True)
+    hooks = bus_hooks.BusHooks(profiler)
+    bus = StrictBus()
+    spi = hooks.wrap_spi(bus)
+    i2c = hooks.wrap_i2c(bus)
+    out_buffer = bytearray(3)
+    in_buffer = bytearray(2)
+
+    spi.write(out_buffer)
+    spi.readinto(in_buffer)
+    spi.write_readinto(out_buffer, in_buffer)
+    i2c.writeto(0x20, out_buffer, start=1)
+    i2c.readfrom_into(0x20, in_buffer)
+    i2c.writeto_then_readfrom(0x20, out_buffer, in_buffer, out_end=1)
+
+    assert bus.calls[0] == ("write", {"start": 0, "end": 3})
+    assert bus.calls[2] == ("write_readinto", {"out_start": 0, "out_end": 3, "in_start": 0, "in_end": 2})
+    assert bus.calls[3] == ("writeto", {"start": 1, "end": 3})
+    assert bus.calls[5] == ("writeto_then_readfrom", {"out_start": 0, "out_end": 1, "in_start": 0, "in_end": 2})
+    assert profiler.current.bytes == 3 + 2 + 3 + 2 + 2 + 3
+
+
+# Classes
+class StrictBus:
+    """A bus that rejects None buffer bounds, as the core busio module does."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _transfer(self, name, *buffers, **bounds):
+        if any(value is None for value in bounds.values()):
+            raise TypeError("can't convert NoneType to int")
+        self.calls.append((name, bounds))
+
+    def write(self, buffer, **bounds):
+        self._transfer("write", buffer, **bounds)
+
+    def readinto(self, buffer, **bounds):
+        self._transfer("readinto", buffer, **bounds)
+
+    def write_readinto(self, out_buffer, in_buffer, **bounds):
+        self._transfer("write_readinto", out_buffer, in_buffer, **bounds)
+
+    def writeto(self, address, buffer, **bounds):
+        self._transfer("writeto", buffer, **bounds)
+
+    def readfrom_into(self, address, buffer, **bounds):
+        self._transfer("readfrom_into", buffer, **bounds)
+
+    def writeto_then_readfrom(self, address, out_buffer, in_buffer, **bounds):
+        self._transfer("writeto_then_readfrom", out_buffer, in_buffer, **bounds)
@@ -0,0 +1,55 @@
+"""Tests of the console_renderer module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import io
+import pytest
+import console_renderer
+
+
+# Global Constants
+LABELS = [f"Input {pin}" for pin in range(10)]
+"""Labels of pins 0 - 9 of a two register chain, pins 10 - 15 unlabelled."""
+
+
+# Functions
+def test_binary_frames_are_written_at_once(capsys):
+    renderer = console_renderer.ConsoleRenderer(2)
+    renderer.render_binary(b"\x05\x80")
+    renderer.render_binary(bytearray([0xFF, 0x00]))
+    assert capsys.readouterr().out == "Inputs: 00000101 10000000 \nInputs: 11111111 00000000 \n"
+    assert renderer.writes == 2
+
+
+def test_all_lines_are_written_in_pin_order():
+    stream = io.StringIO()
+    renderer = console_renderer.ConsoleRenderer(2, LABELS[:3], template="{label}: {value}", stream=stream)
+    assert renderer.render_lines(b"\x05\x00") == 3
+    assert stream.getvalue() == "Input 0: True\nInput 1: False\nInput 2: True\n\n"
+
+
+def test_only_changed_lines_are_written():
+    stream = io.StringIO()
+    renderer = console_renderer.ConsoleRenderer(2, LABELS, stream=stream)
+    assert renderer.render_lines(b"\x00\x00", changed=True) == 10  # the first rendering writes all lines
+    stream.seek(0)
+    stream.truncate()
+    assert renderer.render_lines(b"\x00\x00", changed=True) == 0
+    assert renderer.render_lines(b"\x00\x10", changed=True) == 0  # pin 12 has no label
+    assert renderer.writes == 1
+    assert renderer.render_lines(b"\x82\x12", changed=True) == 3
+    assert stream.getvalue() == "Input 1 = True\nInput 7 = True\nInput 9 = True\n\n"
+    assert renderer.previous == bytearray([0x82, 0x12])
+
+
+def test_labels_must_fit_the_chain():
+    with pytest.raises(ValueError):
+        console_renderer.ConsoleRenderer(1, LABELS)
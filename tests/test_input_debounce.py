@@ -0,0 +1,74 @@
+"""Tests of the input_debounce module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import random
+import pytest
+import input_debounce
+
+
+# Functions
+@pytest.mark.parametrize("samples", [1, 2, 3, 4, 5, 7, 8])
+def test_update_matches_per_pin_counters(samples):
+    generator = random.Random(samples)
+    debouncer = input_debounce.Debouncer(2, samples)
+    reference = ReferenceDebouncer(16, samples)
+    sample = bytearray(2)
+    for _ in range(2000):
+        for pin in range(16):
+            if generator.random() < 0.15:  # mostly steady inputs with bursts of chatter
+                sample[pin // 8] ^= 1 << (pin % 8)
+        expected = reference.update([bool(sample[pin // 8] & (1 << (pin % 8))) for pin in range(16)])
+        assert debouncer.update(sample) == bool(expected)
+        assert [pin for pin in range(16) if debouncer.changed[pin // 8] & (1 << (pin % 8))] == expected
+        assert [debouncer.value(pin) for pin in range(16)] == reference.stable
+
+
+def test_reset_sets_the_stable_values():
+    samples = 3
+    debouncer = input_debounce.Debouncer(1, samples)
+    debouncer.update(b"\x01")
+    debouncer.update(b"\x01")
+    debouncer.reset(b"\x80")
+    assert debouncer.stable == bytearray([0x80])
+    for _ in range(samples - 1):
+        assert not debouncer.update(b"\x01")
+    assert debouncer.update(b"\x01")  # the counts before the reset were cleared
+    assert debouncer.stable == bytearray([0x01])
+
+
+# Classes
+class ReferenceDebouncer:
+    """A debouncer with a separate counter per pin.
+
+    :param: pins    The number of input pins.
+    :param: samples The number of consecutive differing samples needed.
+    """
+
+    def __init__(self, pins, samples):
+        self.samples = samples
+        self.stable = [False] * pins
+        self.counts = [0] * pins
+
+    def update(self, levels):
+        """Adds a sample and returns the pins whose stable value changed."""
+
+        changed = []
+        for pin, level in enumerate(levels):
+            if level == self.stable[pin]:
+                self.counts[pin] = 0
+                continue
+            self.counts[pin] += 1
+            if self.counts[pin] == self.samples:
+                self.stable[pin] = level
+                self.counts[pin] = 0
+                changed.append(pin)
+        return changed
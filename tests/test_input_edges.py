@@ -0,0 +1,32 @@
+"""Tests of the input_edges module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import random
+import pytest
+import input_edges
+
+
+# Functions
+@pytest.mark.parametrize("registers", [1, 2, 9, 128])
+def test_update_matches_bitwise_comparison(registers):
+    generator = random.Random(registers)
+    detector = input_edges.EdgeDetector(registers)
+    previous = bytes(registers)
+    for _ in range(200):
+        sample = bytes(previous) if generator.random() < 0.2 else generator.randbytes(registers)
+        expected = [(pin, bool(sample[pin // 8] >> pin % 8 & 1))
+                    for pin in range(8 * registers)
+                    if (sample[pin // 8] ^ previous[pin // 8]) >> pin % 8 & 1]
+        assert detector.update(sample, timestamp=1) == len(expected)
+        assert [(pin, rising) for pin, rising, _ in detector.events()] == expected
+        assert detector.previous == sample
+        previous = sample
@@ -0,0 +1,63 @@
+"""Tests of the input_history module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import io
+import pytest
+import input_history
+
+
+# Global Constants
+SAMPLES = [
+    (1000, b"\x00\x00\x00"),
+    (1500, b"\x00\x01\x00"),
+    (1200, b"\x00\x01\x00"),   # timestamps passed to record() may decrease
+    (900000000000, b"\xff\x01\x80"),
+    (900000000001, b"\x00\x00\x00"),
+    (0, b"\x00\x00\x01"),
+]
+"""Timestamps and inputs of a three register chain."""
+
+
+# Functions
+@pytest.mark.parametrize("encoding", [input_history.RAW, input_history.DELTA])
+def test_export_round_trip(encoding):
+    history = input_history.InputHistory(3, samples=4)
+    for timestamp, inputs in SAMPLES:
+        history.record(inputs, timestamp)
+    assert (history.count, history.overwritten) == (4, 2)
+    held = [(timestamp, bytes(inputs)) for timestamp, inputs in map(history.entry, range(history.count))]
+    assert held == SAMPLES[2:]
+    stream = io.BytesIO()
+    assert history.export(stream, encoding) == 4
+    assert history.count == 0
+    history.record(b"\x02\x00\x00", 5)
+    history.export(stream, encoding)  # appended to the same stream
+    assert list(input_history.read_history(io.BytesIO(stream.getvalue()))) == SAMPLES[2:] + [(5, b"\x02\x00\x00")]
+
+
+def test_delta_encodes_unchanged_bytes_as_runs():
+    history = input_history.InputHistory(3, samples=4)
+    history.record(b"\x00\x05\x00", 1)
+    history.record(b"\x00\x05\x00", 1)
+    stream = io.BytesIO()
+    history.export(stream, input_history.DELTA)
+    # header, then varints 2 (+1), 1 unchanged, 1 changed, 0x05, 1 unchanged, 0 changed,
+    # then 0 (+0), 3 unchanged, 0 changed
+    assert stream.getvalue()[11:] == bytes([2, 1, 1, 0x05, 1, 0, 0, 3, 0])
+
+
+def test_record_from_reads_the_chain_into_the_ring(isr, input_chain):
+    history = input_history.InputHistory(1, samples=2)
+    input_chain.set_input(6, True)
+    assert history.record_from(isr, 10) == b"\x40"
+    assert isr.shifts == 1
+    assert history.entry(0)[0] == 10 and history.entry(0)[1] == b"\x40"
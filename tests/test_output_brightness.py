@@ -0,0 +1,63 @@
+"""Tests of the output_brightness module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import pytest
+import output_brightness
+
+
+# Global Constants
+BASE_TIME_NS = 1000000
+"""The base time of the tested engines, in nanoseconds."""
+
+
+# Functions
+def on_times(engine, output_chain, start, periods=1):
+    """Ticks the engine every base time and returns the number of base times
+    each output was on."""
+
+    slots = periods * ((1 << engine.bits) - 1)
+    times = [0] * 8
+    for slot in range(slots):
+        engine.tick(start + slot * BASE_TIME_NS)
+        for pin in range(8):
+            times[pin] += output_chain.get_output(pin)
+    return times
+
+
+def test_outputs_are_on_for_their_level(osr, output_chain):
+    engine = output_brightness.BrightnessEngine(osr, bits=3, base_time=BASE_TIME_NS / 1e9)
+    levels = [0, 1, 2, 3, 4, 5, 6, 7]
+    engine.set_levels(levels)
+    assert engine.period == pytest.approx(0.007)
+    assert on_times(engine, output_chain, 0, periods=2) == [2 * level for level in levels]
+    assert engine.plane_writes == 6 and engine.refreshes == 1
+
+
+def test_level_changes_wait_for_the_next_period(osr, output_chain):
+    engine = output_brightness.BrightnessEngine(osr, bits=2, base_time=BASE_TIME_NS / 1e9)
+    engine.set_level(0, 3)
+    engine.tick(0)
+    engine.set_level(0, 1)
+    engine.set_level(1, 2)
+    engine.tick(BASE_TIME_NS)
+    assert output_chain.outputs == bytearray([0b01])  # the first period keeps the old levels
+    assert on_times(engine, output_chain, 3 * BASE_TIME_NS)[:2] == [1, 2]
+    engine.stop()
+    assert output_chain.outputs == bytearray(1)
+
+
+def test_levels_must_fit_the_bits(osr):
+    engine = output_brightness.BrightnessEngine(osr, bits=2)
+    with pytest.raises(ValueError):
+        engine.set_level(0, 4)
+    with pytest.raises(ValueError):
+        engine.set_levels([1] * 7)
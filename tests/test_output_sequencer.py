@@ -0,0 +1,51 @@
+"""Tests of the output_sequencer module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import pytest
+import output_sequencer
+
+
+# Functions
+@pytest.mark.parametrize("durations", [0, 0.0, -0.1, [0.1, 0.0], [0.1, -0.1]])
+@pytest.mark.parametrize("mode", [output_sequencer.ONCE, output_sequencer.LOOP, output_sequencer.PING_PONG])
+def test_durations_must_be_positive(osr, durations, mode):
+    with pytest.raises(ValueError):
+        output_sequencer.FrameSequencer(osr, [b"\x01", b"\x02"], durations, mode)
+
+
+def test_tick_skips_overdue_frames(osr):
+    sequencer = output_sequencer.FrameSequencer(osr, [b"\x01", b"\x02", b"\x04"], 0.1, output_sequencer.LOOP)
+    sequencer.start(0.0)
+    assert sequencer.tick(0.35)
+    assert sequencer.index == 0
+    assert sequencer.frames_skipped == 2
+    assert osr.gpio == b"\x01"
+
+
+def test_ping_pong_counts_cycles_on_return_to_first_frame(osr):
+    sequencer = output_sequencer.FrameSequencer(osr, [b"\x01", b"\x02", b"\x04"], 0.1, output_sequencer.PING_PONG)
+    sequencer.start(0.0)
+    shown = [(osr.gpio[0], sequencer.cycles)]
+    for tick in range(1, 7):
+        assert sequencer.tick(tick / 10 + 0.001)
+        shown.append((osr.gpio[0], sequencer.cycles))
+    assert shown == [(1, 0), (2, 0), (4, 0), (2, 0), (1, 1), (2, 1), (4, 1)]
+
+
+def test_single_frame_ping_pong_keeps_playing(osr):
+    sequencer = output_sequencer.FrameSequencer(osr, [b"\x01"], 0.1, output_sequencer.PING_PONG)
+    sequencer.start(0.0)
+    for tick in range(1, 4):
+        assert sequencer.tick(tick / 10 + 0.001)
+    assert sequencer.running
+    assert sequencer.cycles == 3
+    assert osr.gpio == b"\x01"
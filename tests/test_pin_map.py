@@ -0,0 +1,56 @@
+"""Tests of the pin_map module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import pytest
+import pin_map
+
+
+# Global Constants
+PINS = pin_map.PinMap({"led_0": 0, "led_1": 1, "led_7": 7, "led_9": 9, "switch_16": 16, "switch_23": 23})
+"""Names of pins spread over three bytes."""
+
+
+# Functions
+def test_names_compile_to_byte_masks():
+    group = PINS.group("led_9", "led_0", "switch_23", "led_7")
+    assert group.pins == (9, 0, 23, 7)
+    assert list(group.byte_indexes) == [0, 1, 2]
+    assert group.masks == bytes([0b10000001, 0b00000010, 0b10000000])
+    assert PINS.pin("switch_16").masks == b"\x01" and list(PINS.pin("switch_16").byte_indexes) == [2]
+    assert PINS.select(lambda name: name.startswith("switch")).pins == (16, 23)
+
+
+def test_unknown_names_are_rejected():
+    with pytest.raises(ValueError, match="led_8"):
+        PINS.group("led_0", "led_8")
+
+
+def test_group_operations_only_touch_their_pins():
+    leds = PINS.group("led_0", "led_7", "led_9")
+    buffer = bytearray([0b00010000, 0b00000000, 0b11111111])
+    leds.set(buffer)
+    assert buffer == bytearray([0b10010001, 0b00000010, 0b11111111])
+    assert leds.all(buffer) and leds.any(buffer)
+    leds.toggle(buffer)
+    assert buffer == bytearray([0b00010000, 0b00000000, 0b11111111])
+    assert not leds.any(buffer)
+    PINS.pin("led_9").set(buffer)
+    assert leds.any(buffer) and not leds.all(buffer)
+    assert PINS.pin("led_9").value(buffer) and not PINS.pin("led_1").value(buffer)
+    PINS.group("switch_16", "switch_23").set(buffer, False)
+    assert buffer == bytearray([0b00010000, 0b00000010, 0b01111110])
+
+
+def test_group_writes_a_shift_register(osr, output_chain):
+    PINS.group("led_0", "led_7").set(osr.gpio)
+    osr.write()
+    assert output_chain.outputs == bytearray([0b10000001])
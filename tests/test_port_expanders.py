@@ -0,0 +1,154 @@
+"""Tests of the port_expanders module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import board
+import digitalio
+import bus_hooks
+import pytest
+import port_expanders
+
+
+# Global Constants
+IMAGE = port_expanders.register_image(iodir=0xFF00, gppu=0xFF00, interrupt_enable=0xFF00)
+"""Port A outputs and port B pulled up inputs interrupting on change."""
+
+
+# Functions
+@pytest.fixture
+def interrupting_mcp(mcp):
+    """Returns the CachedMCP23017 configured with IMAGE."""
+
+    mcp.configure(IMAGE)
+    mcp.clear_ints()
+    return mcp
+
+
+def test_queue_timestamps_events_at_detection(interrupting_mcp, expander_model):
+    intb = digitalio.DigitalInOut(board.D7)
+    poller = port_expanders.InterruptPoller([intb])
+    interrupt_queue = port_expanders.InterruptQueue(interrupting_mcp, intb)
+    assert not poller.poll(now=1000)
+    expander_model.set_input(9, False)
+    assert poller.poll(now=2000)
+    assert poller.poll(now=3000)  # still asserted, detected at the first poll
+    assert poller.detected == 2000
+    assert interrupt_queue.service(poller.detected) == 1
+    assert interrupt_queue.get(now=7000) == (9, False, 2000)
+    assert interrupt_queue.max_latency == 5000
+
+
+def test_configure_never_writes_read_only_registers(interrupting_mcp, expander_model, monkeypatch):
+    monkeypatch.setattr(port_expanders, "BURST_GAP_MAX", port_expanders.REGISTERS_NUM)
+    written = []
+    handle_write = expander_model.i2c_write
+
+    def i2c_write(data):
+        written.extend(range(data[0], data[0] + len(data) - 1))
+        handle_write(data)
+
+    expander_model.i2c_write = i2c_write
+    image = port_expanders.register_image(iodir=0xFF00, gppu=0xFFFF, interrupt_enable=0xFF00, olat=0x00FF)
+    assert interrupting_mcp.configure(image) == 2
+    assert port_expanders.GPPUA in written and port_expanders.OLATA in written
+    assert not set(written) & set(range(port_expanders.INTFA, port_expanders.OLATA))
+
+
+def test_poller_counts_a_held_interrupt_once(interrupting_mcp, expander_model):
+    poller = port_expanders.InterruptPoller([digitalio.DigitalInOut(board.D7)])
+    assert not poller.poll(now=1000)
+    expander_model.set_input(9, False)
+    for now in (3000, 4000, 5000):  # INTB stays low until the interrupt is cleared
+        assert poller.poll(now=now)
+    interrupting_mcp.clear_ints()
+    assert not poller.poll(now=6000)
+    expander_model.set_input(9, True)
+    assert poller.poll(now=7000)
+    assert (poller.polls, poller.detections) == (6, 2)
+    assert poller.max_latency == 2000
+    assert poller.average_latency == 1500
+
+
+def test_port_mirror_skips_unchanged_ports(interrupting_mcp, expander_model):
+    port_mirror = port_expanders.PortMirror(interrupting_mcp)
+    assert port_mirror.update()
+    assert expander_model.outputs == 0xFF  # the pulled up switches are off
+    assert not port_mirror.update()
+    expander_model.set_input(12, False)
+    assert port_mirror.update()
+    assert expander_model.outputs == 0b11101111
+    assert (port_mirror.updates, port_mirror.reads, port_mirror.writes) == (3, 3, 2)
+    assert port_mirror.transactions_saved == 1
+
+
+def test_port_mirror_reads_only_on_interrupt(interrupting_mcp, expander_model):
+    port_mirror = port_expanders.PortMirror(interrupting_mcp, int_pin=digitalio.DigitalInOut(board.D7))
+    assert port_mirror.update()  # the first update always reads
+    for _ in range(3):
+        assert not port_mirror.update()
+    expander_model.set_input(8, False)
+    assert port_mirror.update()  # reading port B also clears the interrupt
+    assert not port_mirror.update()
+    assert expander_model.outputs == 0b11111110
+    assert (port_mirror.updates, port_mirror.reads, port_mirror.writes) == (6, 2, 2)
+
+
+def test_expander_bus_orders_expanders_by_address(simulator):
+    for address in (0x24, 0x21, 0x27):
+        model = simulator.MCP23017Model(board.I2C(), address)
+        model.set_input(address & 0x07, True)      # GPAn and GPBn, n being the low address bits
+        model.set_input(8 + (address & 0x07), True)
+    recorder = AddressRecorder()
+    expanders = port_expanders.ExpanderBus(bus_hooks.BusHooks(recorder).wrap_i2c(board.I2C()))
+    assert expanders.addresses == (0x21, 0x24, 0x27)
+    assert expanders.pins_num == 48
+    recorder.addresses.clear()
+    assert expanders.scan() == bytearray([0x02, 0x02, 0x10, 0x10, 0x80, 0x80])
+    assert recorder.addresses == [0x21, 0x24, 0x27]
+    assert [pin for pin in range(48) if expanders.value(pin)] == [1, 9, 20, 28, 39, 47]
+    recorder.addresses.clear()
+    assert [expanders.scan_next() for _ in range(4)] == [0, 1, 2, 0]
+    assert recorder.addresses == [0x21, 0x24, 0x27, 0x21]
+    assert list(expanders.reads) == [3, 2, 2]
+
+
+def test_expander_bus_scans_interrupted_expanders(simulator):
+    models = [simulator.MCP23017Model(board.I2C(), address, intb=intb)
+              for address, intb in ((0x20, board.D7), (0x21, None), (0x22, board.D8))]
+    int_pins = [digitalio.DigitalInOut(board.D7), None, digitalio.DigitalInOut(board.D8)]
+    expanders = port_expanders.ExpanderBus(board.I2C(), int_pins=int_pins)
+    expanders.configure(IMAGE)
+    expanders.scan()  # clears any interrupts
+    assert expanders.scan_interrupted() == 1  # only the expander without an interrupt pin
+    models[2].set_input(11, False)
+    assert expanders.scan_interrupted() == 2
+    assert list(expanders.reads) == [1, 3, 2]
+    assert not expanders.value(32 + 11)
+
+
+# Classes
+class AddressRecorder:
+    """A bus_hooks hook that records the addresses of the I2C reads."""
+
+    enabled = True
+
+    def __init__(self):
+        self.addresses = []
+
+    def transaction(self, kind, address, written, read, start):
+        if kind == bus_hooks.I2C_WRITE_READ:
+            self.addresses.append(address)
+
+    def pin_added(self, pin_id, name):
+        pass
+
+    def pin_changed(self, pin_id, level, written):
+        pass
@@ -0,0 +1,65 @@
+"""Tests of the reflex module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import pytest
+import reflex
+import virtual_io
+
+
+# Functions
+@pytest.fixture
+def vio(isr, osr, mcp):
+    """Returns a virtual I/O space of the 74HC165 switches (pins 0 - 7), the
+    74HC595 LEDs (pins 8 - 15) and the MCP23017 with port A outputs (pins 16 -
+    23) and port B inputs (pins 24 - 31)."""
+
+    mcp.iodir = 0xFF00
+    vio = virtual_io.VirtualIO()
+    assert (vio.add_inputs(isr), vio.add_outputs(osr), vio.add_expander(mcp)) == (0, 8, 16)
+    return vio
+
+
+def test_rules_drive_outputs_across_devices(vio, input_chain, output_chain, expander_model):
+    rules = [
+        (0, 12, 4, True),     # switches 0 - 3 drive LEDs 4 - 7, inverted
+        (4, 16, 4, False),    # switches 4 - 7 drive GPA0 - GPA3
+        (24, 8, 2, False),    # GPB0 - GPB1 drive LEDs 0 - 1
+    ]
+    engine = reflex.ReflexEngine(vio, rules)
+    assert engine.update()  # the first update always computes the outputs
+    assert output_chain.outputs == bytearray([0b11110000])
+    assert expander_model.outputs == 0x00
+    for pin in (1, 2, 6):
+        input_chain.set_input(pin, True)
+    expander_model.set_input(9, True)  # GPB1
+    assert engine.update()
+    assert output_chain.outputs == bytearray([0b10010010])
+    assert expander_model.outputs == 0b00000100
+    writes = engine.writes
+    assert not engine.update()  # unchanged inputs
+    assert engine.writes == writes
+    assert (engine.updates, engine.reactions) == (3, 2)
+
+
+def test_unchanged_outputs_are_not_written(vio, input_chain, expander_model):
+    engine = reflex.ReflexEngine(vio, [(0, 8, 1, False)])
+    engine.update()
+    writes = engine.writes
+    input_chain.set_input(5, True)  # not used by any rule
+    assert engine.update()
+    assert engine.writes == writes
+
+
+@pytest.mark.parametrize("rule", [(8, 16, 1, False), (0, 24, 1, False), (0, 8, 2, False)])
+def test_invalid_rules_are_rejected(vio, rule):
+    with pytest.raises(ValueError):
+        reflex.ReflexEngine(vio, [rule, (1, 9, 1, False)])
@@ -0,0 +1,32 @@
+"""Tests of the scheduler module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import time
+import pytest
+from scheduler import Scheduler
+
+
+# Functions
+@pytest.mark.parametrize("late_periods, overruns", [(0.5, 0), (0.9, 0), (1.5, 1), (3.5, 3)])
+def test_late_runs_skip_only_whole_periods(late_periods, overruns):
+    period = 1_000_000_000
+    started = time.monotonic_ns() - int((1 + late_periods) * period)
+    tasks = Scheduler()
+    task = tasks.add(lambda: None, period / 1e9)
+    tasks.start(started)
+    next_deadline = tasks.run_pending(started)
+    assert task.runs == 1
+    assert task.overruns == overruns
+    assert next_deadline == started + (1 + overruns) * period
+    assert next_deadline <= time.monotonic_ns()  # the late deadline runs on the next call
+    tasks.run_pending()
+    assert task.runs == 2
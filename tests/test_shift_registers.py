@@ -0,0 +1,101 @@
+"""Tests of the shift_registers module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import board
+import digitalio
+import shift_registers
+
+
+# Functions
+def test_snapshot_shifts_the_chain_once(isr, input_chain):
+    input_chain.set_input(2, True)
+    assert isr.get_pin(2).value and isr.get_pin(2).value
+    assert (isr.shifts, input_chain.loads) == (2, 2)  # outside of a snapshot every read shifts
+    with isr.snapshot():
+        assert isr.get_pin(2).value
+        input_chain.set_input(2, False)
+        assert isr.get_pin(2).value  # served from the snapshot
+        assert not isr.get_pin(3).value
+    assert (isr.shifts, input_chain.loads) == (3, 3)
+    assert not isr.get_pin(2).value
+    assert (isr.shifts, input_chain.loads) == (4, 4)
+
+
+def test_snapshot_lifetime_expires(isr, input_chain, monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(shift_registers.time, "monotonic", lambda: clock[0])
+    with isr.snapshot(lifetime=0.01):
+        isr.get_pin(0).value
+        clock[0] += 0.004
+        isr.get_pin(0).value
+        assert isr.shifts == 1
+        clock[0] += 0.008
+        isr.get_pin(0).value
+        assert isr.shifts == 2
+    isr.snapshot_lifetime = 0.01  # reuse reads outside of snapshot blocks too
+    isr.get_pin(0).value
+    isr.get_pin(1).value
+    assert (isr.shifts, input_chain.loads) == (3, 3)
+
+
+def test_batch_shifts_and_latches_once(osr, output_chain):
+    latches = output_chain.latches  # the driver raises RCLK once when taking the pin
+    with osr.batch():
+        osr.get_pin(0).value = True
+        osr.get_pin(5).value = True
+        with osr.batch():
+            osr.get_pin(7).value = True
+        assert (osr.shifts, output_chain.latches - latches) == (0, 0)  # nested batches wait for the outermost one
+    assert (osr.shifts, output_chain.latches - latches) == (1, 1)
+    assert output_chain.outputs == bytearray([0b10100001])
+    with osr.batch():
+        osr.get_pin(5).value = False
+        osr.get_pin(5).value = True
+    assert (osr.shifts, output_chain.latches - latches) == (1, 1)  # unchanged outputs are not shifted again
+    osr.get_pin(0).value = False
+    assert (osr.shifts, output_chain.latches - latches) == (2, 2)  # outside of a batch every write shifts
+    assert output_chain.outputs == bytearray([0b10100000])
+
+
+def test_full_duplex_byte_order_and_latch_sequence(simulator):
+    input_chain = simulator.Chain74HC165(board.SPI(), board.D5, 2)
+    output_chain = simulator.Chain74HC595(board.SPI(), board.D6, 3)
+    full_duplex = shift_registers.FullDuplexShiftRegisters(board.SPI(), digitalio.DigitalInOut(board.D5),
+                                                           digitalio.DigitalInOut(board.D6), 2, 3)
+    latch_sequence = []
+    for pin in (board.D5, board.D6):
+        pin.listeners.append(lambda pin, level: latch_sequence.append((pin, level)))
+    input_chain.set_input(3, True)
+    input_chain.set_input(12, True)
+    for pin in (0, 9, 23):
+        full_duplex.set_value(pin, True)
+    transactions = board.SPI().stats.transactions
+
+    assert full_duplex.refresh() == bytes([0b00001000, 0b00010000])
+    assert board.SPI().stats.transactions == transactions + 1
+    assert [pin for pin in range(16) if full_duplex.value(pin)] == [3, 12]
+    assert [pin for pin in range(24) if output_chain.get_output(pin)] == [0, 9, 23]
+    assert output_chain.driver_outputs() == bytearray([0b00000001, 0b00000010, 0b10000000])
+    assert latch_sequence == [(board.D5, True), (board.D5, False), (board.D6, True), (board.D6, False)]
+    assert (input_chain.loads, output_chain.latches, full_duplex.refreshes) == (1, 1, 1)
+
+
+def test_full_duplex_pads_a_shorter_output_chain(simulator):
+    input_chain = simulator.Chain74HC165(board.SPI(), board.D5, 2)
+    output_chain = simulator.Chain74HC595(board.SPI(), board.D6, 1)
+    full_duplex = shift_registers.FullDuplexShiftRegisters(board.SPI(), digitalio.DigitalInOut(board.D5),
+                                                           digitalio.DigitalInOut(board.D6), 2, 1)
+    input_chain.set_input(15, True)
+    full_duplex.set_value(6, True)
+    full_duplex.refresh()
+    assert full_duplex.value(15) and full_duplex.output_value(6)
+    assert output_chain.outputs == bytearray([0b01000000])
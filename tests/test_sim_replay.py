@@ -0,0 +1,39 @@
+"""Tests of the simulator's sim_replay module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import io
+import board
+import bus_hooks
+import bus_trace
+import port_expanders
+import sim_replay
+
+
+# Functions
+def test_expander_replay_undoes_input_polarity(simulator, expander_model):
+    stream = io.BytesIO()
+    tracer = bus_trace.TraceRecorder(stream)
+    hooks = bus_hooks.BusHooks(tracer)
+    mcp = port_expanders.CachedMCP23017(hooks.wrap_i2c(board.I2C()), 0x20)
+    mcp.configure(port_expanders.register_image(iodir=0xFF00, gppu=0xFF00, ipol=0xFF00))
+    expander_model.set_input(8, False)  # switch on, pulling GPB0 low
+    assert mcp.gpiob == 0b00000001
+    expander_model.set_input(8, True)   # switch off
+    assert mcp.gpiob == 0b00000000
+    tracer.flush()
+
+    simulator.reset()
+    replayed = simulator.MCP23017Model(board.I2C(), 0x20)
+    replay = sim_replay.TraceReplay(io.BytesIO(stream.getvalue()), expander=replayed)
+    assert [event[1:] for event in replay.events] == [(1, 0b11111111)]
+    replay.run(lambda: None)
+    assert (replayed.levels >> 8) & 0xFF == 0b11111111
@@ -0,0 +1,53 @@
+"""Tests of the virtual_io module.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+"""
+
+
+# Imports
+import pytest
+import virtual_io
+
+
+# Functions
+@pytest.fixture
+def vio(mcp):
+    """Returns a virtual I/O space of the MCP23017 with port A outputs and
+    port B inputs."""
+
+    mcp.iodir = 0xFF00
+    vio = virtual_io.VirtualIO()
+    vio.add_expander(mcp)
+    return vio
+
+
+def test_unchanged_values_are_not_written(vio):
+    vio.write([0, 1], [True, False])
+    transfers = vio.transfers
+    vio.write([0, 1], [True, False])
+    assert vio.transfers == transfers
+
+
+def test_expander_input_pins_are_not_outputs(vio):
+    transfers = vio.transfers
+    with pytest.raises(ValueError):
+        vio.set_value(8, True)
+    assert not vio.value(8) and vio.transfers == transfers + 1  # read, not written
+
+
+def test_direct_device_writes_are_kept(mcp, osr):
+    mcp.iodir = 0xFF00
+    vio = virtual_io.VirtualIO()
+    expander = vio.add_expander(mcp)
+    leds = vio.add_outputs(osr)
+    osr.gpio = bytearray([0b10000000])
+    mcp.gpio = 0x0080
+    assert vio.value(leds + 7) and vio.value(expander + 7)
+    vio.write([leds, expander], [True, True])
+    assert osr.gpio == bytearray([0b10000001])
+    assert mcp.olat == 0x0081
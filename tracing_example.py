@@ -0,0 +1,137 @@
+"""Records a bus trace of MCP23017 switches copied to LEDs.
+
+Description
+-----------
+
+A CircuitPython program that copies the switches of an MCP23017 I/O expander
+IC to its LEDs whenever INTB signals a change, the same as
+read_and_write_port_on_input_change() of port_expander.py, while recording
+every I2C transaction and INTB transition into a bus trace file.  The trace
+captures the switch changes seen in the field, e.g. switch chatter, which the
+simulator's sim_replay module replays against the examples of port_expander.py
+on a host computer.
+
+Circuit
+-------
+
+- The same circuit as port_expander.py.
+- An MCP23017 I/O expander IC is connected to the board's I2C serial bus and D5
+  pins.
+    - The I2C SCL pin is connected to the MCP23017 SCK (12) pin.
+    - The I2C SDA pin is connected to the MCP23017 SDA (13) pin.
+    - The D5 pin is connected to the MCP23017 INTB (19) pin.
+    - 8 LEDs are connected, via resistors, to the MCP23017 GPA0-GPA7 (21-28)
+      pins.
+    - 8 switches, with pull-down resistors, are connected to the MCP23017
+      GPB0-GPB7 (1-8) pins.
+
+Libraries/Modules
+-----------------
+
+- board CircuitPython Core Module
+    - https://circuitpython.readthedocs.io/en/latest/shared-bindings/board/
+    - Access to board's GPIO pins and hardware.
+- digitalio CircuitPython Core Module
+    - https://circuitpython.readthedocs.io/en/latest/shared-bindings/digitalio/
+    - Provides basic digital pin I/O support.
+- Adafruit_CircuitPython_MCP230xx CircuitPython Driver Library
+    - https://circuitpython.readthedocs.io/projects/mcp230xx/
+    - Provides support for MCP23017 I/O expander IC.
+- bus_hooks Module (this repository)
+    - Provides the wrapping of the I2C bus and INTB pin.
+- bus_trace Module (this repository)
+    - Provides recording of the bus transactions and pin transitions.
+- port_expanders Module (this repository)
+    - Provides a register shadow and register image configuration for the
+      MCP23017 I/O expander IC.
+
+Notes
+-----
+
+- The bus trace is written to TRACE_FILE, which requires the board's
+  filesystem to be writable by the program (see storage.remount() in boot.py).
+- Only the bus transactions and INTB transitions made through the traced bus
+  and pin are recorded, so the MCP23017 is created on the traced I2C bus.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import board
+from digitalio import DigitalInOut, Direction, Pull
+import bus_hooks
+import bus_trace
+import port_expanders
+
+
+# Global Constants
+MCP23017_I2C_ADDRESS = 0x20
+"""The I2C address of the MCP23017 IC."""
+
+TRACE_FILE = "/port_expander_trace.bin"
+"""The file the bus trace is written to."""
+
+
+# Global Instances
+tracer = bus_trace.TraceRecorder(open(TRACE_FILE, "wb"))
+"""The recorder of the I2C transactions and INTB transitions."""
+
+hooks = bus_hooks.BusHooks(tracer)
+"""The wrapper of the I2C bus and INTB pin, passing their activity to the
+tracer."""
+
+mcp23017_intb = hooks.wrap_pin(DigitalInOut(board.D5), "mcp23017_intb")
+"""The pin connected to the MCP23017 INTB (19) pin, with its transitions
+recorded."""
+
+mcp23017 = port_expanders.CachedMCP23017(hooks.wrap_i2c(board.I2C()), address=MCP23017_I2C_ADDRESS)
+"""The instance of the connected MCP23017 IC, with its transactions
+recorded."""
+
+
+# Functions
+def configure():
+    """Configures the LEDs, the switches and the port B interrupts."""
+
+    mcp23017_intb.direction = Direction.INPUT
+    mcp23017_intb.pull = Pull.UP
+    mcp23017.configure(port_expanders.register_image(
+        iodir=0xFF00,             # port A pins (LEDs) as outputs and port B pins (switches) as inputs
+        gppu=0xFF00,              # pull-ups on port B pins (switches) only
+        ipol=0xFF00,              # inverted polarity on port B pins (switches) only
+        interrupt_enable=0xFF00,  # interrupts on port B pins (switches) only
+        olat=0x0000))             # all LEDs off
+    mcp23017.clear_ints()  # clear all interrupts
+
+
+def copy_switches_on_change():
+    """Copies port B (switches) to port A (LEDs) when INTB is asserted."""
+
+    if not mcp23017_intb.value:  # active low
+        mcp23017.gpioa = mcp23017.gpiob
+        mcp23017.clear_ints()  # clear all interrupts
+
+
+def main():
+    """Main program entry."""
+
+    configure()
+    try:
+        while True:
+            copy_switches_on_change()
+    finally:
+        tracer.flush()  # keep the last records, e.g. on a keyboard interrupt
+
+
+if __name__ == "__main__":  # required for generating Sphinx documentation
+    main()
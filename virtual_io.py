@@ -0,0 +1,349 @@
+"""A unified virtual digital I/O space across shift registers and port expanders.
+
+Description
+-----------
+
+A CircuitPython module that maps the pins of 74HC165 input chains, 74HC595
+output chains, and MCP23017 I/O expanders to consecutive global pin numbers
+of a single virtual I/O space.  Bulk reads and writes of any set of pins, in
+any order, are grouped per device, so each device is read and written with
+exactly one bus transfer per operation instead of one per pin.
+
+Libraries/Modules
+-----------------
+
+- array Standard Library
+    - https://docs.python.org/3/library/array.html
+    - Provides the global pin lookup tables.
+
+Notes
+-----
+
+- Input chains must be shift_registers.InputShiftRegister instances, output
+  chains shift_registers.OutputShiftRegister instances, and expanders
+  port_expanders.CachedMCP23017 instances, whose register shadow provides the
+  pin directions and output latches without bus transfers.
+- The global pin numbers of a device start at the number returned when it is
+  added and follow the device's own pin numbering.
+- Outputs may also be written directly to the devices.  The output values are
+  taken from the driver's buffer (or the expander's register shadow) before
+  each write outside of a batch and before the first write of a device within
+  a batch, so direct writes made within a batch after that are overwritten.
+- Comments are Sphinx (reStructuredText) compatible.
+
+Author(s)
+---------
+
+- Created by agent on 10/18/2026.
+
+Copyright (c) 2026 Woolsey Workshop.  All rights reserved.
+
+Members
+-------
+"""
+
+
+# Imports
+import array
+
+
+# Classes
+class _InputChain:
+    # A 74HC165 chain, read into its buffer with one transfer
+    inputs = True
+    outputs = False
+
+    def __init__(self, isr):
+        self.device = isr
+        self.buffer = bytearray(isr.number_of_shift_registers)
+
+    def read(self):
+        self.device.readinto(self.buffer)
+
+    def load(self):
+        pass
+
+
+class _OutputChain:
+    # A 74HC595 chain, written from its buffer with one transfer
+    inputs = False
+    outputs = True
+
+    def __init__(self, osr):
+        self.device = osr
+        self.buffer = bytearray(osr.number_of_shift_registers)
+        self.load()
+
+    def read(self):
+        pass
+
+    def load(self):
+        self.buffer[:] = self.device.gpio  # current outputs, no transfer needed
+
+    def write(self):
+        self.device.write(self.buffer)
+
+
+class _Expander:
+    # An MCP23017, whose input pins are read from GPIO and output pins written to OLAT with one transfer each
+    inputs = True
+    outputs = True
+
+    def __init__(self, mcp):
+        self.device = mcp
+        self.buffer = bytearray(2)
+        olat = mcp.olat
+        self.buffer[0] = olat & 0xFF
+        self.buffer[1] = olat >> 8
+
+    def read(self):
+        gpio = self.device.gpio
+        iodir = self.device.iodir  # served from the register shadow
+        value = (gpio & iodir) | ((self.buffer[0] | (self.buffer[1] << 8)) & ~iodir)  # keep the output values
+        self.buffer[0] = value & 0xFF
+        self.buffer[1] = value >> 8
+
+    def load(self):
+        iodir = self.device.iodir  # served from the register shadow
+        value = ((self.buffer[0] | (self.buffer[1] << 8)) & iodir) | (self.device.olat & ~iodir)  # keep the inputs
+        self.buffer[0] = value & 0xFF
+        self.buffer[1] = value >> 8
+
+    def write(self):
+        self.device.gpio = self.buffer[0] | (self.buffer[1] << 8)  # written to OLAT
+
+    def input_bits(self, byte):
+        return (self.device.iodir >> (8 * byte)) & 0xFF  # served from the register shadow
+
+
+class VirtualPin:
+    """A pin of a virtual I/O space, used like a DigitalInOut.
+
+    :param: vio The VirtualIO instance.
+    :param: pin The global pin number.
+    """
+
+    def __init__(self, vio, pin):
+        self._vio = vio
+        self._pin = pin
+
+    @property
+    def value(self):
+        """The value of the pin (True or False)."""
+
+        return self._vio.value(self._pin)
+
+    @value.setter
+    def value(self, val):
+        self._vio.set_value(self._pin, val)
+
+
+class VirtualIO:
+    """A virtual digital I/O space of shift register chains and port expanders.
+
+    Outside of a batch, every pin read reads its device and every pin write
+    writes its device, the same as the drivers.  Within a batch, each input
+    device is read at most once, on the first read of one of its pins, and
+    each output device with changed pins is written once when the batch ends.
+    read() and write() do the same for a sequence of pins.
+
+    Example::
+
+        vio = VirtualIO()
+        switches = vio.add_inputs(isr)       # global pins 0 - 7
+        leds = vio.add_outputs(osr)          # global pins 8 - 15
+        expander = vio.add_expander(mcp)     # global pins 16 - 31
+
+        values = vio.read([switches + 3, expander + 8, switches])  # 2 transfers
+        vio.write([leds, expander], values[:2])                      # 2 transfers
+    """
+
+    def __init__(self):
+        self.devices = []
+        self.transfers = 0                      # number of device reads and writes
+        self._device_index = array.array("B")   # device of each global pin
+        self._byte_index = array.array("H")     # byte of each global pin in its device buffer
+        self._bit_mask = bytearray()            # bit mask of each global pin within its byte
+        self._loaded = bytearray()              # whether each device was read within the current batch
+        self._dirty = bytearray()               # whether each device has unwritten output changes
+        self._batch_depth = 0                   # number of nested batch blocks
+
+    def _add(self, device):
+        # Add a device and its pins to the lookup tables
+        first = len(self._bit_mask)
+        index = len(self.devices)
+        self.devices.append(device)
+        self._loaded.append(0)
+        self._dirty.append(0)
+        for pin in range(8 * len(device.buffer)):
+            self._device_index.append(index)
+            self._byte_index.append(pin >> 3)
+            self._bit_mask.append(1 << (pin & 7))
+        return first
+
+    def add_inputs(self, isr):
+        """Adds the inputs of a 74HC165 chain.
+
+        :param: isr The shift_registers.InputShiftRegister instance.
+
+        :return: The global pin number of the chain's pin 0.
+        """
+
+        return self._add(_InputChain(isr))
+
+    def add_outputs(self, osr):
+        """Adds the outputs of a 74HC595 chain.
+
+        :param: osr The shift_registers.OutputShiftRegister instance.
+
+        :return: The global pin number of the chain's pin 0.
+        """
+
+        return self._add(_OutputChain(osr))
+
+    def add_expander(self, mcp):
+        """Adds the 16 pins of an MCP23017, GPA0 - GPA7 followed by GPB0 - GPB7,
+        configured as inputs or outputs on the device.
+
+        :param: mcp The port_expanders.CachedMCP23017 instance.
+
+        :return: The global pin number of the expander's GPA0 pin.
+        """
+
+        return self._add(_Expander(mcp))
+
+    def locate(self, pin):
+        """Returns where a pin is in the device buffers.
+
+        :param: pin The global pin number.
+
+        :return: A tuple of the index of the pin's device in devices, the index
+                 of the pin's byte in the device's buffer, and the pin's bit
+                 mask within that byte.
+        """
+
+        return self._device_index[pin], self._byte_index[pin], self._bit_mask[pin]
+
+    @property
+    def pins_num(self):
+        """The number of pins of the virtual I/O space."""
+
+        return len(self._bit_mask)
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            for index, device in enumerate(self.devices):
+                self._loaded[index] = 0  # the first read within the next block reads the device again
+                if self._dirty[index]:
+                    self._dirty[index] = 0
+                    device.write()
+                    self.transfers += 1
+        return False
+
+    def batch(self):
+        """Starts a batch block, to be used with the with statement.
+
+        :return: The virtual I/O space itself as the context manager.
+        """
+
+        return self
+
+    def refresh(self):
+        """Reads all input devices not yet read within the current batch, one
+        transfer each, for the value() calls of the batch."""
+
+        with self:
+            for index, device in enumerate(self.devices):
+                if device.inputs and not self._loaded[index]:
+                    device.read()
+                    self._loaded[index] = 1
+                    self.transfers += 1
+
+    def value(self, pin):
+        """Returns the value of a pin.
+
+        :param: pin The global pin number.
+
+        :return: The pin value (True or False).
+        """
+
+        index = self._device_index[pin]
+        device = self.devices[index]
+        if device.outputs and not self._dirty[index]:
+            device.load()  # pick up outputs written directly to the device
+        if device.inputs and not self._loaded[index]:
+            device.read()
+            self.transfers += 1
+            if self._batch_depth:
+                self._loaded[index] = 1
+        return bool(device.buffer[self._byte_index[pin]] & self._bit_mask[pin])
+
+    def set_value(self, pin, val):
+        """Sets the value of an output pin.  Within a batch, setting a pin to
+        its current value does not mark its device for writing.
+
+        :param: pin The global pin number.
+        :param: val The new value of the pin (True or False).
+        """
+
+        index = self._device_index[pin]
+        device = self.devices[index]
+        byte = self._byte_index[pin]
+        mask = self._bit_mask[pin]
+        if not device.outputs or device.inputs and device.input_bits(byte) & mask:
+            raise ValueError(f"Pin {pin} is not an output.")
+        if not self._dirty[index]:
+            device.load()  # pick up outputs written directly to the device
+        current = device.buffer[byte]
+        value = current | mask if val else current & ~mask
+        device.buffer[byte] = value
+        if self._batch_depth:
+            if value != current:
+                self._dirty[index] = 1
+        else:
+            device.write()
+            self.transfers += 1
+
+    def read(self, pins, values=None):
+        """Reads any number of pins with one transfer per input device.
+
+        :param: pins   The global pin numbers, in any order.
+        :param: values A preallocated list (or bytearray) as long as pins to
+                       receive the values, or None to allocate a new list.
+
+        :return: The values of the pins (True or False), in the order of pins.
+        """
+
+        if values is None:
+            values = [False] * len(pins)
+        with self:
+            for position, pin in enumerate(pins):
+                values[position] = self.value(pin)
+        return values
+
+    def write(self, pins, values):
+        """Writes any number of output pins with one transfer per output device.
+
+        :param: pins   The global pin numbers, in any order.
+        :param: values The new values of the pins (True or False), in the order
+                       of pins.
+        """
+
+        with self:
+            for position, pin in enumerate(pins):
+                self.set_value(pin, values[position])
+
+    def get_pin(self, pin):
+        """Returns a pin of the virtual I/O space.
+
+        :param: pin The global pin number.
+
+        :return: The VirtualPin instance.
+        """
+
+        return VirtualPin(self, pin)